@@ -1,5 +1,6 @@
 # src/collectors/base_collector.py
 from abc import abstractmethod
+import numpy as np
 import pandas as pd
 import logging
 from datetime import datetime
@@ -157,6 +158,34 @@ class BaseCollector(AbstractCollector):
             
         return True
     
+    def _add_metadata(self, df: pd.DataFrame, indicator: str, metadata: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Adiciona as colunas de metadados do indicador ao DataFrame coletado.
+        
+        As colunas constantes são categóricas (um código int8 por linha) em vez
+        de uma string Python repetida em cada linha.
+        
+        Args:
+            df: DataFrame coletado
+            indicator: Nome do indicador
+            metadata: Configuração do indicador (name, unit, frequency)
+            
+        Returns:
+            DataFrame com os metadados
+        """
+        codes = np.zeros(len(df), dtype=np.int8)
+        constants = {
+            'indicator': indicator,
+            'indicator_name': metadata['name'],
+            'unit': metadata['unit'],
+            'frequency': metadata['frequency'],
+            'source': self.get_source_name()
+        }
+        for column, value in constants.items():
+            df[column] = pd.Categorical.from_codes(codes, categories=[value])
+        df['collected_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return df
+    
     @abstractmethod
     def get_source_name(self) -> str:
         """
@@ -150,14 +150,7 @@ class BCBCollector(BaseCollector):
         """
         indicators = self.get_available_indicators()
         if indicator in indicators:
-            metadata = indicators[indicator]
-            
             # Adiciona metadados
-            df['indicator'] = indicator
-            df['indicator_name'] = metadata['name']
-            df['unit'] = metadata['unit']
-            df['frequency'] = metadata['frequency']
-            df['source'] = self.get_source_name()
-            df['collected_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            df = self._add_metadata(df, indicator, indicators[indicator])
             
         return df
\ No newline at end of file
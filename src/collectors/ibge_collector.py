@@ -10,9 +10,66 @@ import zipfile
 import re
 from io import BytesIO
 import logging
+import pyarrow as pa
 
 from .base_collector import BaseCollector
 
+def _parse_sidra_payload(payload: bytes, frequency: str) -> Optional[pa.Table]:
+    """
+    Converte a resposta JSON da API SIDRA em uma tabela Arrow.
+    
+    Args:
+        payload: Corpo da resposta da API
+        frequency: Frequência do indicador (monthly, quarterly, annual)
+        
+    Returns:
+        Optional[pa.Table]: Tabela com data, valor e localidade, ou None se a
+            resposta não tiver resultados
+    """
+    data = json.loads(payload)
+    
+    if not data or len(data) == 0 or 'resultados' not in data[0]:
+        return None
+        
+    # Extrai os resultados
+    results = data[0]['resultados'][0]['series']
+    
+    # Converte para linhas
+    rows = []
+    for series in results:
+        # Nome da série/localidade
+        loc_name = series['localidade']['nome'] if 'localidade' in series else 'Brasil'
+        
+        for item in series['serie']:
+            # Período e valor
+            period = item['periodo']
+            value = float(item['valor'].replace(',', '.')) if isinstance(item['valor'], str) else item['valor']
+            
+            # Converte o período para data
+            if frequency == 'monthly':
+                # Formato YYYYMM
+                year = int(period[:4])
+                month = int(period[4:6])
+                date = datetime(year, month, 1)
+            elif frequency == 'quarterly':
+                # Formato YYYYQN
+                year = int(period[:4])
+                quarter = int(period[5])
+                month = (quarter - 1) * 3 + 1
+                date = datetime(year, month, 1)
+            else:
+                # Anual - YYYY
+                date = datetime(int(period), 1, 1)
+            
+            rows.append({
+                'data': date,
+                'valor': value,
+                'localidade': loc_name
+            })
+    
+    return pa.Table.from_pylist(rows)
+
+
 class IBGECollector(BaseCollector):
     """
     Coletor de dados do IBGE (Instituto Brasileiro de Geografia e Estatística).
@@ -598,60 +655,18 @@ class IBGECollector(BaseCollector):
             response.raise_for_status()
             
             # Processa a resposta
-            data = response.json()
+            table = _parse_sidra_payload(response.content, config['frequency'])
             
-            if not data or len(data) == 0 or 'resultados' not in data[0]:
+            if table is None:
                 self._log_error(f"Dados não encontrados para {indicator}")
                 return None
                 
-            # Extrai os resultados
-            results = data[0]['resultados'][0]['series']
-            
-            # Converte para DataFrame
-            rows = []
-            for series in results:
-                # Extrai os valores da série
-                series_data = []
-                
-                # Nome da série/localidade
-                loc_name = series['localidade']['nome'] if 'localidade' in series else 'Brasil'
-                
-                for item in series['serie']:
-                    # Período e valor
-                    period = item['periodo']
-                    value = float(item['valor'].replace(',', '.')) if isinstance(item['valor'], str) else item['valor']
-                    
-                    # Converte o período para data
-                    if config['frequency'] == 'monthly':
-                        # Formato YYYYMM
-                        year = int(period[:4])
-                        month = int(period[4:6])
-                        date = datetime(year, month, 1)
-                    elif config['frequency'] == 'quarterly':
-                        # Formato YYYYQN
-                        year = int(period[:4])
-                        quarter = int(period[5])
-                        month = (quarter - 1) * 3 + 1
-                        date = datetime(year, month, 1)
-                    else:
-                        # Anual - YYYY
-                        date = datetime(int(period), 1, 1)
-                    
-                    # Adiciona à lista
-                    series_data.append({
-                        'data': date,
-                        'valor': value,
-                        'localidade': loc_name
-                    })
-                
-                rows.extend(series_data)
-            
             # Cria DataFrame final
-            if not rows:
+            if table.num_rows == 0:
                 self._log_error(f"Nenhum dado encontrado para {indicator}")
                 return None
                 
-            df = pd.DataFrame(rows)
+            df = table.to_pandas(coerce_temporal_nanoseconds=True)
             
             # Renomeia a coluna 'valor' para o nome do indicador
             df = df.rename(columns={'valor': indicator})
@@ -797,14 +812,7 @@ class IBGECollector(BaseCollector):
         """
         indicators = self.get_available_indicators()
         if indicator in indicators:
-            metadata = indicators[indicator]
-            
             # Adiciona metadados
-            df['indicator'] = indicator
-            df['indicator_name'] = metadata['name']
-            df['unit'] = metadata['unit']
-            df['frequency'] = metadata['frequency']
-            df['source'] = self.get_source_name()
-            df['collected_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            df = self._add_metadata(df, indicator, indicators[indicator])
             
         return df
\ No newline at end of file
@@ -128,7 +128,7 @@ class BronzeToSilverTransformer:
                 return None
                 
             # Lê os arquivos mais recentes apenas (para este exemplo, o último)
-            latest_file = sorted(files)[-1]
+            latest_file = max(files)
             
             # Lê o arquivo parquet
             df = self.spark.read.parquet(latest_file)
@@ -18,7 +18,7 @@ from ..utils.helpers import (
     standardize_date_column, create_date_features,
     
     # Math Utils
-    calculate_variations, calculate_moving_average, calculate_year_to_date,
+    aggregate_monthly, calculate_variations, calculate_moving_average, calculate_year_to_date,
     calculate_volatility, calculate_financial_metrics,
     
     # Logging Utils
@@ -68,18 +68,21 @@ class EconomicIndicatorTransformer:
         # Criação de features de data
         df = create_date_features(df)
         
+        # Os cálculos abaixo só acrescentam colunas ao DataFrame, que já é uma
+        # cópia da entrada: dispensam a cópia defensiva de cada etapa
+        
         # Cálculo de variações
         variations = {
             'pct_change': {'periods': 1, 'column': 'monthly_change_pct', 'multiply': 100},
             'year_over_year': {'periods': 12, 'column': 'year_over_year_pct', 'multiply': 100}
         }
-        df = calculate_variations(df, variations=variations)
+        df = calculate_variations(df, variations=variations, copy=False)
         
         # Cálculo de YTD
-        df = calculate_year_to_date(df)
+        df = calculate_year_to_date(df, copy=False)
         
         # Média móvel
-        df = calculate_moving_average(df, window=3, result_col='moving_avg_3m')
+        df = calculate_moving_average(df, window=3, result_col='moving_avg_3m', copy=False)
         
         # Adiciona metadados
         df['indicator'] = 'ipca'
@@ -115,20 +118,8 @@ class EconomicIndicatorTransformer:
         df = standardize_date_column(df)
         df = ensure_numeric(df, ['value'])
         
-        # Criação de features de data para agregação mensal
-        df = create_date_features(df)
-        
-        # Agrega mensalmente
-        monthly_data = []
-        for ym, group in df.groupby('year_month'):
-            monthly_data.append({
-                'date': group['date'].max(),
-                'value': group['value'].mean(),
-                'year': group['year'].iloc[0],
-                'month': group['month'].iloc[0]
-            })
-        
-        monthly_df = pd.DataFrame(monthly_data)
+        # Agrega mensalmente (média do mês, datada pelo último dia observado)
+        monthly_df = aggregate_monthly(df)
         
         # Calcula variação em pontos base
         monthly_df = calculate_variations(
@@ -227,7 +218,7 @@ class EconomicIndicatorTransformer:
         
         # Cálculos financeiros para OHLC e outros
         monthly_data = []
-        for ym, group in df.groupby('year_month'):
+        for ym, group in df.groupby('year_month', observed=True):
             monthly_data.append({
                 'date': group['date'].max(),
                 'open': group['value'].iloc[0],
@@ -334,7 +325,7 @@ class EconomicIndicatorTransformer:
                 return False
             
             # Pega o arquivo mais recente
-            latest_file = sorted(bronze_files)[-1]
+            latest_file = max(bronze_files)
             logger.info(f"Processando arquivo: {latest_file}")
             
             # Carrega dados da camada bronze
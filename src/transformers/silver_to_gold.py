@@ -5,6 +5,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Tuple
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 from ..utils.aws_utils import S3Handler
@@ -22,6 +23,64 @@ load_dotenv()
 # Configuração de logging
 logger = get_logger("silver_to_gold")
 
+# Colunas do painel macroeconômico
+MACRO_DASHBOARD_COLUMNS = [
+    'indicator', 'indicator_name', 'last_value', 'last_date',
+    'unit', 'annual_change', 'trend', 'updated_at'
+]
+
+# Colunas da camada silver usadas pelos painéis gold; as demais (ex:
+# year_month, processed_at) não são baixadas
+SILVER_INPUT_COLUMNS = [
+    'date', 'value', 'indicator_name', 'unit',
+    'monthly_change_pct', 'year_over_year_pct', 'moving_avg_3m',
+    'return_pct', 'volatility', 'volatility_20',
+    'quarterly_change_pct', 'annual_change_pct',
+    'quarterly_change_pp', 'annual_change_pp'
+]
+
+# Pesos de cada indicador no índice de saúde econômica (renormalizados
+# entre os indicadores disponíveis)
+ECONOMIC_HEALTH_WEIGHTS = {'ipca': 0.35, 'selic': 0.3, 'desemprego': 0.35}
+
+# Chave de mês das datas ausentes (NaT): maior que qualquer mês, para que
+# essas linhas fiquem no fim do painel ordenado
+_NAT_MONTH_KEY = np.iinfo(np.int64).max
+
+def _year_month_key(dates: pd.Series) -> np.ndarray:
+    """
+    Converte datas em chaves inteiras de mês (meses desde 1970).
+    
+    Joins sobre inteiros evitam formatar e comparar strings 'YYYY-MM'.
+    
+    Args:
+        dates: Série datetime64
+        
+    Returns:
+        Array int64 com a chave de cada data (NaT vira _NAT_MONTH_KEY)
+    """
+    values = dates.to_numpy(dtype='datetime64[ns]')
+    keys = values.astype('datetime64[M]').astype(np.int64)
+    keys[np.isnat(values)] = _NAT_MONTH_KEY
+    return keys
+
+def _year_month_labels(keys: np.ndarray) -> np.ndarray:
+    """
+    Formata chaves de mês como 'YYYY-MM', uma única vez por mês distinto.
+    
+    Args:
+        keys: Array int64 de chaves geradas por _year_month_key
+        
+    Returns:
+        Array de strings (NaN para datas ausentes)
+    """
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    labels = np.array([
+        np.nan if key == _NAT_MONTH_KEY else f"{key // 12 + 1970:04d}-{key % 12 + 1:02d}"
+        for key in unique_keys
+    ], dtype=object)
+    return labels[inverse]
+
 class EconomicIndicatorsGoldTransformer:
     """
     Classe responsável por transformar dados da camada silver para gold,
@@ -47,55 +106,72 @@ class EconomicIndicatorsGoldTransformer:
         if date_col not in df.columns:
             return df
             
-        # Converte para datetime se for string com formato de data
+        # Converte para datetime se for string com formato de data. Colunas já
+        # datetime64 não chegam aqui; valores mistos (str, Timestamp, ISO) são
+        # convertidos em uma única chamada vetorizada, com cache por valor
         if pd.api.types.is_object_dtype(df[date_col]):
             try:
-                df[date_col] = pd.to_datetime(df[date_col])
-            except:
+                df[date_col] = pd.to_datetime(df[date_col], format='mixed', cache=True)
+            except (TypeError, ValueError):
                 # Se não conseguir converter, transforma em string
                 df[date_col] = df[date_col].astype(str)
                 
         return df
         
+    def _load_latest_indicator(self, indicator: str) -> Optional[pd.DataFrame]:
+        """
+        Carrega o arquivo mais recente de um indicador na camada silver.
+        
+        Args:
+            indicator: Nome do indicador
+            
+        Returns:
+            DataFrame do indicador ou None se não encontrado/vazio
+        """
+        # Lista arquivos na camada silver para este indicador
+        prefix = f"silver/economic_indicators/{indicator}"
+        silver_files = self.s3_handler.list_files(prefix=prefix)
+        
+        if not silver_files:
+            logger.warning(f"Nenhum arquivo encontrado para {indicator} na camada silver")
+            return None
+            
+        # Pega o arquivo mais recente
+        latest_file = max(silver_files)
+        logger.info(f"Carregando {indicator} da camada silver: {latest_file}")
+        
+        # Carrega o DataFrame (apenas as colunas usadas pelos painéis)
+        df = self.s3_handler.download_file(latest_file, columns=SILVER_INPUT_COLUMNS)
+        
+        if df is None or df.empty:
+            logger.error(f"Erro ao carregar dados de {indicator}")
+            return None
+            
+        logger.info(f"Indicador {indicator} carregado com sucesso. Shape: {df.shape}")
+        return df
+    
     @log_execution_time(logger=logger, operation_name="Carregamento dos Indicadores Silver")
-    def load_latest_indicators(self) -> Dict[str, pd.DataFrame]:
+    def load_latest_indicators(self, concurrency: int = 10) -> Dict[str, pd.DataFrame]:
         """
         Carrega os indicadores mais recentes da camada silver.
         
+        Cada indicador (listagem + download) é independente e limitado pela
+        latência do S3, então os indicadores são carregados em paralelo.
+        
+        Args:
+            concurrency: Número máximo de indicadores carregados simultaneamente
+        
         Returns:
             Dict[str, pd.DataFrame]: Dicionário com DataFrames para cada indicador
         """
-        indicators = {
-            'ipca': None,
-            'selic': None,
-            'pib': None,
-            'cambio': None,
-            'desemprego': None
-        }
+        names = ['ipca', 'selic', 'pib', 'cambio', 'desemprego']
         
-        for indicator in indicators.keys():
-            # Lista arquivos na camada silver para este indicador
-            prefix = f"silver/economic_indicators/{indicator}"
-            silver_files = self.s3_handler.list_files(prefix=prefix)
-            
-            if not silver_files:
-                logger.warning(f"Nenhum arquivo encontrado para {indicator} na camada silver")
-                continue
-                
-            # Pega o arquivo mais recente
-            latest_file = sorted(silver_files)[-1]
-            logger.info(f"Carregando {indicator} da camada silver: {latest_file}")
-            
-            # Carrega o DataFrame
-            df = self.s3_handler.download_file(latest_file)
-            
-            if df is None or df.empty:
-                logger.error(f"Erro ao carregar dados de {indicator}")
-                continue
-                
-            # Armazena o DataFrame no dicionário
-            indicators[indicator] = df
-            logger.info(f"Indicador {indicator} carregado com sucesso. Shape: {df.shape}")
+        # Uma única listagem do diretório silver abastece o cache do S3Handler;
+        # as listagens por indicador abaixo são filtradas dela, sem novos GETs
+        self.s3_handler.list_files(prefix="silver/economic_indicators/")
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(names)))) as executor:
+            indicators = dict(zip(names, executor.map(self._load_latest_indicator, names)))
             
         return indicators
     
@@ -115,10 +191,10 @@ class EconomicIndicatorsGoldTransformer:
             logger.error("Dados insuficientes para criar painel mensal")
             return pd.DataFrame()
             
-        # Prepara DataFrames individuais para join
-        ipca_df = indicators['ipca'].copy()
-        selic_df = indicators['selic'].copy()
-        cambio_df = indicators['cambio'].copy()
+        # DataFrames individuais (a seleção de colunas abaixo já gera cópias)
+        ipca_df = indicators['ipca']
+        selic_df = indicators['selic']
+        cambio_df = indicators['cambio']
         
         # Log das colunas disponíveis para debugging
         logger.info(f"Colunas disponíveis em IPCA: {ipca_df.columns.tolist()}")
@@ -152,9 +228,9 @@ class EconomicIndicatorsGoldTransformer:
             cambio_cols.append('volatility_20')
         
         # Seleciona colunas disponíveis
-        ipca_selected = ipca_df[ipca_cols].copy()
-        selic_selected = selic_df[selic_cols].copy()
-        cambio_selected = cambio_df[cambio_cols].copy()
+        ipca_selected = ipca_df[ipca_cols]
+        selic_selected = selic_df[selic_cols]
+        cambio_selected = cambio_df[cambio_cols]
         
         # Renomeia colunas para evitar conflitos no merge
         ipca_rename = {'value': 'ipca'}
@@ -186,16 +262,16 @@ class EconomicIndicatorsGoldTransformer:
         selic_selected['date'] = pd.to_datetime(selic_selected['date'])
         cambio_selected['date'] = pd.to_datetime(cambio_selected['date'])
         
-        # Extrai ano e mês para agrupamento uniforme
-        ipca_selected['year_month'] = ipca_selected['date'].dt.strftime('%Y-%m')
-        selic_selected['year_month'] = selic_selected['date'].dt.strftime('%Y-%m')
-        cambio_selected['year_month'] = cambio_selected['date'].dt.strftime('%Y-%m')
+        # Chave inteira de ano/mês para o join (formatada só no final)
+        ipca_selected['ym_key'] = _year_month_key(ipca_selected['date'])
+        selic_selected['ym_key'] = _year_month_key(selic_selected['date'])
+        cambio_selected['ym_key'] = _year_month_key(cambio_selected['date'])
         
         # Faz merge dos DataFrames por ano-mês
         monthly_panel = pd.merge(
             ipca_selected, 
             selic_selected, 
-            on='year_month', 
+            on='ym_key', 
             how='outer', 
             suffixes=('', '_selic')
         )
@@ -203,7 +279,7 @@ class EconomicIndicatorsGoldTransformer:
         monthly_panel = pd.merge(
             monthly_panel, 
             cambio_selected, 
-            on='year_month', 
+            on='ym_key', 
             how='outer', 
             suffixes=('', '_cambio')
         )
@@ -247,8 +323,10 @@ class EconomicIndicatorsGoldTransformer:
         except Exception as e:
             logger.error(f"Erro ao calcular índice de pressão econômica: {str(e)}")
         
-        # Ordena pelo ano/mês
-        monthly_panel = monthly_panel.sort_values('year_month')
+        # Ordena pelo ano/mês e formata a chave como 'YYYY-MM' uma única vez
+        monthly_panel = monthly_panel.sort_values('ym_key', kind='mergesort')
+        key_pos = monthly_panel.columns.get_loc('ym_key')
+        monthly_panel.insert(key_pos, 'year_month', _year_month_labels(monthly_panel.pop('ym_key').to_numpy()))
         
         # Metadados
         monthly_panel['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -271,8 +349,8 @@ class EconomicIndicatorsGoldTransformer:
             logger.error("Dados de desemprego não disponíveis")
             return pd.DataFrame()
             
-        # Log para debugging
-        desemprego_df = indicators['desemprego'].copy()
+        # Log para debugging (a seleção de colunas abaixo já gera uma cópia)
+        desemprego_df = indicators['desemprego']
         logger.info(f"Colunas disponíveis em Desemprego: {desemprego_df.columns.tolist()}")
         
         # Verifica quais colunas estão disponíveis
@@ -342,13 +420,12 @@ class EconomicIndicatorsGoldTransformer:
                             labor_df['unemployment_qtr_change'] / labor_df['unemployment_rate'].shift(1) * 100
                         )
                         
-                        # Calcula elasticidade onde há dados disponíveis
-                        # Evita divisão por zero
-                        labor_df['employment_gdp_elasticity'] = labor_df.apply(
-                            lambda row: -row['unemployment_pct_change'] / row['gdp_growth'] 
-                            if row['gdp_growth'] != 0 else None,
-                            axis=1
-                        )
+                        # Calcula elasticidade onde há dados disponíveis, em uma
+                        # operação vetorizada (trimestres com PIB estável ficam nulos)
+                        gdp_growth = labor_df['gdp_growth']
+                        with np.errstate(divide='ignore', invalid='ignore'):
+                            elasticity = -labor_df['unemployment_pct_change'] / gdp_growth
+                        labor_df['employment_gdp_elasticity'] = elasticity.where(gdp_growth != 0)
                         
                         # Calcula média móvel da elasticidade (suavização)
                         labor_df['employment_gdp_elasticity_ma'] = labor_df['employment_gdp_elasticity'].rolling(
@@ -396,21 +473,27 @@ class EconomicIndicatorsGoldTransformer:
             logger.error("Dados insuficientes para criar painel macroeconômico")
             return pd.DataFrame()
             
-        # Inicializa DataFrame vazio com as colunas esperadas
-        dashboard = pd.DataFrame(columns=[
-            'indicator', 'indicator_name', 'last_value', 'last_date',
-            'unit', 'annual_change', 'trend', 'updated_at'
-        ])
+        # Linhas do painel, acumuladas e convertidas em DataFrame uma única vez
+        rows = []
+        columns = list(MACRO_DASHBOARD_COLUMNS)
+        
+        # Variação anual já calculada na camada silver
+        annual_changes = {
+            'ipca': 'year_over_year_pct',
+            'pib': 'annual_change_pct',
+            'desemprego': 'annual_change_pp'
+        }
         
         # Para cada indicador, pega o valor mais recente
         for ind in available:
             df = indicators[ind]
             
-            # Ordena por data
-            df = df.sort_values('date')
+            # Ordena por data (séries da silver normalmente já estão ordenadas)
+            if not df['date'].is_monotonic_increasing:
+                df = df.sort_values('date', kind='mergesort')
             
             # Pega o registro mais recente
-            latest = df.iloc[-1].copy()
+            latest = df.iloc[-1]
             
             # Cria linha para o dashboard
             row = {
@@ -425,89 +508,58 @@ class EconomicIndicatorsGoldTransformer:
             
             # Certifica que a data está em formato datetime
             # Isto é crucial para evitar erro ao salvar no formato Parquet
-            if 'last_date' in row and row['last_date'] is not None:
+            if row['last_date'] is not None:
                 try:
                     row['last_date'] = pd.to_datetime(row['last_date'])
-                except:
+                except (TypeError, ValueError):
                     # Se não conseguir converter, usa data atual
                     row['last_date'] = pd.to_datetime(datetime.now().date())
             
             # Adiciona variação anual se disponível
-            annual_changes = {
-                'ipca': 'year_over_year_pct',
-                'pib': 'annual_change_pct',
-                'desemprego': 'annual_change_pp'
-            }
-            
             if ind in annual_changes and annual_changes[ind] in df.columns:
                 row['annual_change'] = latest.get(annual_changes[ind], None)
             elif ind == 'cambio' and len(df) > 12:
                 # Calcula variação anual para câmbio
                 try:
-                    annual_change = (
-                        (latest.get('value', 0) / df.iloc[-13].get('value', 0) - 1) * 100
-                        if df.iloc[-13].get('value', 0) > 0 else None
+                    base_value = df['value'].iat[-13]
+                    row['annual_change'] = (
+                        (latest.get('value', 0) / base_value - 1) * 100
+                        if base_value > 0 else None
                     )
-                    row['annual_change'] = annual_change
-                except:
+                except (KeyError, TypeError):
                     pass
                 
             # Determina tendência baseada nos últimos 3 registros
-            if len(df) >= 3:
-                try:
-                    last_values = df.iloc[-3:]['value'].values
-                    if last_values[2] > last_values[0]:
-                        row['trend'] = 'rising'
-                    elif last_values[2] < last_values[0]:
-                        row['trend'] = 'falling'
-                    else:
-                        row['trend'] = 'stable'
-                except:
-                    pass
+            if len(df) >= 3 and 'value' in df.columns:
+                first, last = df['value'].iat[-3], df['value'].iat[-1]
+                if last > first:
+                    row['trend'] = 'rising'
+                elif last < first:
+                    row['trend'] = 'falling'
+                else:
+                    row['trend'] = 'stable'
             
-            # Adiciona a linha ao dashboard
-            new_row = pd.DataFrame([row])
-            dashboard = pd.concat([dashboard, new_row], ignore_index=True)
+            rows.append(row)
             
         # Adiciona índice econômico
         try:
-            # Verifica quais indicadores temos disponíveis para o índice
-            has_ipca = 'ipca' in available
-            has_selic = 'selic' in available
-            has_desemprego = 'desemprego' in available
+            # Indicadores disponíveis que compõem o índice
+            health_inds = [ind for ind in ECONOMIC_HEALTH_WEIGHTS if ind in available]
             
             # Se temos pelo menos dois indicadores, cria um índice simples
-            if (has_ipca and has_selic) or (has_ipca and has_desemprego) or (has_selic and has_desemprego):
-                # Valores mais recentes dos indicadores disponíveis
-                weights = {}
-                values = {}
-                
-                if has_ipca:
-                    weights['ipca'] = 0.35
-                    values['ipca'] = indicators['ipca'].iloc[-1]['value']
-                    ipca_avg = indicators['ipca']['value'].mean()
-                    values['ipca_norm'] = values['ipca'] / ipca_avg if ipca_avg > 0 else 1
+            if len(health_inds) >= 2:
+                # Pesos normalizados para somarem 1
+                weights = np.array([ECONOMIC_HEALTH_WEIGHTS[ind] for ind in health_inds])
+                weights /= weights.sum()
                 
-                if has_selic:
-                    weights['selic'] = 0.3
-                    values['selic'] = indicators['selic'].iloc[-1]['value']
-                    selic_avg = indicators['selic']['value'].mean()
-                    values['selic_norm'] = values['selic'] / selic_avg if selic_avg > 0 else 1
-                
-                if has_desemprego:
-                    weights['desemprego'] = 0.35
-                    values['desemprego'] = indicators['desemprego'].iloc[-1]['value']
-                    unemp_avg = indicators['desemprego']['value'].mean()
-                    values['desemprego_norm'] = values['desemprego'] / unemp_avg if unemp_avg > 0 else 1
-                
-                # Normaliza pesos para somarem 1
-                weight_sum = sum(weights.values())
-                weights = {k: v / weight_sum for k, v in weights.items()}
+                # Valor mais recente de cada indicador relativo à sua média histórica
+                latest_values = np.array([indicators[ind]['value'].iloc[-1] for ind in health_inds], dtype=float)
+                averages = np.array([indicators[ind]['value'].mean() for ind in health_inds], dtype=float)
+                normalized = np.ones_like(latest_values)
+                np.divide(latest_values, averages, out=normalized, where=averages > 0)
                 
                 # Calcula índice composto
-                econ_index = 0
-                for ind in weights:
-                    econ_index += weights[ind] * values[f'{ind}_norm']
+                econ_index = float(weights @ normalized)
                 
                 # Converte para escala 0-100 onde 50 é a média histórica
                 econ_score = min(max(50 * econ_index, 0), 100)
@@ -525,7 +577,7 @@ class EconomicIndicatorsGoldTransformer:
                     situation = 'crítica'
                     
                 # Adiciona ao dashboard
-                summary_row = {
+                rows.append({
                     'indicator': 'economic_health',
                     'indicator_name': 'Índice de Saúde Econômica',
                     'last_value': round(econ_score, 1),
@@ -534,17 +586,16 @@ class EconomicIndicatorsGoldTransformer:
                     'annual_change': None,
                     'trend': None,
                     'situation': situation
-                }
-                
-                # Adiciona a linha ao dashboard
-                new_row = pd.DataFrame([summary_row])
-                dashboard = pd.concat([dashboard, new_row], ignore_index=True)
+                })
+                columns.append('situation')
             else:
                 logger.warning("Indicadores insuficientes para calcular índice de saúde econômica")
                 
         except Exception as e:
             logger.error(f"Erro ao calcular índice de saúde econômica: {str(e)}")
             
+        dashboard = pd.DataFrame(rows, columns=columns)
+            
         # Metadados
         dashboard['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
@@ -621,17 +672,15 @@ class EconomicIndicatorsGoldTransformer:
                 logger.error("Nenhum indicador disponível na camada silver")
                 return False
                 
-            success_count = 0
+            # Painéis criados, salvos juntos ao final: (DataFrame, nome do dashboard)
+            panels = []
             
             # 1. Painel mensal de indicadores
             try:
                 monthly_panel = self.create_monthly_indicators(indicators)
                 if not monthly_panel.empty:
                     logger.info(f"Painel mensal criado com sucesso. Shape: {monthly_panel.shape}")
-                    
-                    # Salva na camada gold
-                    if self.save_to_gold_layer(monthly_panel, "monthly_indicators"):
-                        success_count += 1
+                    panels.append((monthly_panel, "monthly_indicators"))
             except Exception as e:
                 logger.error(f"Erro ao criar painel mensal: {str(e)}")
             
@@ -640,10 +689,7 @@ class EconomicIndicatorsGoldTransformer:
                 labor_panel = self.create_labor_market_indicators(indicators)
                 if not labor_panel.empty:
                     logger.info(f"Painel do mercado de trabalho criado com sucesso. Shape: {labor_panel.shape}")
-                    
-                    # Salva na camada gold
-                    if self.save_to_gold_layer(labor_panel, "labor_market"):
-                        success_count += 1
+                    panels.append((labor_panel, "labor_market"))
             except Exception as e:
                 logger.error(f"Erro ao criar painel do mercado de trabalho: {str(e)}")
                 
@@ -652,13 +698,19 @@ class EconomicIndicatorsGoldTransformer:
                 macro_dashboard = self.create_macro_dashboard(indicators)
                 if not macro_dashboard.empty:
                     logger.info(f"Dashboard macroeconômico criado com sucesso. Shape: {macro_dashboard.shape}")
-                    
-                    # Salva na camada gold
-                    if self.save_to_gold_layer(macro_dashboard, "macro_dashboard"):
-                        success_count += 1
+                    panels.append((macro_dashboard, "macro_dashboard"))
             except Exception as e:
                 logger.error(f"Erro ao criar dashboard macroeconômico: {str(e)}")
             
+            if not panels:
+                return False
+                
+            # Salva na camada gold: cada dashboard é um upload independente no
+            # S3 (save_to_gold_layer trata os próprios erros), feitos em paralelo
+            with ThreadPoolExecutor(max_workers=len(panels)) as executor:
+                results = list(executor.map(self.save_to_gold_layer, *zip(*panels)))
+            success_count = sum(map(bool, results))
+            
             # Considera sucesso se pelo menos um dashboard foi criado
             return success_count > 0
             
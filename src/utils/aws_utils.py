@@ -1,16 +1,452 @@
 # src/utils/aws_utils.py
 import boto3
+import collections
+import functools
 import logging
+import threading
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Any, Optional, List, Dict, Union
+from typing import Any, Callable, Optional, List, Dict, Tuple, Union
+import numpy as np
 import pandas as pd
-from io import StringIO, BytesIO
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, RawIOBase, SEEK_SET, SEEK_CUR, SEEK_END
 import os
+import tempfile
+import time
 from datetime import datetime
 from dotenv import load_dotenv
 
+
+@functools.lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Carrega as variáveis de ambiente do .env uma única vez por processo."""
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session() -> boto3.session.Session:
+    """
+    Retorna a sessão boto3 compartilhada entre os handlers.
+    
+    A resolução de credenciais (~/.aws, IMDS) e o carregamento dos modelos de
+    serviço do botocore passam a ocorrer uma única vez por processo.
+    """
+    return boto3.session.Session()
+
+
+# Pool de conexões ampliado para uploads/downloads paralelos, keep-alive TCP e
+# retentativas do SDK em modo adaptativo (backoff com jitter e controle de taxa)
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+# Uploads acima de 8 MiB são enviados em partes concorrentes (multipart);
+# abaixo disso o boto3 faz um único PUT
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Tempo (s) em que o resultado de um list_files é reaproveitado em memória
+LIST_CACHE_TTL = 5.0
+
+# Limite (bytes Arrow) das tabelas Parquet decodificadas mantidas em memória,
+# somadas todas as instâncias de S3Handler do processo; 0 desativa o cache
+PARQUET_CACHE_MAX_BYTES = int(os.getenv('S3_PARQUET_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# Sessões boto3 não são thread-safe na criação de clientes
+_SESSION_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3_client(
+    aws_access_key_id: Optional[str],
+    aws_secret_access_key: Optional[str],
+    region_name: Optional[str]
+):
+    """
+    Retorna um cliente S3 compartilhado para o conjunto de credenciais e região.
+    
+    Reaproveitar o cliente evita um novo handshake TLS por handler e mantém o
+    pool de conexões HTTP do urllib3 entre chamadas. Clientes boto3 são
+    thread-safe após a criação.
+    """
+    with _SESSION_LOCK:
+        return _get_session().client(
+            's3',
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            region_name=region_name,
+            config=S3_CLIENT_CONFIG
+        )
+
+class _TableCache:
+    """
+    Cache LRU de tabelas Arrow limitado pelo total de bytes.
+    
+    Uma única instância (_PARQUET_CACHE) é compartilhada por todos os
+    S3Handler, então o limite de memória vale para o processo inteiro.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._tables: "collections.OrderedDict[Tuple, pa.Table]" = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+    
+    def __len__(self) -> int:
+        return len(self._tables)
+    
+    def get(self, key: Tuple) -> Optional[pa.Table]:
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+            return table
+    
+    def put(self, key: Tuple, table: pa.Table) -> None:
+        with self._lock:
+            if key not in self._tables:
+                self._tables[key] = table
+                self._bytes += table.nbytes
+            # As tabelas menos usadas saem primeiro; a mais recente sempre fica
+            while self._bytes > self.max_bytes and len(self._tables) > 1:
+                _, evicted = self._tables.popitem(last=False)
+                self._bytes -= evicted.nbytes
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+            self._bytes = 0
+
+# Tabelas Parquet decodificadas: (bucket, chave, ETag, colunas) -> tabela
+_PARQUET_CACHE = _TableCache(PARQUET_CACHE_MAX_BYTES)
+
+@functools.lru_cache(maxsize=None)
+def _get_transfer_manager(s3_client):
+    """
+    Retorna o gerenciador de transferências compartilhado de um cliente S3.
+    
+    upload_fileobj cria (e encerra) um TransferManager e seu pool de threads a
+    cada chamada; o gerenciador reaproveitado mantém o pool entre uploads.
+    """
+    return create_transfer_manager(s3_client, S3_TRANSFER_CONFIG)
+
 # Carrega variáveis de ambiente
-load_dotenv()
+_load_env()
+
+# Opções de escrita Parquet: zstd reduz o payload enviado ao S3 e os row groups
+# com estatísticas permitem que leitores descartem grupos inteiros via filtros;
+# páginas de 1 MiB reduzem o número de cabeçalhos por column chunk
+PARQUET_WRITE_OPTIONS = {
+    'compression': 'zstd',
+    'compression_level': 3,
+    'row_group_size': 1_048_576,
+    'data_page_size': 1 << 20,
+    'use_dictionary': True,
+    'data_page_version': '2.0',
+    'write_statistics': True,
+}
+
+
+def _to_arrow(df: Union[pd.DataFrame, pa.Table], **kwargs) -> pa.Table:
+    """
+    Converte um DataFrame em tabela Arrow; tabelas Arrow são usadas como estão.
+    
+    Args:
+        df: DataFrame ou tabela Arrow
+        **kwargs: Argumentos adicionais para pa.Table.from_pandas
+        
+    Returns:
+        pa.Table: Tabela Arrow com os dados
+    """
+    if isinstance(df, pa.Table):
+        return df
+    return pa.Table.from_pandas(df, **kwargs)
+
+
+def _is_empty(df: Union[pd.DataFrame, pa.Table, None]) -> bool:
+    """Indica se o DataFrame/tabela Arrow é None ou não tem linhas."""
+    if df is None:
+        return True
+    if isinstance(df, pa.Table):
+        return df.num_rows == 0
+    return df.empty
+
+
+def _write_parquet(
+    df: Union[pd.DataFrame, pa.Table],
+    buffer,
+    parquet_opts: Optional[Dict[str, Any]] = None
+) -> None:
+    """
+    Serializa um DataFrame como Parquet via pyarrow.parquet.write_table.
+    
+    O índice do pandas não é gravado: os dados das camadas ficam nas colunas,
+    e um índice não sequencial (ex: após filtros) viraria uma coluna extra.
+    
+    Args:
+        df: DataFrame ou tabela Arrow (escrita sem passar pelo pandas)
+        buffer: Destino com método write() (ex: BytesIO)
+        parquet_opts: Opções que sobrescrevem PARQUET_WRITE_OPTIONS
+    """
+    options = {**PARQUET_WRITE_OPTIONS, **(parquet_opts or {})}
+    pq.write_table(_to_arrow(df, preserve_index=False), buffer, **options)
+
+# Leitura CSV multithread em blocos de 8 MiB
+CSV_READ_OPTIONS = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+
+# Mesmos marcadores de ausência do pd.read_csv (na_values padrão): campos
+# vazios e 'NA', 'null' etc. viram NaN/None também nas colunas de texto
+CSV_NULL_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
+CSV_CONVERT_OPTIONS = pacsv.ConvertOptions(
+    null_values=CSV_NULL_VALUES,
+    strings_can_be_null=True
+)
+
+
+def _read_csv_stream(stream, **kwargs) -> pd.DataFrame:
+    """
+    Lê um CSV diretamente do corpo da resposta do S3, sem decodificar para str.
+    
+    Sem argumentos extras o parse é feito pelo pyarrow.csv em paralelo; com
+    argumentos do pandas, o pd.read_csv consome os bytes do stream.
+    
+    Args:
+        stream: Objeto com método read() (ex: StreamingBody do boto3)
+        **kwargs: Argumentos adicionais para pd.read_csv
+        
+    Returns:
+        DataFrame com o conteúdo do CSV
+    """
+    if kwargs:
+        return pd.read_csv(stream, **kwargs)
+        
+    table = pacsv.read_csv(
+        stream,
+        read_options=CSV_READ_OPTIONS,
+        convert_options=CSV_CONVERT_OPTIONS
+    )
+    return table.to_pandas(self_destruct=True)
+
+
+# Argumentos do df.to_csv que têm equivalente em pacsv.WriteOptions
+_CSV_WRITE_KWARGS = {'sep': 'delimiter', 'header': 'include_header'}
+
+
+def _write_csv(df: Union[pd.DataFrame, pa.Table], buffer, **kwargs) -> None:
+    """
+    Serializa um DataFrame como CSV em bytes.
+    
+    DataFrames são escritos pelo df.to_csv direto no buffer binário (mesma
+    saída de sempre, sem a cópia intermediária str -> bytes). Tabelas Arrow
+    são escritas pelo pyarrow.csv.write_csv, sem conversão para pandas,
+    quando os argumentos têm equivalente no pyarrow.
+    
+    Args:
+        df: DataFrame ou tabela Arrow a ser serializada
+        buffer: Destino binário com método write() (ex: BytesIO)
+        **kwargs: Argumentos adicionais no formato do df.to_csv
+    """
+    kwargs.pop('index', None)
+    if isinstance(df, pa.Table) and not set(kwargs) - set(_CSV_WRITE_KWARGS):
+        write_options = pacsv.WriteOptions(
+            batch_size=65536,
+            **{_CSV_WRITE_KWARGS[k]: v for k, v in kwargs.items()}
+        )
+        pacsv.write_csv(df, buffer, write_options=write_options)
+        return
+        
+    if isinstance(df, pa.Table):
+        df = df.to_pandas()
+    df.to_csv(buffer, index=False, **kwargs)
+
+
+class _NonClosingBuffer:
+    """
+    Repassa as operações a um buffer, ignorando close().
+    
+    O gerenciador de transferências fecha o objeto recebido ao final do
+    upload; o invólucro mantém aberto o buffer reaproveitado da thread.
+    """
+    
+    def __init__(self, buffer: BytesIO):
+        self._buffer = buffer
+    
+    def __getattr__(self, name: str):
+        return getattr(self._buffer, name)
+    
+    def close(self) -> None:
+        pass
+
+
+class _S3RangeReader(RawIOBase):
+    """
+    Arquivo somente leitura e posicionável sobre um objeto S3.
+    
+    Cada leitura é atendida por um GET com cabeçalho Range, permitindo que o
+    leitor Parquet busque apenas o rodapé e os column chunks necessários.
+    Faixas conhecidas de antemão podem ser baixadas em paralelo via prefetch().
+    
+    Sem o tamanho do objeto, o primeiro GET pede o bloco final (sufixo) e
+    obtém o tamanho do cabeçalho Content-Range, dispensando um HEAD.
+    """
+    
+    # Tamanho do bloco final buscado para obter o rodapé Parquet
+    FOOTER_SIZE = 64 * 1024
+    
+    def __init__(self, s3_client, bucket_name: str, key: str, size: Optional[int] = None):
+        self._s3_client = s3_client
+        self._bucket_name = bucket_name
+        self._key = key
+        self._pos = 0
+        self._blocks: Dict[int, bytes] = {}
+        
+        if size is None:
+            response = s3_client.get_object(
+                Bucket=bucket_name,
+                Key=key,
+                Range=f"bytes=-{self.FOOTER_SIZE}"
+            )
+            footer = response['Body'].read()
+            # 'bytes início-fim/total'; ausente quando o objeto inteiro é devolvido
+            content_range = response.get('ContentRange')
+            size = int(content_range.rsplit('/', 1)[1]) if content_range else len(footer)
+            self._blocks[size - len(footer)] = footer
+        self._size = size
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._pos
+        elif whence == SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+    
+    def _get_range(self, start: int, end: int) -> bytes:
+        response = self._s3_client.get_object(
+            Bucket=self._bucket_name,
+            Key=self._key,
+            Range=f"bytes={start}-{end}"
+        )
+        return response['Body'].read()
+    
+    def _read_range(self, size: int) -> bytes:
+        end = min(self._pos + size, self._size) - 1
+        if end < self._pos:
+            return b''
+        
+        # Atende a partir de um bloco pré-carregado quando possível
+        for block_start, block in self._blocks.items():
+            if block_start <= self._pos and end < block_start + len(block):
+                data = block[self._pos - block_start:end - block_start + 1]
+                break
+        else:
+            data = self._get_range(self._pos, end)
+        
+        self._pos += len(data)
+        return data
+    
+    def readinto(self, buffer) -> int:
+        data = self._read_range(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+    
+    def readall(self) -> bytes:
+        # Um único GET para o restante do objeto em vez de vários blocos pequenos
+        return self._read_range(self._size - self._pos)
+    
+    def _is_cached(self, start: int, end: int) -> bool:
+        # Indica se a faixa [início, fim) já está em um bloco pré-carregado
+        return any(
+            block_start <= start and end <= block_start + len(block)
+            for block_start, block in self._blocks.items()
+        )
+    
+    def prefetch(self, ranges: List[Tuple[int, int]], max_workers: int = 16) -> None:
+        """
+        Baixa em paralelo faixas [início, fim) que serão lidas em seguida.
+        
+        Args:
+            ranges: Lista de tuplas (início, fim) em bytes
+            max_workers: Número máximo de GETs simultâneos
+        """
+        ranges = [
+            (start, min(end, self._size)) for start, end in ranges
+            if start < end and not self._is_cached(start, min(end, self._size))
+        ]
+        if not ranges:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ranges))) as executor:
+            blocks = executor.map(lambda r: self._get_range(r[0], r[1] - 1), ranges)
+            for (start, _), block in zip(ranges, blocks):
+                self._blocks[start] = block
+    
+    def prefetch_parquet(self, columns: Optional[List[str]] = None) -> None:
+        """
+        Pré-carrega o rodapé Parquet e, em paralelo, os column chunks de todos
+        os row groups para as colunas solicitadas.
+        
+        Args:
+            columns: Colunas que serão lidas (todas se None)
+        """
+        self.prefetch([(max(0, self._size - self.FOOTER_SIZE), self._size)])
+        metadata = pq.read_metadata(self)
+        
+        wanted = None
+        if columns is not None:
+            # Colunas de índice gravadas pelo pandas também são lidas
+            pandas_metadata = metadata.schema.to_arrow_schema().pandas_metadata or {}
+            index_columns = [
+                col for col in pandas_metadata.get('index_columns', [])
+                if isinstance(col, str)
+            ]
+            wanted = set(columns) | set(index_columns)
+        
+        ranges = []
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            for j in range(row_group.num_columns):
+                chunk = row_group.column(j)
+                if wanted is not None and chunk.path_in_schema.split('.')[0] not in wanted:
+                    continue
+                
+                start = chunk.data_page_offset
+                if chunk.has_dictionary_page and chunk.dictionary_page_offset is not None:
+                    start = min(start, chunk.dictionary_page_offset)
+                ranges.append((start, start + chunk.total_compressed_size))
+        
+        self.prefetch(ranges)
+        self.seek(0)
+
 
 class S3Handler:
     """Classe para gerenciar operações com AWS S3."""
@@ -24,62 +460,142 @@ class S3Handler:
             region: Região AWS (se None, usa o valor de AWS_REGION)
         """
         try:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-                aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-                region_name=region or os.getenv('AWS_REGION')
+            self.s3_client = _get_s3_client(
+                os.getenv('AWS_ACCESS_KEY_ID'),
+                os.getenv('AWS_SECRET_ACCESS_KEY'),
+                region or os.getenv('AWS_REGION')
             )
             self.bucket_name = bucket_name or os.getenv('AWS_BUCKET_NAME')
+            # Buffers de serialização reaproveitados por thread
+            self._buf_pool = threading.local()
+            # Resultados recentes de list_files: (prefixo, limite) -> (instante, chaves)
+            self._list_cache: Dict[Tuple[str, Optional[int]], Tuple[float, List[str]]] = {}
+            self._list_cache_lock = threading.Lock()
             logging.info(f"Conexão com S3 inicializada para o bucket: {self.bucket_name}")
         except Exception as e:
             logging.error(f"Erro ao conectar com S3: {str(e)}")
             raise
+    
+    def _get_buffer(self) -> BytesIO:
+        """
+        Obtém o buffer de serialização da thread atual, já esvaziado.
+        
+        Returns:
+            BytesIO: Buffer reaproveitado entre uploads da mesma thread
+        """
+        buffer = getattr(self._buf_pool, 'buf', None)
+        if buffer is None:
+            buffer = self._buf_pool.buf = BytesIO()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return buffer
+    
+    def _upload_buffer(self, buffer: BytesIO, key: str) -> None:
+        """
+        Envia o conteúdo de um buffer ao S3, em multipart quando for grande.
+        
+        Args:
+            buffer: Buffer com o conteúdo serializado
+            key: Caminho/chave do arquivo
+        """
+        # O próprio buffer é enviado, sem cópia, a partir do início
+        buffer.seek(0)
+        _get_transfer_manager(self.s3_client).upload(
+            _NonClosingBuffer(buffer),
+            self.bucket_name,
+            key
+        ).result()
+        self.invalidate(key)
+    
+    def invalidate(self, prefix: str = '') -> None:
+        """
+        Descarta listagens em cache que possam conter chaves sob o prefixo.
+        
+        Args:
+            prefix: Prefixo ou chave alterada (todo o cache se vazio)
+        """
+        with self._list_cache_lock:
+            stale = [
+                cache_key for cache_key in self._list_cache
+                if prefix.startswith(cache_key[0]) or cache_key[0].startswith(prefix)
+            ]
+            for cache_key in stale:
+                del self._list_cache[cache_key]
+
+    def _cached_table(
+        self,
+        key: str,
+        columns: Optional[List[str]],
+        loader: Callable[[Optional[int]], pa.Table]
+    ) -> pa.Table:
+        """
+        Retorna a tabela Parquet do cache se o objeto não mudou (mesmo ETag).
+        
+        Um HEAD confirma o ETag atual; só em caso de falta o loader faz o
+        download e a decodificação, recebendo o tamanho do objeto obtido no
+        mesmo HEAD. O cache (_PARQUET_CACHE) é compartilhado pelo processo.
+        
+        Args:
+            key: Caminho/chave do arquivo
+            columns: Colunas lidas (faz parte da chave do cache)
+            loader: Função que lê a tabela do S3 a partir do tamanho do
+                objeto em bytes (None se desconhecido)
+            
+        Returns:
+            pa.Table: Tabela lida (compartilhada; não deve ser alterada)
+        """
+        if not _PARQUET_CACHE.enabled:
+            return loader(None)
+            
+        head = self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+        cache_key = (self.bucket_name, key, head['ETag'], tuple(columns) if columns is not None else None)
+        
+        table = _PARQUET_CACHE.get(cache_key)
+        if table is None:
+            table = loader(head['ContentLength'])
+            _PARQUET_CACHE.put(cache_key, table)
+        return table
 
     def upload_dataframe(
         self,
-        df: pd.DataFrame,
+        df: Union[pd.DataFrame, pa.Table],
         file_path: str,
         layer: str = 'bronze',
-        format: str = 'parquet'
+        format: str = 'parquet',
+        parquet_opts: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Faz upload de um DataFrame para o S3.
         
         Args:
-            df: DataFrame a ser enviado
+            df: DataFrame a ser enviado (ou tabela Arrow, serializada sem
+                conversão intermediária para pandas)
             file_path: Caminho do arquivo no S3 (sem extensão)
             layer: Camada de dados (bronze, silver, gold)
             format: Formato do arquivo (parquet, csv)
+            parquet_opts: Opções de escrita Parquet (sobrescrevem PARQUET_WRITE_OPTIONS)
             
         Returns:
             bool: True se upload foi bem sucedido
         """
+        if _is_empty(df):
+            logging.info(f"DataFrame vazio, upload ignorado: {file_path}")
+            return True
+        
         try:
-            # Adiciona timestamp ao nome do arquivo
+            # Monta o caminho completo com camada e timestamp
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            file_name = f"{file_path}_{timestamp}"
-            
-            # Monta o caminho completo considerando a camada
-            full_path = f"{layer}/{file_name}.{format}"
+            full_path = ''.join((layer, '/', file_path, '_', timestamp, '.', format))
             
             # Prepara o arquivo com base no formato
+            buffer = self._get_buffer()
             if format == 'parquet':
-                buffer = BytesIO()
-                df.to_parquet(buffer)
-                buffer.seek(0)
-                file_content = buffer.getvalue()
+                _write_parquet(df, buffer, parquet_opts)
             else:  # csv
-                buffer = StringIO()
-                df.to_csv(buffer, index=False)
-                file_content = buffer.getvalue().encode('utf-8')
+                _write_csv(df, buffer)
             
             # Faz upload para S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=full_path,
-                Body=file_content
-            )
+            self._upload_buffer(buffer, full_path)
             
             logging.info(f"Upload realizado com sucesso: s3://{self.bucket_name}/{full_path}")
             return True
@@ -88,10 +604,68 @@ class S3Handler:
             logging.error(f"Erro no upload para S3: {str(e)}")
             return False
     
+    def upload_dataframe_partitioned(
+        self,
+        df: pd.DataFrame,
+        file_path: str,
+        layer: str = 'bronze',
+        n_parts: int = 8,
+        parquet_opts: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Faz upload de um DataFrame como diretório de arquivos Parquet particionados.
+        
+        Cada parte é enviada em paralelo, compartilhando o mesmo cliente S3, o que
+        permite também que leitores processem as partes de forma paralela.
+        
+        Args:
+            df: DataFrame a ser enviado
+            file_path: Caminho do diretório no S3 (sem timestamp)
+            layer: Camada de dados (bronze, silver, gold)
+            n_parts: Número máximo de partes a serem geradas
+            parquet_opts: Opções de escrita Parquet (sobrescrevem PARQUET_WRITE_OPTIONS)
+            
+        Returns:
+            bool: True se o upload de todas as partes foi bem sucedido
+        """
+        if df is None or df.empty:
+            logging.info(f"DataFrame vazio, upload ignorado: {file_path}")
+            return True
+        
+        try:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            base_path = f"{layer}/{file_path}_{timestamp}"
+            
+            # Divide pelos índices posicionais para evitar cópias intermediárias
+            n_parts = max(1, min(n_parts, len(df)))
+            bounds = np.linspace(0, len(df), n_parts + 1, dtype=int)
+            
+            def _upload_part(i: int) -> None:
+                buffer = BytesIO()
+                _write_parquet(df.iloc[bounds[i]:bounds[i + 1]], buffer, parquet_opts)
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=f"{base_path}/part-{i:05d}.parquet",
+                    Body=buffer.getvalue()
+                )
+            
+            with ThreadPoolExecutor(max_workers=n_parts) as executor:
+                # list() propaga a primeira exceção ocorrida em qualquer parte
+                list(executor.map(_upload_part, range(n_parts)))
+            self.invalidate(base_path)
+            
+            logging.info(f"Upload particionado realizado com sucesso: s3://{self.bucket_name}/{base_path}/ ({n_parts} partes)")
+            return True
+            
+        except Exception as e:
+            logging.error(f"Erro no upload particionado para S3: {str(e)}")
+            return False
+    
     def download_file(
         self,
         file_path: str,
-        format: str = None
+        format: str = None,
+        columns: Optional[List[str]] = None
     ) -> Optional[pd.DataFrame]:
         """
         Baixa arquivo do S3 e retorna como DataFrame.
@@ -99,6 +673,8 @@ class S3Handler:
         Args:
             file_path: Caminho completo do arquivo no S3 (incluindo camada)
             format: Formato do arquivo (inferido da extensão se None)
+            columns: Colunas a carregar (todas se None); colunas inexistentes
+                no arquivo são ignoradas
             
         Returns:
             Optional[pd.DataFrame]: DataFrame ou None se houver erro
@@ -113,46 +689,210 @@ class S3Handler:
                 else:
                     format = 'parquet'  # default
             
+            if format == 'parquet' and columns is not None:
+                def load_projection(size: Optional[int]) -> pa.Table:
+                    # Projeção: baixa só o rodapé e os column chunks das colunas pedidas
+                    with _S3RangeReader(self.s3_client, self.bucket_name, file_path, size) as f:
+                        f.prefetch([(max(0, f._size - f.FOOTER_SIZE), f._size)])
+                        available = set(pq.read_schema(f).names)
+                        selected = [col for col in columns if col in available]
+                        f.prefetch_parquet(selected)
+                        return pq.read_table(
+                            f,
+                            columns=selected,
+                            use_pandas_metadata=True,
+                            use_threads=True,
+                            pre_buffer=True
+                        )
+                
+                table = self._cached_table(file_path, columns, load_projection)
+                return table.to_pandas()
+            
+            if format == 'parquet':
+                # A tabela em cache é compartilhada: a conversão copia os dados
+                # para blocos do pandas, e o DataFrame devolvido é gravável
+                table = self._cached_table(file_path, None, lambda size: self._download_parquet(file_path, size))
+                return table.to_pandas()
+            
             response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
                 Key=file_path
             )
-            
-            if format == 'parquet':
-                buffer = BytesIO(response['Body'].read())
-                return pd.read_parquet(buffer)
-            else:  # csv
-                content = response['Body'].read().decode('utf-8')
-                return pd.read_csv(StringIO(content))
+            if columns is not None:
+                wanted = set(columns)
+                return _read_csv_stream(response['Body'], usecols=wanted.__contains__)
+            return _read_csv_stream(response['Body'])
                 
         except Exception as e:
             logging.error(f"Erro ao baixar arquivo do S3 ({file_path}): {str(e)}")
             return None
 
-    def list_files(self, prefix: str = '') -> List[str]:
+    def _download_parquet(self, file_path: str, size: Optional[int] = None) -> pa.Table:
+        """
+        Baixa um arquivo Parquet inteiro e o decodifica como tabela Arrow.
+        
+        Objetos pequenos (o caso comum) são lidos com um único GET em memória;
+        a partir de multipart_threshold, o download é feito em partes
+        concorrentes para um arquivo temporário lido via memory map.
+        
+        Args:
+            file_path: Caminho completo do arquivo no S3
+            size: Tamanho do objeto em bytes (None se desconhecido)
+            
+        Returns:
+            pa.Table: Conteúdo do arquivo
+        """
+        # Row groups/colunas decodificados em paralelo pelo Arrow
+        read_options = {'use_pandas_metadata': True, 'use_threads': True}
+        
+        if size is None or size < S3_TRANSFER_CONFIG.multipart_threshold:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path)
+            return pq.read_table(pa.BufferReader(response['Body'].read()), **read_options)
+        
+        # Arquivo temporário: o conteúdo fica no page cache em vez do heap do Python
+        with tempfile.NamedTemporaryFile(suffix='.parquet') as tmp:
+            self.s3_client.download_fileobj(
+                self.bucket_name,
+                file_path,
+                tmp,
+                Config=S3_TRANSFER_CONFIG
+            )
+            tmp.flush()
+            with pa.memory_map(tmp.name, 'r') as source:
+                return pq.read_table(source, **read_options)
+
+    def read_schema(self, key: str) -> Optional[List[str]]:
+        """
+        Lê os nomes das colunas de um arquivo Parquet sem baixar os dados.
+        
+        Apenas o rodapé do arquivo é buscado, via GET com cabeçalho Range.
+        
+        Args:
+            key: Caminho/chave do arquivo Parquet
+            
+        Returns:
+            Optional[List[str]]: Nomes das colunas ou None se houver erro
+        """
+        try:
+            with _S3RangeReader(self.s3_client, self.bucket_name, key) as f:
+                f.prefetch([(max(0, f._size - f.FOOTER_SIZE), f._size)])
+                return pq.read_schema(f).names
+                
+        except Exception as e:
+            logging.error(f"Erro ao ler schema do arquivo {key}: {str(e)}")
+            return None
+
+    def _iter_keys(self, prefix: str = '', max_items: Optional[int] = None):
+        """
+        Itera sobre as chaves do bucket página a página (ListObjectsV2).
+        
+        Args:
+            prefix: Prefixo para filtrar arquivos
+            max_items: Limite de chaves pedidas ao S3 (todas se None)
+            
+        Yields:
+            str: Chave de cada objeto encontrado
+        """
+        pagination = {'PageSize': 1000}
+        if max_items is not None:
+            pagination = {'PageSize': min(max_items, 1000), 'MaxItems': max_items}
+            
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig=pagination
+        )
+        
+        for page in pages:
+            for obj in page.get('Contents', []):
+                yield obj['Key']
+
+    def _from_parent_listing(self, prefix: str) -> Optional[List[str]]:
+        """
+        Filtra uma listagem completa em cache cujo prefixo contém o pedido.
+        
+        O S3 devolve as chaves em ordem lexicográfica, então o filtro mantém a
+        mesma ordem de uma listagem direta do prefixo.
+        
+        Args:
+            prefix: Prefixo pedido
+            
+        Returns:
+            Lista de chaves ou None se nenhuma listagem válida cobrir o prefixo
+        """
+        now = time.monotonic()
+        with self._list_cache_lock:
+            parents = [
+                (cached_prefix, keys)
+                for (cached_prefix, limit), (created, keys) in self._list_cache.items()
+                if limit is None and prefix.startswith(cached_prefix) and now - created < LIST_CACHE_TTL
+            ]
+        if not parents:
+            return None
+            
+        # O prefixo mais longo é o que tem menos chaves a filtrar
+        _, keys = max(parents, key=lambda item: len(item[0]))
+        return [key for key in keys if key.startswith(prefix)]
+
+    def list_files(self, prefix: str = '', max_keys: Optional[int] = None) -> List[str]:
         """
         Lista arquivos no bucket S3.
         
         Args:
             prefix: Prefixo para filtrar arquivos (ex: 'bronze/')
+            max_keys: Número máximo de arquivos retornados (todos se None)
             
         Returns:
             list: Lista de arquivos encontrados
         """
+        cache_key = (prefix, max_keys)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < LIST_CACHE_TTL:
+            return list(cached[1])
+            
+        # Uma listagem completa de um prefixo mais amplo também responde
+        keys = self._from_parent_listing(prefix)
+        if keys is not None:
+            return keys if max_keys is None else keys[:max_keys]
+        
+        try:
+            # O limite vai para o paginator, então o S3 não devolve chaves a mais
+            keys = list(self._iter_keys(prefix, max_items=max_keys))
+            with self._list_cache_lock:
+                self._list_cache[cache_key] = (time.monotonic(), keys)
+            return list(keys)
+            
+        except Exception as e:
+            logging.error(f"Erro ao listar arquivos com prefixo {prefix}: {str(e)}")
+            return []
+
+    def list_prefixes(self, prefix: str = '') -> List[str]:
+        """
+        Lista os "diretórios" imediatamente abaixo de um prefixo.
+        
+        Args:
+            prefix: Prefixo base (ex: 'silver/economic_indicators/')
+            
+        Returns:
+            list: Lista de prefixos comuns encontrados
+        """
         try:
-            response = self.s3_client.list_objects_v2(
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            pages = paginator.paginate(
                 Bucket=self.bucket_name,
-                Prefix=prefix
+                Prefix=prefix,
+                Delimiter='/'
             )
             
-            files = []
-            if 'Contents' in response:
-                files = [obj['Key'] for obj in response['Contents']]
-                
-            return files
+            return [
+                common['Prefix']
+                for page in pages
+                for common in page.get('CommonPrefixes', [])
+            ]
             
         except Exception as e:
-            logging.error(f"Erro ao listar arquivos com prefixo {prefix}: {str(e)}")
+            logging.error(f"Erro ao listar prefixos de {prefix}: {str(e)}")
             return []
 
     def test_connection(self) -> bool:
@@ -187,30 +927,146 @@ class S3Handler:
             Path do arquivo mais recente ou None
         """
         try:
-            files = self.list_files(prefix)
+            # Mantém apenas o maior nome (presumindo nomeação cronológica),
+            # sem materializar nem ordenar a listagem
+            latest = max(self._iter_keys(prefix), default=None)
             
-            if not files:
+            if latest is None:
                 logging.warning(f"Nenhum arquivo encontrado em {self.bucket_name}/{prefix}")
-                return None
                 
-            # Ordena para pegar o mais recente (presumindo nomeação cronológica)
-            return sorted(files)[-1]
+            return latest
             
         except Exception as e:
             logging.error(f"Erro ao obter arquivo mais recente: {str(e)}")
             return None
     
-    def read_parquet(self, key: str) -> Optional[pd.DataFrame]:
+    def read_parquet(
+        self,
+        key: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[Tuple]] = None
+    ) -> Optional[pd.DataFrame]:
         """
         Lê arquivo Parquet do S3 como DataFrame.
         
+        A leitura usa GETs por faixa de bytes: primeiro o rodapé com os metadados
+        e depois apenas os column chunks necessários. Os filtros são avaliados
+        contra as estatísticas de cada row group, que é descartado sem download
+        quando não pode conter linhas válidas.
+        
         Args:
             key: Caminho/chave do arquivo
+            columns: Colunas a serem lidas (todas se None)
+            filters: Filtros no formato do pyarrow, ex: [('year', '>=', 2020)]
             
         Returns:
             DataFrame ou None se ocorrer erro
         """
-        return self.download_file(key, format='parquet')
+        try:
+            def load(size: Optional[int] = None) -> pa.Table:
+                with _S3RangeReader(self.s3_client, self.bucket_name, key, size) as f:
+                    # Sem filtros todos os row groups serão lidos: os column chunks
+                    # são baixados em paralelo, e não um GET sequencial por vez
+                    if filters is None:
+                        f.prefetch_parquet(columns)
+                    
+                    return pq.read_table(
+                        f,
+                        columns=columns,
+                        filters=filters,
+                        use_pandas_metadata=True,
+                        use_threads=True,
+                        pre_buffer=True,
+                        coerce_int96_timestamp_unit='ns'
+                    )
+            
+            # Leituras sem filtro passam pelo cache por ETag (a tabela em cache
+            # é compartilhada); com filtros, os buffers Arrow são liberados
+            # durante a conversão para reduzir o pico de memória. Em ambos os
+            # casos o DataFrame devolvido é gravável
+            if filters is None:
+                return self._cached_table(key, columns, load).to_pandas()
+            return load().to_pandas(self_destruct=True)
+            
+        except Exception as e:
+            logging.error(f"Erro ao ler parquet {self.bucket_name}/{key}: {str(e)}")
+            return None
+    
+    def validate_parquet_ranges(
+        self,
+        key: str,
+        range_dict: Dict[str, Tuple[float, float]]
+    ) -> Tuple[bool, Dict[str, int]]:
+        """
+        Conta valores fora do intervalo em um Parquet do S3 sem baixá-lo inteiro.
+        
+        As estatísticas min/max do rodapé descartam os row groups que estão
+        totalmente dentro dos intervalos; apenas as colunas validadas dos row
+        groups restantes são baixadas e comparadas com pyarrow.compute.
+        
+        Args:
+            key: Caminho/chave do arquivo
+            range_dict: Dicionário {coluna: (min, max)}
+            
+        Returns:
+            Tupla (is_valid, out_of_range_count), no mesmo formato de
+            validate_value_ranges
+        """
+        try:
+            with _S3RangeReader(self.s3_client, self.bucket_name, key) as f:
+                f.prefetch([(max(0, f._size - f.FOOTER_SIZE), f._size)])
+                parquet_file = pq.ParquetFile(f, pre_buffer=True)
+                schema = parquet_file.schema_arrow
+                metadata = parquet_file.metadata
+                
+                columns = []
+                for col in range_dict:
+                    if col not in schema.names:
+                        continue
+                    col_type = schema.field(col).type
+                    if pa.types.is_integer(col_type) or pa.types.is_floating(col_type):
+                        columns.append(col)
+                    else:
+                        logging.warning(f"Coluna {col} não é numérica, validação de intervalo ignorada")
+                
+                # Seleciona os row groups cujas estatísticas podem conter violações
+                row_groups = []
+                for i in range(metadata.num_row_groups):
+                    row_group = metadata.row_group(i)
+                    for j in range(row_group.num_columns):
+                        chunk = row_group.column(j)
+                        if chunk.path_in_schema not in columns:
+                            continue
+                        lo, hi = range_dict[chunk.path_in_schema]
+                        stats = chunk.statistics
+                        if stats is None or not stats.has_min_max or stats.min < lo or stats.max > hi:
+                            row_groups.append(i)
+                            break
+                
+                out_of_range_count = {}
+                if row_groups:
+                    table = parquet_file.read_row_groups(row_groups, columns=columns, use_threads=True)
+                    for col in columns:
+                        lo, hi = range_dict[col]
+                        mask = pc.or_(pc.less(table[col], lo), pc.greater(table[col], hi))
+                        count = pc.sum(mask).as_py() or 0
+                        if count > 0:
+                            out_of_range_count[col] = count
+                
+            logging.info(
+                f"Validação de intervalos em {key}: {len(row_groups)}/{metadata.num_row_groups} "
+                f"row groups lidos"
+            )
+            
+            is_valid = len(out_of_range_count) == 0
+            if not is_valid:
+                logging.error(f"Colunas com valores fora do intervalo: {out_of_range_count}")
+                
+            return is_valid, out_of_range_count
+            
+        except Exception as e:
+            logging.error(f"Erro ao validar parquet {self.bucket_name}/{key}: {str(e)}")
+            return False, {}
     
     def read_csv(self, key: str, **kwargs) -> Optional[pd.DataFrame]:
         """
@@ -229,34 +1085,38 @@ class S3Handler:
                 Key=key
             )
             
-            content = response['Body'].read().decode('utf-8')
-            return pd.read_csv(StringIO(content), **kwargs)
+            return _read_csv_stream(response['Body'], **kwargs)
             
         except Exception as e:
             logging.error(f"Erro ao ler CSV {self.bucket_name}/{key}: {str(e)}")
             return None
     
-    def write_parquet(self, df: pd.DataFrame, key: str) -> bool:
+    def write_parquet(
+        self,
+        df: pd.DataFrame,
+        key: str,
+        parquet_opts: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         Escreve DataFrame como Parquet no S3.
         
         Args:
             df: DataFrame a ser salvo
             key: Caminho/chave do arquivo
+            parquet_opts: Opções de escrita Parquet (sobrescrevem PARQUET_WRITE_OPTIONS)
             
         Returns:
             True se operação for bem-sucedida, False caso contrário
         """
+        if df is None or df.empty:
+            logging.info(f"DataFrame vazio, upload ignorado: {key}")
+            return True
+        
         try:
-            buffer = BytesIO()
-            df.to_parquet(buffer)
-            buffer.seek(0)
+            buffer = self._get_buffer()
+            _write_parquet(df, buffer, parquet_opts)
             
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=buffer.getvalue()
-            )
+            self._upload_buffer(buffer, key)
             
             logging.info(f"Arquivo salvo com sucesso: s3://{self.bucket_name}/{key}")
             return True
@@ -277,15 +1137,16 @@ class S3Handler:
         Returns:
             True se operação for bem-sucedida, False caso contrário
         """
+        if df is None or df.empty:
+            logging.info(f"DataFrame vazio, upload ignorado: {key}")
+            return True
+        
         try:
-            buffer = StringIO()
-            df.to_csv(buffer, index=False, **kwargs)
+            # Escreve direto em bytes, sem a cópia intermediária str -> bytes
+            buffer = self._get_buffer()
+            _write_csv(df, buffer, **kwargs)
             
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=buffer.getvalue().encode('utf-8')
-            )
+            self._upload_buffer(buffer, key)
             
             logging.info(f"Arquivo salvo com sucesso: s3://{self.bucket_name}/{key}")
             return True
@@ -308,6 +1169,22 @@ class S3Handler:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         return f"{base_path}_{timestamp}.{extension}"
     
+    def _copy(self, source_key: str, dest_key: str) -> None:
+        """
+        Copia um objeto dentro do bucket usando a cópia gerenciada do boto3.
+        
+        Args:
+            source_key: Caminho de origem
+            dest_key: Caminho de destino
+        """
+        self.s3_client.copy(
+            {'Bucket': self.bucket_name, 'Key': source_key},
+            self.bucket_name,
+            dest_key,
+            Config=S3_TRANSFER_CONFIG
+        )
+        self.invalidate(dest_key)
+    
     def move_file(self, source_key: str, dest_key: str) -> bool:
         """
         Move/renomeia um arquivo no S3.
@@ -320,22 +1197,63 @@ class S3Handler:
             True se operação for bem-sucedida, False caso contrário
         """
         try:
-            # Copia o arquivo
-            self.s3_client.copy_object(
-                Bucket=self.bucket_name,
-                CopySource={'Bucket': self.bucket_name, 'Key': source_key},
-                Key=dest_key
-            )
+            # Copia o arquivo (cópia gerenciada: multipart acima do limite,
+            # necessária para objetos maiores que 5 GB)
+            self._copy(source_key, dest_key)
             
             # Remove o original
             self.s3_client.delete_object(
                 Bucket=self.bucket_name,
                 Key=source_key
             )
+            self.invalidate(source_key)
             
             logging.info(f"Arquivo movido: s3://{self.bucket_name}/{source_key} -> s3://{self.bucket_name}/{dest_key}")
             return True
             
         except Exception as e:
             logging.error(f"Erro ao mover arquivo {source_key} para {dest_key}: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+    
+    def move_many(self, pairs: List[Tuple[str, str]]) -> bool:
+        """
+        Move/renomeia vários arquivos no S3.
+        
+        As cópias são feitas em paralelo no servidor e as remoções agrupadas em
+        chamadas DeleteObjects de até 1000 chaves.
+        
+        Args:
+            pairs: Lista de tuplas (caminho atual, novo caminho)
+            
+        Returns:
+            True se operação for bem-sucedida, False caso contrário
+        """
+        if not pairs:
+            return True
+        
+        try:
+            # Copia os arquivos; list() propaga a primeira falha antes de remover
+            with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+                list(executor.map(lambda pair: self._copy(*pair), pairs))
+            
+            # Remove os originais em lotes
+            sources = [source_key for source_key, _ in pairs]
+            for start in range(0, len(sources), 1000):
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={
+                        'Objects': [{'Key': key} for key in sources[start:start + 1000]],
+                        'Quiet': True
+                    }
+                )
+                for key in sources[start:start + 1000]:
+                    self.invalidate(key)
+                if response.get('Errors'):
+                    raise ClientError({'Error': response['Errors'][0]}, 'DeleteObjects')
+            
+            logging.info(f"{len(pairs)} arquivos movidos em s3://{self.bucket_name}")
+            return True
+            
+        except Exception as e:
+            logging.error(f"Erro ao mover {len(pairs)} arquivos: {str(e)}")
+            return False
@@ -4,9 +4,15 @@
 import logging
 import traceback
 import functools
+import random
 import time
 from typing import Callable, Any, Optional, Dict, Type, List, Union
 
+from botocore.exceptions import BotoCoreError, ClientError
+
+# Limite superior (segundos) para a espera entre retentativas
+MAX_RETRY_DELAY = 60
+
 # Códigos de erro padronizados
 class ErrorCodes:
     # Erros gerais
@@ -29,6 +35,14 @@ class ErrorCodes:
     TRANSFORM_PROCESSING_ERROR = "ERR-TRF-002"
     TRANSFORM_OUTPUT_ERROR = "ERR-TRF-003"
 
+# Erros determinísticos: uma nova tentativa falharia da mesma forma
+NON_RETRYABLE_CODES = frozenset({
+    ErrorCodes.VALIDATION_ERROR,
+    ErrorCodes.S3_NOT_FOUND_ERROR,
+    ErrorCodes.COLLECTOR_DATA_FORMAT_ERROR,
+    ErrorCodes.TRANSFORM_INPUT_ERROR,
+})
+
 class ProcessingError(Exception):
     """Exceção personalizada para erros no processamento de dados."""
     
@@ -55,8 +69,10 @@ def error_handler(logger: logging.Logger = None,
     
     Args:
         logger: Logger a ser usado (se None, cria um novo)
-        retries: Número de retentativas em caso de erro
-        retry_delay: Tempo de espera entre retentativas (segundos)
+        retries: Número de retentativas em caso de erro (ProcessingError com
+            código em NON_RETRYABLE_CODES é propagado sem novas tentativas)
+        retry_delay: Tempo base de espera entre retentativas (segundos), dobrado a
+            cada tentativa e com jitter aleatório para dessincronizar workers
         handled_exceptions: Lista de exceções que devem ser capturadas
         
     Returns:
@@ -68,6 +84,9 @@ def error_handler(logger: logging.Logger = None,
     if handled_exceptions is None:
         handled_exceptions = [Exception]
     
+    # Construída uma única vez na decoração, e não a cada chamada
+    handled = tuple(handled_exceptions)
+    
     def decorator(func: Callable):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -76,22 +95,24 @@ def error_handler(logger: logging.Logger = None,
             while True:
                 try:
                     return func(*args, **kwargs)
-                except tuple(handled_exceptions) as e:
+                except handled as e:
                     retry_count += 1
                     
                     # Log do erro com detalhes
                     error_message = f"Erro em {func.__name__}: {str(e)}"
-                    stack_trace = traceback.format_exc()
                     
                     # Se excedeu número de retentativas ou não deve tentar novamente
-                    if retry_count > retries:
+                    non_retryable = isinstance(e, ProcessingError) and e.code in NON_RETRYABLE_CODES
+                    if retry_count > retries or non_retryable:
+                        # Stack trace só é formatado no caminho final de falha
+                        stack_trace = traceback.format_exc()
                         logger.error(f"{error_message}\n{stack_trace}")
                         
                         # Reempacota o erro para um formato padronizado se não for um ProcessingError
                         if not isinstance(e, ProcessingError):
                             if isinstance(e, ConnectionError):
                                 code = ErrorCodes.COLLECTOR_CONNECTION_ERROR
-                            elif "AWS" in str(e) or "S3" in str(e):
+                            elif isinstance(e, (ClientError, BotoCoreError)):
                                 code = ErrorCodes.S3_ACCESS_ERROR
                             else:
                                 code = ErrorCodes.UNKNOWN_ERROR
@@ -103,12 +124,16 @@ def error_handler(logger: logging.Logger = None,
                             )
                         raise
                     
+                    # Backoff exponencial com jitter, limitado a MAX_RETRY_DELAY
+                    delay = retry_delay * 2 ** (retry_count - 1) * random.uniform(0.5, 1.5)
+                    delay = min(MAX_RETRY_DELAY, delay)
+                    
                     # Log de tentativa de nova tentativa
                     logger.warning(
                         f"{error_message}. Tentativa {retry_count}/{retries}. "
-                        f"Aguardando {retry_delay}s para retry."
+                        f"Aguardando {delay:.1f}s para retry."
                     )
-                    time.sleep(retry_delay)
+                    time.sleep(delay)
                     
         return wrapper
     
@@ -25,6 +25,7 @@ from .date_utils import (
 )
 
 from .math_utils import (
+    aggregate_monthly,
     calculate_variations,
     calculate_moving_average,
     calculate_cumulative_values,
@@ -68,6 +69,7 @@ __all__ = [
     'resample_time_series',
     
     # Math Utils
+    'aggregate_monthly',
     'calculate_variations',
     'calculate_moving_average',
     'calculate_cumulative_values',
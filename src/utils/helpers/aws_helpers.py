@@ -24,25 +24,29 @@ def get_s3_client():
     """Obtém um cliente S3. Obsoleto: Use S3Handler()."""
     return _s3_handler.s3_client
 
-def list_s3_files(bucket, prefix=''):
+def list_s3_files(bucket, prefix='', max_keys=None):
     """Lista arquivos no S3. Obsoleto: Use S3Handler().list_files()."""
-    return _s3_handler.list_files(prefix)
+    return _s3_handler.list_files(prefix, max_keys=max_keys)
 
 def get_latest_s3_file(bucket, prefix):
     """Obtém arquivo mais recente. Obsoleto: Use S3Handler().get_latest_file()."""
     return _s3_handler.get_latest_file(prefix)
 
-def read_parquet_from_s3(bucket, key):
+def read_parquet_from_s3(bucket, key, columns=None, filters=None):
     """Lê arquivo Parquet do S3. Obsoleto: Use S3Handler().read_parquet()."""
-    return _s3_handler.read_parquet(key)
+    return _s3_handler.read_parquet(key, columns=columns, filters=filters)
+
+def read_parquet_from_s3_with_validation(bucket, key, range_dict):
+    """Valida intervalos de um Parquet no S3. Obsoleto: Use S3Handler().validate_parquet_ranges()."""
+    return _s3_handler.validate_parquet_ranges(key, range_dict)
 
 def read_csv_from_s3(bucket, key, **kwargs):
     """Lê arquivo CSV do S3. Obsoleto: Use S3Handler().read_csv()."""
     return _s3_handler.read_csv(key, **kwargs)
 
-def write_parquet_to_s3(df, bucket, key):
+def write_parquet_to_s3(df, bucket, key, parquet_opts=None):
     """Escreve DataFrame como Parquet. Obsoleto: Use S3Handler().write_parquet()."""
-    return _s3_handler.write_parquet(df, key)
+    return _s3_handler.write_parquet(df, key, parquet_opts=parquet_opts)
 
 def write_csv_to_s3(df, bucket, key, **kwargs):
     """Escreve DataFrame como CSV. Obsoleto: Use S3Handler().write_csv()."""
@@ -56,6 +60,10 @@ def s3_move_file(bucket, source_key, dest_key):
     """Move arquivo no S3. Obsoleto: Use S3Handler().move_file()."""
     return _s3_handler.move_file(source_key, dest_key)
 
+def s3_move_files(bucket, pairs):
+    """Move vários arquivos no S3. Obsoleto: Use S3Handler().move_many()."""
+    return _s3_handler.move_many(pairs)
+
 def test_s3_connection(bucket):
     """Testa conexão com S3. Obsoleto: Use S3Handler().test_connection()."""
     return _s3_handler.test_connection()
\ No newline at end of file
@@ -12,11 +12,16 @@ def inspect_dataframe(df: pd.DataFrame, label: str = "DataFrame") -> None:
         df: DataFrame a ser inspecionado
         label: Rótulo para identificar o DataFrame nos logs
     """
+    # Evita varrer o DataFrame quando as mensagens seriam descartadas
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return
+    
     logging.info(f"=== Inspeção do {label} ===")
     logging.info(f"Colunas: {df.columns.tolist()}")
     logging.info(f"Tipos de dados: {df.dtypes}")
     logging.info(f"Formato: {df.shape}")
-    logging.info(f"Valores nulos: {df.isnull().sum().to_dict()}")
+    # count() conta não-nulos em uma única passada, sem materializar máscara booleana
+    logging.info(f"Valores nulos: {(len(df) - df.count()).to_dict()}")
     
     # Amostra de dados
     if not df.empty:
@@ -70,7 +75,8 @@ def ensure_numeric(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     Returns:
         DataFrame com colunas convertidas
     """
-    result_df = df.copy()
+    # Cópia rasa: as colunas convertidas são substituídas, nunca escritas no lugar
+    result_df = df.copy(deep=False)
     
     for col in columns:
         if col in result_df.columns:
@@ -90,6 +96,33 @@ def ensure_numeric(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
     
     return result_df
 
+def _duplicated_by_hash(df: pd.DataFrame, subset: List[str] = None, keep: str = 'first') -> np.ndarray:
+    """
+    Marca linhas duplicadas a partir de um hash de 64 bits por linha.
+    
+    As colunas-chave são reduzidas a um único hash vetorizado; apenas as linhas
+    cujo hash se repete passam pela comparação exata do pandas, o que garante
+    o resultado mesmo em caso de colisão.
+    
+    Args:
+        df: DataFrame a ser analisado
+        subset: Colunas para verificar duplicação (None = todas)
+        keep: Estratégia para marcar duplicados ('first', 'last', False)
+        
+    Returns:
+        Array booleano com True nas linhas duplicadas
+    """
+    keys = df if subset is None else df[subset]
+    hashes = pd.Index(pd.util.hash_pandas_object(keys, index=False).to_numpy())
+    
+    duplicated = np.zeros(len(df), dtype=bool)
+    candidates = hashes.duplicated(keep=False)
+    
+    if candidates.any():
+        duplicated[candidates] = keys[candidates].duplicated(keep=keep).to_numpy()
+        
+    return duplicated
+
 def remove_duplicates(df: pd.DataFrame, subset: List[str] = None, keep: str = 'first') -> pd.DataFrame:
     """
     Remove registros duplicados de um DataFrame.
@@ -103,7 +136,7 @@ def remove_duplicates(df: pd.DataFrame, subset: List[str] = None, keep: str = 'f
         DataFrame sem duplicações
     """
     orig_count = len(df)
-    result_df = df.drop_duplicates(subset=subset, keep=keep)
+    result_df = df[~_duplicated_by_hash(df, subset=subset, keep=keep)]
     new_count = len(result_df)
     
     if orig_count > new_count:
@@ -125,7 +158,8 @@ def fill_missing_values(df: pd.DataFrame, fill_dict: Dict[str, Any] = None) -> p
     if fill_dict is None:
         return df
         
-    result_df = df.copy()
+    # Cópia rasa: as colunas preenchidas são substituídas, nunca escritas no lugar
+    result_df = df.copy(deep=False)
     
     for col, fill_value in fill_dict.items():
         if col in result_df.columns:
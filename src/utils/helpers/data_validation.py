@@ -4,6 +4,8 @@ import numpy as np
 import logging
 from typing import Dict, List, Optional, Union, Tuple, Any
 
+from .data_cleaning import _duplicated_by_hash
+
 def validate_column_presence(df: pd.DataFrame, required_columns: List[str]) -> Tuple[bool, List[str]]:
     """
     Valida se as colunas necessárias estão presentes no DataFrame.
@@ -27,13 +29,30 @@ def validate_column_presence(df: pd.DataFrame, required_columns: List[str]) -> T
         
     return is_valid, missing_columns
 
-def validate_data_types(df: pd.DataFrame, type_dict: Dict[str, str]) -> Tuple[bool, Dict[str, str]]:
+# Códigos dtype.kind aceitos para cada tipo lógico de validate_data_types
+_DTYPE_KIND_LUT = {
+    'numeric': 'biufc',
+    'datetime': 'M',
+    'string': 'OSU',
+    'boolean': 'b',
+}
+
+# Códigos dtype.kind comparáveis com intervalos (complexos ficam de fora: a
+# conversão para float64 descartaria a parte imaginária)
+_RANGE_KINDS = 'biuf'
+
+def validate_data_types(
+    df: pd.DataFrame,
+    type_dict: Dict[str, str],
+    dtypes: Optional[pd.Series] = None
+) -> Tuple[bool, Dict[str, str]]:
     """
     Valida se as colunas têm os tipos de dados esperados.
     
     Args:
         df: DataFrame a ser validado
         type_dict: Dicionário {coluna: tipo_esperado}
+        dtypes: df.dtypes pré-calculado (opcional)
         
     Returns:
         Tupla (is_valid, invalid_columns)
@@ -42,25 +61,27 @@ def validate_data_types(df: pd.DataFrame, type_dict: Dict[str, str]) -> Tuple[bo
         return False, type_dict
         
     invalid_columns = {}
+    if dtypes is None:
+        dtypes = df.dtypes
     
     for col, expected_type in type_dict.items():
-        if col not in df.columns:
+        if col not in dtypes.index:
             continue
             
-        # Mapeia strings de tipo para tipos Python/Pandas
-        if expected_type == 'numeric':
-            is_valid = pd.api.types.is_numeric_dtype(df[col])
-        elif expected_type == 'datetime':
-            is_valid = pd.api.types.is_datetime64_any_dtype(df[col])
-        elif expected_type == 'string':
+        dtype = dtypes[col]
+        kinds = _DTYPE_KIND_LUT.get(expected_type)
+        
+        # Mapeia strings de tipo para o código 'kind' do dtype
+        if kinds is None:
+            is_valid = dtype.name == expected_type
+        elif dtype.kind == 'O' and expected_type == 'string':
+            # Colunas object só são string se o conteúdo inferido for texto
             is_valid = pd.api.types.is_string_dtype(df[col])
-        elif expected_type == 'boolean':
-            is_valid = pd.api.types.is_bool_dtype(df[col])
         else:
-            is_valid = df[col].dtype.name == expected_type
+            is_valid = dtype.kind in kinds
             
         if not is_valid:
-            invalid_columns[col] = f"Esperado: {expected_type}, Atual: {df[col].dtype.name}"
+            invalid_columns[col] = f"Esperado: {expected_type}, Atual: {dtype.name}"
             
     is_valid = len(invalid_columns) == 0
     
@@ -71,7 +92,8 @@ def validate_data_types(df: pd.DataFrame, type_dict: Dict[str, str]) -> Tuple[bo
 
 def validate_value_ranges(
     df: pd.DataFrame, 
-    range_dict: Dict[str, Tuple[float, float]]
+    range_dict: Dict[str, Tuple[float, float]],
+    dtypes: Optional[pd.Series] = None
 ) -> Tuple[bool, Dict[str, int]]:
     """
     Valida se os valores estão dentro dos intervalos esperados.
@@ -79,6 +101,7 @@ def validate_value_ranges(
     Args:
         df: DataFrame a ser validado
         range_dict: Dicionário {coluna: (min, max)}
+        dtypes: df.dtypes pré-calculado (opcional)
         
     Returns:
         Tupla (is_valid, out_of_range_count)
@@ -87,19 +110,29 @@ def validate_value_ranges(
         return False, {}
         
     out_of_range_count = {}
+    numeric_cols = []
+    if dtypes is None:
+        dtypes = df.dtypes
     
-    for col, (min_val, max_val) in range_dict.items():
-        if col not in df.columns:
+    for col in range_dict:
+        if col not in dtypes.index:
             continue
             
-        # Conta valores fora do intervalo
-        if pd.api.types.is_numeric_dtype(df[col]):
-            count = ((df[col] < min_val) | (df[col] > max_val)).sum()
-            
-            if count > 0:
-                out_of_range_count[col] = count
+        if dtypes[col].kind in _RANGE_KINDS:
+            numeric_cols.append(col)
         else:
             logging.warning(f"Coluna {col} não é numérica, validação de intervalo ignorada")
+    
+    if numeric_cols:
+        # Conta valores fora do intervalo de todas as colunas em uma única passada
+        values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        min_vals = np.array([range_dict[col][0] for col in numeric_cols], dtype=np.float64)
+        max_vals = np.array([range_dict[col][1] for col in numeric_cols], dtype=np.float64)
+        counts = np.count_nonzero((values < min_vals) | (values > max_vals), axis=0)
+        
+        out_of_range_count = {
+            col: int(count) for col, count in zip(numeric_cols, counts) if count > 0
+        }
             
     is_valid = len(out_of_range_count) == 0
     
@@ -110,7 +143,8 @@ def validate_value_ranges(
 
 def validate_missing_values(
     df: pd.DataFrame, 
-    threshold_pct: float = 5.0
+    threshold_pct: float = 5.0,
+    null_counts: Optional[pd.Series] = None
 ) -> Tuple[bool, Dict[str, float]]:
     """
     Valida se o percentual de valores ausentes está abaixo do limite.
@@ -118,6 +152,7 @@ def validate_missing_values(
     Args:
         df: DataFrame a ser validado
         threshold_pct: Percentual máximo permitido de valores ausentes
+        null_counts: Contagem de nulos por coluna pré-calculada (opcional)
         
     Returns:
         Tupla (is_valid, columns_above_threshold)
@@ -125,11 +160,14 @@ def validate_missing_values(
     if df is None or df.empty:
         return False, {}
         
-    # Calcula percentual de nulos por coluna
-    null_pct = df.isnull().mean() * 100
+    # count() conta não-nulos por coluna sem materializar a matriz booleana
+    if null_counts is None:
+        null_counts = len(df) - df.count()
+    null_pct = null_counts.to_numpy(dtype=np.float64) / len(df) * 100
     
     # Filtra colunas acima do limite
-    columns_above_threshold = null_pct[null_pct > threshold_pct].to_dict()
+    above = null_pct > threshold_pct
+    columns_above_threshold = dict(zip(null_counts.index[above], null_pct[above].tolist()))
     
     is_valid = len(columns_above_threshold) == 0
     
@@ -156,7 +194,7 @@ def validate_duplicates(
         return True, 0
         
     # Conta duplicados
-    duplicate_count = df.duplicated(subset=subset).sum()
+    duplicate_count = int(_duplicated_by_hash(df, subset=subset).sum())
     
     is_valid = duplicate_count == 0
     
@@ -195,6 +233,10 @@ def validate_dataset(
     results = {}
     is_valid = True
     
+    # Metadados calculados uma única vez e compartilhados entre as validações
+    dtypes = df.dtypes
+    null_counts = len(df) - df.count()
+    
     # Valida presença de colunas
     if required_columns:
         cols_valid, missing_cols = validate_column_presence(df, required_columns)
@@ -203,18 +245,20 @@ def validate_dataset(
         
     # Valida tipos de dados
     if type_dict:
-        types_valid, invalid_types = validate_data_types(df, type_dict)
+        types_valid, invalid_types = validate_data_types(df, type_dict, dtypes=dtypes)
         results["invalid_types"] = invalid_types
         is_valid = is_valid and types_valid
         
     # Valida intervalos
     if range_dict:
-        ranges_valid, out_of_range = validate_value_ranges(df, range_dict)
+        ranges_valid, out_of_range = validate_value_ranges(df, range_dict, dtypes=dtypes)
         results["out_of_range"] = out_of_range
         is_valid = is_valid and ranges_valid
         
     # Valida valores ausentes
-    nulls_valid, null_cols = validate_missing_values(df, null_threshold_pct)
+    nulls_valid, null_cols = validate_missing_values(
+        df, null_threshold_pct, null_counts=null_counts
+    )
     results["null_columns"] = null_cols
     is_valid = is_valid and nulls_valid
     
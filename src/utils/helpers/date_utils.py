@@ -1,10 +1,87 @@
 # src/utils/helpers/date_utils.py
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union, Tuple
 
+# Formatos de data reconhecidos a partir de uma amostra (padrão, formato)
+_DATE_FORMATS = [
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d'),
+    (re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2})?'), 'ISO8601'),
+    (re.compile(r'^\d{2}/\d{2}/\d{4}$'), '%d/%m/%Y'),
+    (re.compile(r'^\d{4}-\d{2}$'), '%Y-%m'),
+    (re.compile(r'^\d{2}/\d{4}$'), '%m/%Y'),
+    (re.compile(r'^\d{6}$'), '%Y%m'),
+]
+
+def _detect_date_format(series: pd.Series) -> Optional[str]:
+    """
+    Detecta o formato de data a partir do primeiro valor não nulo.
+    
+    Args:
+        series: Série com datas em texto
+        
+    Returns:
+        Formato para pd.to_datetime ou None se não reconhecido
+    """
+    first_valid = series.first_valid_index()
+    if first_valid is None:
+        return None
+        
+    sample = series.loc[first_valid]
+    if not isinstance(sample, str):
+        return None
+        
+    sample = sample.strip()
+    for pattern, fmt in _DATE_FORMATS:
+        if pattern.match(sample):
+            return fmt
+            
+    return None
+
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """
+    Converte uma série para datetime usando o caminho mais específico possível.
+    
+    Inteiros são tratados como epoch (unidade inferida pela magnitude) e textos
+    com formato reconhecido usam o parser especializado; valores que não seguem
+    o formato detectado caem no parser genérico.
+    
+    Args:
+        series: Série a ser convertida
+        
+    Returns:
+        Série datetime (valores inválidos viram NaT)
+    """
+    if pd.api.types.is_integer_dtype(series):
+        magnitude = series.abs().max()
+        if magnitude < 1e11:
+            unit = 's'
+        elif magnitude < 1e14:
+            unit = 'ms'
+        elif magnitude < 1e17:
+            unit = 'us'
+        else:
+            unit = 'ns'
+        return pd.to_datetime(series, unit=unit, errors='coerce')
+    
+    fmt = _detect_date_format(series)
+    if fmt is None:
+        return pd.to_datetime(series, errors='coerce')
+        
+    parsed = pd.to_datetime(series, format=fmt, errors='coerce', cache=True)
+    
+    # Valores fora do formato detectado seguem pelo parser genérico
+    unparsed = parsed.isna() & series.notna()
+    if unparsed.any():
+        parsed[unparsed] = pd.to_datetime(series[unparsed], errors='coerce')
+        
+    return parsed
+
 def standardize_date_column(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFrame:
     """
     Padroniza coluna de data para datetime.
@@ -16,7 +93,7 @@ def standardize_date_column(df: pd.DataFrame, date_col: str = 'date') -> pd.Data
     Returns:
         DataFrame com data padronizada
     """
-    result_df = df.copy()
+    result_df = df.copy(deep=False)
     
     # Verifica se a coluna existe
     if date_col not in result_df.columns:
@@ -30,7 +107,8 @@ def standardize_date_column(df: pd.DataFrame, date_col: str = 'date') -> pd.Data
     
     # Converte para datetime
     try:
-        result_df[date_col] = pd.to_datetime(result_df[date_col], errors='coerce')
+        if not pd.api.types.is_datetime64_any_dtype(result_df[date_col]):
+            result_df[date_col] = _parse_dates(result_df[date_col])
         
         # Verifica se há datas nulas
         null_dates = result_df[date_col].isnull().sum()
@@ -42,6 +120,28 @@ def standardize_date_column(df: pd.DataFrame, date_col: str = 'date') -> pd.Data
         
     return result_df
 
+def _period_categorical(periods: np.ndarray, is_nat: np.ndarray, label) -> pd.Categorical:
+    """
+    Monta um Categorical ordenado a partir de períodos inteiros.
+    
+    Args:
+        periods: Períodos inteiros (ex: meses desde 1970)
+        is_nat: Máscara de datas ausentes (código -1)
+        label: Função que formata um período como texto
+        
+    Returns:
+        Categorical com um rótulo por período distinto
+    """
+    unique_periods, codes = np.unique(periods[~is_nat], return_inverse=True)
+    all_codes = np.full(len(periods), -1, dtype=np.int32)
+    all_codes[~is_nat] = codes
+    
+    return pd.Categorical.from_codes(
+        all_codes,
+        categories=[label(p) for p in unique_periods],
+        ordered=True
+    )
+
 def create_date_features(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFrame:
     """
     Cria features baseadas na data (ano, mês, trimestre, etc).
@@ -53,7 +153,7 @@ def create_date_features(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFra
     Returns:
         DataFrame com features de data adicionadas
     """
-    result_df = df.copy()
+    result_df = df.copy(deep=False)
     
     # Verifica se a coluna existe e é datetime
     if date_col not in result_df.columns:
@@ -65,12 +165,35 @@ def create_date_features(df: pd.DataFrame, date_col: str = 'date') -> pd.DataFra
         if not pd.api.types.is_datetime64_any_dtype(result_df[date_col]):
             result_df[date_col] = pd.to_datetime(result_df[date_col], errors='coerce')
             
-        # Cria features
-        result_df['year'] = result_df[date_col].dt.year
-        result_df['month'] = result_df[date_col].dt.month
-        result_df['quarter'] = result_df[date_col].dt.quarter
-        result_df['year_month'] = result_df[date_col].dt.strftime('%Y-%m')
-        result_df['year_quarter'] = result_df[date_col].dt.to_period('Q').astype(str)
+        # Cria features em uma única passada sobre o array datetime64
+        dates = result_df[date_col]
+        if dates.dt.tz is not None:
+            dates = dates.dt.tz_localize(None)
+        values = dates.to_numpy(dtype='datetime64[ns]')
+        is_nat = np.isnat(values)
+        
+        # Meses desde 1970: ano, mês e trimestre saem de aritmética inteira
+        months = values.astype('datetime64[M]').astype(np.int64)
+        year = months // 12 + 1970
+        month = months % 12 + 1
+        quarter = (month - 1) // 3 + 1
+        
+        # Rótulos categóricos ordenados: cada mês/trimestre distinto é formatado
+        # uma única vez e as linhas guardam apenas o código inteiro
+        year_month = _period_categorical(months, is_nat, lambda m: f"{m // 12 + 1970:04d}-{m % 12 + 1:02d}")
+        year_quarter = _period_categorical(months // 3, is_nat, lambda q: f"{q // 4 + 1970}Q{q % 4 + 1}")
+        
+        if is_nat.any():
+            year, month, quarter = (np.where(is_nat, np.nan, arr) for arr in (year, month, quarter))
+        else:
+            year, month, quarter = (arr.astype(np.int32) for arr in (year, month, quarter))
+        
+        # Novas colunas não copiam os blocos existentes
+        result_df['year'] = year
+        result_df['month'] = month
+        result_df['quarter'] = quarter
+        result_df['year_month'] = year_month
+        result_df['year_quarter'] = year_quarter
         
         logging.info(f"Features de data criadas com sucesso")
             
@@ -95,7 +218,7 @@ def create_time_windows(
     Returns:
         DataFrame com coluna de janela temporal
     """
-    result_df = df.copy()
+    result_df = df.copy(deep=False)
     
     # Verifica se a coluna existe e é datetime
     if date_col not in result_df.columns:
@@ -111,12 +234,52 @@ def create_time_windows(
         if not pd.api.types.is_datetime64_any_dtype(result_df[date_col]):
             result_df[date_col] = pd.to_datetime(result_df[date_col], errors='coerce')
             
-        # Cria coluna de janela
-        result_df['time_window'] = 'other'
+        dates = result_df[date_col].to_numpy(dtype='datetime64[ns]')
         
-        for start_date, end_date, window_name in windows:
-            mask = (result_df[date_col] >= start_date) & (result_df[date_col] <= end_date)
-            result_df.loc[mask, 'time_window'] = window_name
+        # Limites das janelas ordenados pelo início (fim inclusivo); janelas
+        # invertidas (início > fim) não contêm nenhuma data e são descartadas
+        bounds = sorted(
+            (start, end, window_name)
+            for start, end, window_name in (
+                (np.datetime64(pd.Timestamp(start_date), 'ns'),
+                 np.datetime64(pd.Timestamp(end_date), 'ns'),
+                 window_name)
+                for start_date, end_date, window_name in windows
+            )
+            if start <= end
+        )
+        overlapping = any(
+            bounds[i + 1][0] <= bounds[i][1] for i in range(len(bounds) - 1)
+        )
+        
+        if not overlapping:
+            # Bordas [início_0, fim_0 + 1ns, início_1, ...]: o índice retornado
+            # pelo searchsorted seleciona diretamente o nome da janela
+            edges = np.array(
+                [edge for start, end, _ in bounds for edge in (start, end + np.timedelta64(1, 'ns'))],
+                dtype='datetime64[ns]'
+            )
+            names = ['other'] + [label for _, _, name in bounds for label in (name, 'other')]
+            categories = list(dict.fromkeys(names))
+            lookup = np.array([categories.index(name) for name in names])
+            
+            # Códigos do searchsorted viram diretamente os códigos categóricos
+            result_df['time_window'] = pd.Categorical.from_codes(
+                lookup[np.searchsorted(edges, dates, side='right')],
+                categories=categories
+            )
+        else:
+            # Janelas sobrepostas: a última janela informada prevalece
+            values = dates.view('i8')
+            valid = ~np.isnat(dates)
+            time_window = np.full(len(dates), 'other', dtype=object)
+            
+            for start_date, end_date, window_name in windows:
+                start = np.datetime64(pd.Timestamp(start_date), 'ns').view('i8')
+                end = np.datetime64(pd.Timestamp(end_date), 'ns').view('i8')
+                time_window[valid & (values >= start) & (values <= end)] = window_name
+                
+            result_df['time_window'] = pd.Categorical(time_window)
             
         logging.info(f"Janelas temporais criadas com sucesso")
             
@@ -125,12 +288,72 @@ def create_time_windows(
         
     return result_df
 
+# Frequências suportadas pelo caminho Arrow: (unidade do floor_temporal, frequência
+# do período usada para rotular cada bin pelo seu fim, como no pandas)
+_ARROW_RESAMPLE_UNITS = {
+    'D': ('day', 'D'),
+    'W': ('week', 'W-SUN'),
+    'M': ('month', 'M'),
+    'Q': ('quarter', 'Q-DEC'),
+    'Y': ('year', 'A-DEC'),
+    'A': ('year', 'A-DEC'),
+}
+
+_RESAMPLE_AGGREGATIONS = ('mean', 'sum', 'min', 'max', 'last')
+
+def _resample_with_arrow(dates: pd.Series, values: pd.Series, freq: str, agg_func: str) -> pd.Series:
+    """
+    Reamostra uma série agrupando no Arrow por bins de calendário.
+    
+    Args:
+        dates: Série datetime sem timezone
+        values: Série de valores alinhada às datas
+        freq: Frequência presente em _ARROW_RESAMPLE_UNITS
+        agg_func: Função de agregação presente em _RESAMPLE_AGGREGATIONS
+        
+    Returns:
+        Série indexada pelo fim de cada bin, incluindo bins vazios
+    """
+    unit, period_freq = _ARROW_RESAMPLE_UNITS[freq]
+    
+    table = pa.table({
+        'date': pa.array(dates.to_numpy(), from_pandas=True),
+        'value': pa.array(values.to_numpy(), from_pandas=True),
+    })
+    table = table.filter(pc.is_valid(table['date']))
+    table = table.append_column(
+        'bin', pc.floor_temporal(table['date'], unit=unit, week_starts_monday=True)
+    )
+    
+    if agg_func == 'last':
+        # Último valor não nulo de cada bin em ordem cronológica: ordena de forma
+        # estável e usa a posição da linha, independente das threads do Arrow
+        table = table.take(pc.sort_indices(table, sort_keys=[('date', 'ascending')]))
+        table = table.append_column('row', pa.array(np.arange(table.num_rows)))
+        grouped = table.filter(pc.is_valid(table['value'])).group_by('bin').aggregate([('row', 'max')])
+        aggregated = table['value'].take(grouped['row_max'])
+    else:
+        options = pc.ScalarAggregateOptions(min_count=0) if agg_func == 'sum' else None
+        grouped = table.group_by('bin').aggregate([('value', agg_func, options)])
+        aggregated = grouped[f'value_{agg_func}']
+        
+    labels = pd.PeriodIndex(grouped['bin'].to_pandas(), freq=period_freq).end_time.normalize()
+    result = pd.Series(aggregated.to_numpy(zero_copy_only=False), index=labels).sort_index()
+    
+    if result.empty:
+        return result
+        
+    # Reinsere bins vazios como o pandas faz (zero para soma, nulo para os demais)
+    full_range = pd.date_range(result.index[0], result.index[-1], freq=freq)
+    return result.reindex(full_range, fill_value=0 if agg_func == 'sum' else np.nan)
+
 def resample_time_series(
     df: pd.DataFrame, 
     date_col: str = 'date', 
     value_col: str = 'value',
     freq: str = 'M',
-    agg_func: str = 'mean'
+    agg_func: str = 'mean',
+    as_index: bool = False
 ) -> pd.DataFrame:
     """
     Reamostra série temporal para frequência especificada.
@@ -141,51 +364,43 @@ def resample_time_series(
         value_col: Nome da coluna de valor
         freq: Frequência de amostragem ('D', 'W', 'M', 'Q', 'Y')
         agg_func: Função de agregação ('mean', 'sum', 'min', 'max', 'last')
+        as_index: Se True, mantém a data como índice em vez de coluna
         
     Returns:
         DataFrame com dados reamostrados
     """
-    result_df = df.copy()
-    
     # Verifica se as colunas existem
-    if date_col not in result_df.columns or value_col not in result_df.columns:
+    if date_col not in df.columns or value_col not in df.columns:
         logging.error(f"Colunas necessárias não encontradas: {date_col}, {value_col}")
-        return result_df
+        return df
         
     try:
+        # Trabalha apenas sobre as duas colunas envolvidas, sem copiar o DataFrame
+        dates = df[date_col]
+        values = df[value_col]
+        
         # Certifica que é datetime
-        if not pd.api.types.is_datetime64_any_dtype(result_df[date_col]):
-            result_df[date_col] = pd.to_datetime(result_df[date_col], errors='coerce')
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce')
             
-        # Configura índice como data
-        result_df = result_df.set_index(date_col)
-        
-        # Mapeia função de agregação
-        if agg_func == 'mean':
-            agg_method = np.mean
-        elif agg_func == 'sum':
-            agg_method = np.sum
-        elif agg_func == 'min':
-            agg_method = np.min
-        elif agg_func == 'max':
-            agg_method = np.max
-        elif agg_func == 'last':
-            agg_method = 'last'
+        if agg_func not in _RESAMPLE_AGGREGATIONS:
+            logging.warning(f"Função de agregação '{agg_func}' não suportada, usando 'mean'")
+            agg_func = 'mean'
+        
+        # Reamostra: agrupamento em C no Arrow para frequências de calendário
+        # simples; demais casos (ex: '2W', timezone) seguem pelo pandas
+        if freq in _ARROW_RESAMPLE_UNITS and dates.dt.tz is None:
+            resampled = _resample_with_arrow(dates, values, freq, agg_func)
         else:
-            agg_method = np.mean
-            
-        # Reamostra
-        resampled = result_df[value_col].resample(freq).agg(agg_method)
+            resampled = pd.Series(values.to_numpy(), index=dates).resample(freq).agg(agg_func)
         
-        # Converte de volta para DataFrame
-        resampled_df = resampled.reset_index()
-        resampled_df.columns = [date_col, value_col]
+        resampled_df = resampled.rename_axis(date_col).to_frame(value_col)
         
         logging.info(f"Série temporal reamostrada para frequência '{freq}'")
-        return resampled_df
+        return resampled_df if as_index else resampled_df.reset_index()
             
     except Exception as e:
         logging.error(f"Erro ao reamostrar série temporal: {str(e)}")
         
     # Em caso de erro, retorna DataFrame original
-    return df
\ No newline at end of file
+    return df
@@ -1,10 +1,26 @@
 # src/utils/helpers/logging_utils.py
+import atexit
 import logging
+import logging.handlers
 import sys
 import os
-from datetime import datetime
+import weakref
+from functools import lru_cache
+from time import perf_counter_ns
 from typing import Dict, Optional, Any, Union
 
+# Registros acumulados antes de escrever no arquivo de log
+LOG_BUFFER_CAPACITY = 1024
+
+# Buffers de arquivo ativos, descarregados por um único hook de atexit
+_buffered_handlers: "weakref.WeakSet[logging.handlers.MemoryHandler]" = weakref.WeakSet()
+_atexit_registered = False
+
+def _flush_buffered_handlers() -> None:
+    """Descarrega os buffers de log ainda abertos ao final do processo."""
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
 def setup_logging(
     log_level: str = 'INFO',
     log_format: str = None,
@@ -15,6 +31,10 @@ def setup_logging(
     """
     Configura logging com opções personalizadas.
     
+    O arquivo de log é escrito em lotes via MemoryHandler: registros DEBUG/INFO
+    podem aparecer com atraso, até um ERROR, o buffer encher ou o processo
+    terminar.
+    
     Args:
         log_level: Nível de logging (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Formato personalizado para logs
@@ -25,6 +45,8 @@ def setup_logging(
     Returns:
         Logger configurado
     """
+    global _atexit_registered
+    
     # Mapeia string de nível para constante do logging
     level_map = {
         'DEBUG': logging.DEBUG,
@@ -47,9 +69,14 @@ def setup_logging(
     logger = logging.getLogger(app_name)
     logger.setLevel(log_level_value)
     
-    # Remove handlers existentes para evitar duplicação
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    # Remove e fecha handlers existentes para evitar duplicação (e não deixar
+    # arquivos abertos a cada reconfiguração)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        target = getattr(handler, 'target', None)
+        handler.close()  # MemoryHandler descarrega o buffer ao fechar
+        if target is not None:
+            target.close()
     
     # Adiciona handler de arquivo se especificado
     if log_file:
@@ -60,7 +87,18 @@ def setup_logging(
             
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Agrupa as escritas em vez de um write() por registro
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        _buffered_handlers.add(buffered_handler)
+        if not _atexit_registered:
+            atexit.register(_flush_buffered_handlers)
+            _atexit_registered = True
+        logger.addHandler(buffered_handler)
     
     # Adiciona handler de console se solicitado
     if log_to_console:
@@ -84,6 +122,19 @@ def get_logger(name: str = None) -> logging.Logger:
     if name is None:
         name = 'economic-indicators'
     
+    return _get_logger_cached(name)
+
+@lru_cache(maxsize=128)
+def _get_logger_cached(name: str) -> logging.Logger:
+    """
+    Obtém e configura o logger apenas na primeira chamada para cada nome.
+    
+    Args:
+        name: Nome do logger
+        
+    Returns:
+        Logger configurado
+    """
     logger = logging.getLogger(name)
     
     # Se o logger não tiver handlers, configura com padrões
@@ -111,26 +162,24 @@ def log_execution_time(
     
     def decorator(func):
         def wrapper(*args, **kwargs):
-            # Registra início
-            start_time = datetime.now()
-            logger.info(f"{operation_name} iniciada")
+            # Registra início (relógio monotônico)
+            start = perf_counter_ns()
+            logger.info("%s iniciada", operation_name)
             
             try:
                 # Executa função
                 result = func(*args, **kwargs)
                 
                 # Registra conclusão com sucesso
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.info(f"{operation_name} concluída com sucesso em {duration:.2f} segundos")
+                duration = (perf_counter_ns() - start) / 1e9
+                logger.info("%s concluída com sucesso em %.2f segundos", operation_name, duration)
                 
                 return result
                 
             except Exception as e:
                 # Registra erro
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.error(f"{operation_name} falhou após {duration:.2f} segundos. Erro: {str(e)}")
+                duration = (perf_counter_ns() - start) / 1e9
+                logger.error("%s falhou após %.2f segundos. Erro: %s", operation_name, duration, e)
                 raise
                 
         return wrapper
@@ -154,30 +203,42 @@ def log_dataframe_stats(
         logger = get_logger()
         
     if df is None:
-        logger.warning(f"{label} é None")
+        logger.warning("%s é None", label)
         return
         
     if df.empty:
-        logger.warning(f"{label} está vazio")
+        logger.warning("%s está vazio", label)
+        return
+        
+    # Evita varrer o DataFrame quando as mensagens seriam descartadas
+    if not logger.isEnabledFor(logging.INFO):
         return
         
-    # Loga estatísticas básicas
-    logger.info(f"=== Estatísticas: {label} ===")
-    logger.info(f"Dimensões: {df.shape}")
-    logger.info(f"Colunas: {df.columns.tolist()}")
-    logger.info(f"Tipos de dados: {df.dtypes.to_dict()}")
-    logger.info(f"Valores nulos (total): {df.isnull().sum().sum()}")
+    # Contagem de nulos calculada uma única vez e reaproveitada
+    null_counts = len(df) - df.count()
+    total_nulls = int(null_counts.sum())
+        
+    # Monta todas as linhas e emite um único registro de log
+    lines = [
+        f"=== Estatísticas: {label} ===",
+        f"Dimensões: {df.shape}",
+        f"Colunas: {df.columns.tolist()}",
+        f"Tipos de dados: {df.dtypes.to_dict()}",
+        f"Valores nulos (total): {total_nulls}",
+    ]
     
     # Estatística de valores nulos por coluna se houver
-    if df.isnull().sum().sum() > 0:
-        null_counts = df.isnull().sum()
+    if total_nulls > 0:
         null_cols = null_counts[null_counts > 0].to_dict()
-        logger.info(f"Valores nulos por coluna: {null_cols}")
+        lines.append(f"Valores nulos por coluna: {null_cols}")
+        
+    # Estatísticas para colunas numéricas (bool fica de fora, como em select_dtypes)
+    num_cols = [col for col, dtype in df.dtypes.items() if dtype.kind in 'iufc']
+    if num_cols:
+        stats = df[num_cols].agg(['count', 'mean', 'std', 'min', 'max'])
+        lines.append(f"Estatísticas numéricas: {stats.to_dict()}")
         
-    # Estatísticas para colunas numéricas
-    num_cols = df.select_dtypes(include=['number']).columns
-    if len(num_cols) > 0:
-        logger.info(f"Estatísticas numéricas: {df[num_cols].describe().to_dict()}")
+    logger.info("\n".join(lines))
 
 def log_process_result(
     logger: logging.Logger,
@@ -194,18 +255,22 @@ def log_process_result(
         success: Se o processo foi bem-sucedido
         details: Detalhes adicionais do processo
     """
+    # Nada a montar se o nível do registro será descartado
+    if not logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+        return
+        
     if details is None:
         details = {}
         
     if success:
-        logger.info(f"✅ {process_name} concluído com sucesso.")
-        
-        if details:
-            for key, value in details.items():
-                logger.info(f"  - {key}: {value}")
+        lines = [f"✅ {process_name} concluído com sucesso."]
     else:
-        logger.error(f"❌ {process_name} falhou.")
+        lines = [f"❌ {process_name} falhou."]
         
-        if details:
-            for key, value in details.items():
-                logger.error(f"  - {key}: {value}")
\ No newline at end of file
+    # Detalhes vão no mesmo registro do cabeçalho
+    lines.extend(f"  - {key}: {value}" for key, value in details.items())
+    
+    if success:
+        logger.info("\n".join(lines))
+    else:
+        logger.error("\n".join(lines))
\ No newline at end of file
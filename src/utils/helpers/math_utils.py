@@ -1,14 +1,197 @@
 # src/utils/helpers/math_utils.py
+import os
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Optional, Union, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union, Tuple, Any
+
+# numba é opcional: sem ele os cálculos por grupo usam o groupby do pandas
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Abaixo deste número de linhas o custo de criar threads supera o ganho
+PARALLEL_MIN_ROWS = 100_000
+
+# Séries a partir deste tamanho usam os kernels numba (quando disponível)
+NUMBA_MIN_ROWS = 1_000_000
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _group_cumsum(values, group_ids, n_groups):
+        """Soma acumulada por grupo em uma única passada (NaN é ignorado)."""
+        totals = np.zeros(n_groups)
+        out = np.empty_like(values)
+        for i in range(values.shape[0]):
+            g = group_ids[i]
+            if g < 0 or np.isnan(values[i]):
+                out[i] = np.nan
+            else:
+                totals[g] += values[i]
+                out[i] = totals[g]
+        return out
+
+    @njit(cache=True)
+    def _group_first(values, group_ids, n_groups):
+        """Valor da primeira linha de cada grupo (mesmo se nulo), propagado para todas as linhas."""
+        first = np.full(n_groups, np.nan)
+        seen = np.zeros(n_groups, dtype=np.bool_)
+        for i in range(values.shape[0]):
+            g = group_ids[i]
+            if g >= 0 and not seen[g]:
+                seen[g] = True
+                first[g] = values[i]
+        out = np.empty_like(values)
+        for i in range(values.shape[0]):
+            g = group_ids[i]
+            out[i] = first[g] if g >= 0 else np.nan
+        return out
+
+    @njit(cache=True)
+    def _group_mean_last(values, dates_ns, group_ids, n_groups):
+        """Média (ignorando NaN) e maior data de cada grupo em uma única passada."""
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        last = np.full(n_groups, np.iinfo(np.int64).min, dtype=np.int64)
+        for i in range(values.shape[0]):
+            g = group_ids[i]
+            if dates_ns[i] > last[g]:
+                last[g] = dates_ns[i]
+            if not np.isnan(values[i]):
+                sums[g] += values[i]
+                counts[g] += 1
+        means = np.full(n_groups, np.nan)
+        for g in range(n_groups):
+            if counts[g] > 0:
+                means[g] = sums[g] / counts[g]
+        return means, last
+
+def _use_numba(values: pd.Series) -> bool:
+    """Indica se a série é grande e float o bastante para os kernels numba."""
+    return NUMBA_AVAILABLE and len(values) >= NUMBA_MIN_ROWS and values.dtype.kind == 'f'
+
+def _parallel_apply(tasks: List[Tuple[str, Callable[[], Any]]], n_rows: int) -> Dict[str, Any]:
+    """
+    Executa cálculos independentes por coluna em threads.
+    
+    As operações numéricas do pandas/NumPy liberam o GIL, então as tarefas se
+    sobrepõem em múltiplos núcleos. Séries curtas são calculadas em série.
+    
+    Args:
+        tasks: Lista de pares (nome, função sem argumentos)
+        n_rows: Número de linhas da série processada
+        
+    Returns:
+        Dicionário {nome: resultado}
+    """
+    if len(tasks) < 2 or n_rows < PARALLEL_MIN_ROWS:
+        return {name: func() for name, func in tasks}
+        
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(name, executor.submit(func)) for name, func in tasks]
+        return {name: future.result() for name, future in futures}
+
+def _guarded(func: Callable[[], Any], var_type: str) -> Callable[[], Any]:
+    """
+    Envolve o cálculo de uma variação, logando o erro e retornando None.
+    
+    Args:
+        func: Função que calcula a variação
+        var_type: Tipo de variação (para a mensagem de log)
+        
+    Returns:
+        Função que nunca propaga exceções
+    """
+    def run():
+        try:
+            return func()
+        except Exception as e:
+            logging.error(f"Erro ao calcular variação {var_type}: {str(e)}")
+            return None
+    return run
+
+def _pct(values: np.ndarray, periods: int, multiply: float) -> np.ndarray:
+    """
+    Variação percentual entre cada valor e o de `periods` posições antes.
+    
+    Args:
+        values: Array da série (float64)
+        periods: Defasagem em número de linhas (>= 1)
+        multiply: Fator aplicado ao resultado (ex: 100)
+        
+    Returns:
+        Array com NaN nas primeiras `periods` posições
+    """
+    if periods < 1:
+        raise ValueError(f"periods deve ser >= 1, recebido: {periods}")
+        
+    out = np.full_like(values, np.nan)
+    if periods < len(values):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[periods:] = (values[periods:] / values[:-periods] - 1.0) * multiply
+    return out
+
+def _diff(values: np.ndarray, periods: int, multiply: float) -> np.ndarray:
+    """
+    Diferença entre cada valor e o de `periods` posições antes.
+    
+    Args:
+        values: Array da série (float64)
+        periods: Defasagem em número de linhas (>= 1)
+        multiply: Fator aplicado ao resultado
+        
+    Returns:
+        Array com NaN nas primeiras `periods` posições
+    """
+    if periods < 1:
+        raise ValueError(f"periods deve ser >= 1, recebido: {periods}")
+        
+    out = np.full_like(values, np.nan)
+    if periods < len(values):
+        out[periods:] = (values[periods:] - values[:-periods]) * multiply
+    return out
+
+# Kernel de cálculo para cada tipo de variação suportado
+_VARIATION_KERNELS = {
+    'pct_change': _pct,
+    'year_over_year': _pct,
+    'diff': _diff,
+}
+
+def _append_columns(df: pd.DataFrame, columns: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Adiciona várias colunas ao DataFrame de uma só vez.
+    
+    Um único concat evita a fragmentação de blocos causada por inserções
+    sucessivas. Colunas já existentes são sobrescritas no lugar.
+    
+    Args:
+        df: DataFrame de destino
+        columns: Dicionário {nome: valores}
+        
+    Returns:
+        DataFrame com as colunas adicionadas
+    """
+    existing = [name for name in columns if name in df.columns]
+    for name in existing:
+        df[name] = columns[name]
+        
+    new_columns = {name: values for name, values in columns.items() if name not in df.columns}
+    if not new_columns:
+        return df
+        
+    return pd.concat([df, pd.DataFrame(new_columns, index=df.index)], axis=1, copy=False)
 
 def calculate_variations(
     df: pd.DataFrame, 
     value_col: str = 'value', 
     date_col: str = 'date',
-    variations: Dict[str, Dict] = None
+    variations: Dict[str, Dict] = None,
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Calcula variações temporais para uma série.
@@ -18,11 +201,12 @@ def calculate_variations(
         value_col: Nome da coluna de valor
         date_col: Nome da coluna de data
         variations: Dicionário com configurações de variações a calcular
+        copy: Se False, dispensa a cópia inicial e pode alterar o DataFrame recebido
         
     Returns:
         DataFrame com variações calculadas
     """
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Verifica se as colunas existem
     if value_col not in result_df.columns or date_col not in result_df.columns:
@@ -36,34 +220,46 @@ def calculate_variations(
             'year_over_year': {'periods': 12, 'column': 'year_over_year_pct', 'multiply': 100}
         }
         
-    # Ordena por data para garantir cálculos corretos
-    result_df = result_df.sort_values(date_col)
+    # Ordena por data para garantir cálculos corretos (séries já ordenadas,
+    # o caso comum vindo dos coletores, dispensam a ordenação e a cópia)
+    if not result_df[date_col].is_monotonic_increasing:
+        result_df = result_df.sort_values(date_col, kind='mergesort')
     
-    # Calcula cada variação
+    # Array da série extraído uma vez e compartilhado por todas as variações
+    try:
+        values = result_df[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    except (TypeError, ValueError) as e:
+        logging.error(f"Erro ao calcular variações: {str(e)}")
+        return result_df
+        
+    # Monta uma tarefa independente para cada variação
+    tasks = []
     for var_type, config in variations.items():
+        kernel = _VARIATION_KERNELS.get(var_type)
+        if kernel is None:
+            continue
+            
         periods = config.get('periods', 1)
         col_name = config.get('column', f'{var_type}_{periods}')
         multiply = config.get('multiply', 1)
         
-        try:
-            # Calcula variação
-            if var_type == 'pct_change':
-                result_df[col_name] = result_df[value_col].pct_change(periods=periods) * multiply
-            elif var_type == 'diff':
-                result_df[col_name] = result_df[value_col].diff(periods=periods) * multiply
-            elif var_type == 'year_over_year':
-                result_df[col_name] = result_df[value_col].pct_change(periods=periods) * multiply
-                
-        except Exception as e:
-            logging.error(f"Erro ao calcular variação {var_type}: {str(e)}")
-            
-    return result_df
+        func = lambda k=kernel, p=periods, m=multiply: k(values, p, m)
+        tasks.append((col_name, _guarded(func, var_type)))
+        
+    # Calcula as variações (em paralelo para séries longas)
+    results = _parallel_apply(tasks, len(result_df))
+    return _append_columns(
+        result_df,
+        {col_name: variation for col_name, variation in results.items() if variation is not None}
+    )
 
 def calculate_moving_average(
     df: pd.DataFrame,
     value_col: str = 'value',
     window: int = 3,
-    result_col: str = None
+    result_col: str = None,
+    copy: bool = True,
+    dtype: np.dtype = np.float64
 ) -> pd.DataFrame:
     """
     Calcula média móvel para uma série.
@@ -73,11 +269,14 @@ def calculate_moving_average(
         value_col: Nome da coluna de valor
         window: Tamanho da janela para média móvel
         result_col: Nome da coluna para o resultado
+        copy: Se False, dispensa a cópia inicial e pode alterar o DataFrame recebido
+        dtype: Tipo float usado nos cálculos e no resultado; np.float32 reduz
+            pela metade a memória trafegada, com ~7 dígitos de precisão
         
     Returns:
         DataFrame com média móvel calculada
     """
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Verifica se a coluna existe
     if value_col not in result_df.columns:
@@ -89,19 +288,88 @@ def calculate_moving_average(
         result_col = f'moving_avg_{window}'
         
     try:
-        # Calcula média móvel
-        result_df[result_col] = result_df[value_col].rolling(window=window).mean()
+        values = result_df[value_col]
+        arr = values.to_numpy(dtype=dtype, na_value=np.nan) if pd.api.types.is_numeric_dtype(values) else None
+        
+        # Sem nulos, a média móvel sai de uma única soma acumulada (sempre
+        # acumulada em float64 para não perder precisão em séries longas)
+        if arr is not None and 0 < window <= len(arr) and not np.isnan(arr).any():
+            cumsum = np.concatenate(([0.0], np.cumsum(arr, dtype=np.float64)))
+            moving_avg = np.empty_like(arr)
+            moving_avg[:window - 1] = np.nan
+            moving_avg[window - 1:] = (cumsum[window:] - cumsum[:-window]) / window
+            result_df[result_col] = moving_avg
+        elif arr is not None:
+            # Calcula média móvel
+            series = pd.Series(arr, index=result_df.index)
+            result_df[result_col] = series.rolling(window=window).mean().astype(dtype, copy=False)
+        else:
+            result_df[result_col] = values.rolling(window=window).mean()
         
     except Exception as e:
         logging.error(f"Erro ao calcular média móvel: {str(e)}")
         
     return result_df
 
+def aggregate_monthly(
+    df: pd.DataFrame,
+    date_col: str = 'date',
+    value_col: str = 'value'
+) -> pd.DataFrame:
+    """
+    Agrega uma série (ex: diária) em valores mensais.
+    
+    Cada mês recebe a média dos valores e a última data observada. As chaves
+    de mês saem de aritmética inteira sobre datetime64, sem groupby do pandas.
+    
+    Args:
+        df: DataFrame com dados da série
+        date_col: Nome da coluna de data (datetime64)
+        value_col: Nome da coluna de valor
+        
+    Returns:
+        DataFrame com colunas date, value, year e month, ordenado por mês
+    """
+    if value_col not in df.columns or date_col not in df.columns:
+        logging.error(f"Colunas necessárias não encontradas: {value_col}, {date_col}")
+        return pd.DataFrame(columns=[date_col, value_col, 'year', 'month'])
+        
+    dates = df[date_col].to_numpy(dtype='datetime64[ns]')
+    values = df[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    # Linhas sem data não pertencem a nenhum mês
+    valid = ~np.isnat(dates)
+    dates, values = dates[valid], values[valid]
+    
+    # Meses desde 1970 como chave; np.unique já devolve os meses ordenados
+    month_keys, group_ids = np.unique(dates.astype('datetime64[M]').astype(np.int64), return_inverse=True)
+    n_groups = len(month_keys)
+    dates_ns = dates.view(np.int64)
+    
+    if _use_numba(df[value_col]):
+        means, last = _group_mean_last(values, dates_ns, group_ids, n_groups)
+    else:
+        not_nan = ~np.isnan(values)
+        sums = np.bincount(group_ids, weights=np.where(not_nan, values, 0.0), minlength=n_groups)
+        counts = np.bincount(group_ids, weights=not_nan, minlength=n_groups)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.where(counts > 0, sums / counts, np.nan)
+        last = np.full(n_groups, np.iinfo(np.int64).min, dtype=np.int64)
+        np.maximum.at(last, group_ids, dates_ns)
+        
+    return pd.DataFrame({
+        date_col: last.view('datetime64[ns]'),
+        value_col: means,
+        'year': month_keys // 12 + 1970,
+        'month': month_keys % 12 + 1
+    })
+
 def calculate_cumulative_values(
     df: pd.DataFrame,
     value_col: str = 'value',
     group_col: str = None,
-    result_col: str = 'cumulative_value'
+    result_col: str = 'cumulative_value',
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Calcula valores cumulativos, opcionalmente por grupo.
@@ -111,11 +379,12 @@ def calculate_cumulative_values(
         value_col: Nome da coluna de valor
         group_col: Nome da coluna para agrupar (opcional)
         result_col: Nome da coluna para o resultado
+        copy: Se False, dispensa a cópia inicial e pode alterar o DataFrame recebido
         
     Returns:
         DataFrame com valores cumulativos
     """
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Verifica se a coluna existe
     if value_col not in result_df.columns:
@@ -125,7 +394,13 @@ def calculate_cumulative_values(
     try:
         # Calcula cumulativo (com ou sem agrupamento)
         if group_col and group_col in result_df.columns:
-            result_df[result_col] = result_df.groupby(group_col)[value_col].cumsum()
+            if _use_numba(result_df[value_col]):
+                group_ids, groups = pd.factorize(result_df[group_col], sort=False)
+                result_df[result_col] = _group_cumsum(
+                    result_df[value_col].to_numpy(dtype=np.float64, na_value=np.nan), group_ids, len(groups)
+                )
+            else:
+                result_df[result_col] = result_df.groupby(group_col)[value_col].cumsum()
         else:
             result_df[result_col] = result_df[value_col].cumsum()
         
@@ -139,7 +414,8 @@ def calculate_year_to_date(
     value_col: str = 'value',
     date_col: str = 'date',
     year_col: str = 'year',
-    result_col: str = 'year_to_date_pct'
+    result_col: str = 'year_to_date_pct',
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Calcula variação percentual acumulada no ano (year-to-date).
@@ -150,11 +426,12 @@ def calculate_year_to_date(
         date_col: Nome da coluna de data
         year_col: Nome da coluna de ano (ou criará se não existir)
         result_col: Nome da coluna para o resultado
+        copy: Se False, dispensa a cópia inicial e pode alterar o DataFrame recebido
         
     Returns:
         DataFrame com YTD calculado
     """
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Verifica se as colunas necessárias existem
     if value_col not in result_df.columns:
@@ -174,10 +451,21 @@ def calculate_year_to_date(
             return result_df
             
     try:
-        # Calcula YTD
-        result_df[result_col] = result_df.groupby(year_col)[value_col].transform(
-            lambda x: (x / x.iloc[0] - 1) * 100 if len(x) > 0 else 0
-        )
+        # Calcula YTD sobre o valor da primeira linha de cada ano (nulo se ela
+        # for nula, como x.iloc[0]), sem callback Python por grupo
+        values = result_df[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        group_ids, groups = pd.factorize(result_df[year_col], sort=False)
+        if _use_numba(result_df[value_col]):
+            base = _group_first(values, group_ids, len(groups))
+        else:
+            # Posição da primeira ocorrência de cada ano (-1 = ano ausente)
+            ids, first_pos = np.unique(group_ids, return_index=True)
+            first = np.full(len(groups), np.nan)
+            first[ids[ids >= 0]] = values[first_pos[ids >= 0]]
+            base = np.where(group_ids >= 0, first[group_ids], np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ytd = (values / base - 1.0) * 100.0
+        result_df[result_col] = np.where(base != 0, ytd, np.nan)
         
     except Exception as e:
         logging.error(f"Erro ao calcular YTD: {str(e)}")
@@ -189,7 +477,9 @@ def calculate_volatility(
     value_col: str = 'value',
     group_col: str = None,
     window: int = None,
-    result_col: str = 'volatility'
+    result_col: str = 'volatility',
+    copy: bool = True,
+    dtype: np.dtype = np.float64
 ) -> pd.DataFrame:
     """
     Calcula volatilidade (desvio padrão) de uma série.
@@ -200,11 +490,14 @@ def calculate_volatility(
         group_col: Nome da coluna para agrupar (opcional)
         window: Tamanho da janela móvel (opcional)
         result_col: Nome da coluna para o resultado
+        copy: Se False, dispensa a cópia inicial e pode alterar o DataFrame recebido
+        dtype: Tipo float usado nos cálculos e no resultado; np.float32 reduz
+            pela metade a memória trafegada, com ~7 dígitos de precisão
         
     Returns:
         DataFrame com volatilidade calculada
     """
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Verifica se a coluna existe
     if value_col not in result_df.columns:
@@ -212,18 +505,22 @@ def calculate_volatility(
         return result_df
         
     try:
+        values = pd.Series(result_df[value_col].to_numpy(dtype=dtype, na_value=np.nan), index=result_df.index)
+        
         # Calcula volatilidade por grupo
         if group_col and group_col in result_df.columns:
             # Usando método transform para manter o tamanho do DataFrame
-            result_df[result_col] = result_df.groupby(group_col)[value_col].transform('std')
+            volatility = values.groupby(result_df[group_col]).transform('std')
             
         # Calcula volatilidade com janela móvel
         elif window:
-            result_df[result_col] = result_df[value_col].rolling(window=window).std()
+            volatility = values.rolling(window=window).std()
             
         # Calcula volatilidade global
         else:
-            result_df[result_col] = result_df[value_col].std()
+            volatility = np.full(len(values), values.std(), dtype=dtype)
+            
+        result_df[result_col] = np.asarray(volatility, dtype=dtype)
         
     except Exception as e:
         logging.error(f"Erro ao calcular volatilidade: {str(e)}")
@@ -235,7 +532,9 @@ def calculate_financial_metrics(
     price_col: str = 'close',
     high_col: str = 'high',
     low_col: str = 'low',
-    date_col: str = 'date'
+    date_col: str = 'date',
+    copy: bool = True,
+    dtype: np.dtype = np.float64
 ) -> pd.DataFrame:
     """
     Calcula métricas financeiras comuns para dados de preços.
@@ -246,11 +545,14 @@ def calculate_financial_metrics(
         high_col: Nome da coluna de máxima
         low_col: Nome da coluna de mínima
         date_col: Nome da coluna de data
+        copy: Se False, dispensa a cópia inicial e pode alterar o DataFrame recebido
+        dtype: Tipo float usado nos cálculos e no resultado; np.float32 reduz
+            pela metade a memória trafegada, com ~7 dígitos de precisão
         
     Returns:
         DataFrame com métricas financeiras calculadas
     """
-    result_df = df.copy()
+    result_df = df.copy() if copy else df
     
     # Verifica se as colunas principais existem
     if price_col not in result_df.columns:
@@ -258,24 +560,41 @@ def calculate_financial_metrics(
         return result_df
         
     try:
-        # Retorno diário/período
-        result_df['return_pct'] = result_df[price_col].pct_change() * 100
+        # Extrai a série de preços uma única vez como array NumPy
+        prices = result_df[price_col].to_numpy(dtype=dtype, na_value=np.nan)
+        price_series = pd.Series(prices)
         
-        # Volatilidade (janela de 20 períodos)
-        result_df['volatility_20'] = result_df[price_col].rolling(window=20).std()
+        def returns():
+            # Retorno diário/período; lacunas são preenchidas com o último preço,
+            # como no pct_change() (retorno 0 na lacuna, não dois NaN)
+            filled = price_series.ffill().to_numpy()
+            out = np.full_like(prices, np.nan)
+            out[1:] = (filled[1:] / filled[:-1] - 1.0) * 100.0
+            return out
+            
+        # Retorno, volatilidade (20 períodos) e médias móveis são independentes;
+        # cada tarefa cria o próprio objeto Rolling (não são thread-safe)
+        metrics = _parallel_apply([
+            ('return_pct', returns),
+            ('volatility_20', lambda: price_series.rolling(window=20).std().to_numpy(dtype=dtype)),
+            ('ma_20', lambda: price_series.rolling(window=20).mean().to_numpy(dtype=dtype)),
+            ('ma_50', lambda: price_series.rolling(window=50).mean().to_numpy(dtype=dtype)),
+        ], len(prices))
         
         # Amplitude, se houver high e low
         if high_col in result_df.columns and low_col in result_df.columns:
-            result_df['amplitude_pct'] = (result_df[high_col] - result_df[low_col]) / result_df[low_col] * 100
+            high = result_df[high_col].to_numpy(dtype=dtype, na_value=np.nan)
+            low = result_df[low_col].to_numpy(dtype=dtype, na_value=np.nan)
+            metrics['amplitude_pct'] = (high - low) / low * 100.0
             
-        # Média móvel de 20 períodos
-        result_df['ma_20'] = result_df[price_col].rolling(window=20).mean()
-        
-        # Média móvel de 50 períodos
-        result_df['ma_50'] = result_df[price_col].rolling(window=50).mean()
-        
         # Sinal de cruzamento de médias móveis
-        result_df['ma_cross_signal'] = np.where(result_df['ma_20'] > result_df['ma_50'], 1, -1)
+        metrics['ma_cross_signal'] = np.where(metrics['ma_20'] > metrics['ma_50'], 1, -1)
+        
+        column_order = ('return_pct', 'volatility_20', 'amplitude_pct', 'ma_20', 'ma_50', 'ma_cross_signal')
+        result_df = _append_columns(
+            result_df,
+            {name: metrics[name] for name in column_order if name in metrics}
+        )
         
         logging.info(f"Métricas financeiras calculadas com sucesso")
         
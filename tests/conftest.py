@@ -14,10 +14,16 @@ from src.utils.aws_utils import S3Handler
 from src.collectors.bcb_collector import BCBCollector
 from src.collectors.ibge_collector import IBGECollector
 from src.collectors.factory import CollectorFactory
+from src.transformers.bronze_to_silver import EconomicIndicatorTransformer
 
 # Desabilita logs durante testes
 logging.basicConfig(level=logging.ERROR)
 
+def pytest_configure(config):
+    """Registra os marcadores customizados usados nos testes."""
+    config.addinivalue_line("markers", "network: testes que acessam APIs externas")
+    config.addinivalue_line("markers", "integration: testes de integração (S3/pipeline completo)")
+
 @pytest.fixture
 def mock_environment():
     """Configura variáveis de ambiente para testes."""
@@ -62,6 +68,27 @@ def s3_handler(mock_environment, mock_aws):
     """Fixture para S3Handler configurado para testes."""
     return S3Handler()
 
+class _Stub:
+    """Substituto de método para monkeypatch: devolve um valor fixo e conta as chamadas."""
+    
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = 0
+    
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.return_value
+
+@pytest.fixture
+def stub():
+    """Fábrica de substitutos simples (_Stub) para uso com monkeypatch.setattr."""
+    return _Stub
+
+@pytest.fixture(scope='session')
+def transformer():
+    """Transformador Bronze para Silver compartilhado pela sessão de testes."""
+    return EconomicIndicatorTransformer()
+
 @pytest.fixture
 def bcb_collector(mock_environment, mock_aws):
     """Coletor BCB para testes."""
@@ -77,10 +104,38 @@ def collector_factory(mock_environment, mock_aws):
     """Factory de coletores para testes."""
     return CollectorFactory
 
+def _read_only_dates(**kwargs):
+    """Datas de pd.date_range como array datetime64 somente leitura."""
+    dates = pd.date_range(**kwargs).to_numpy()
+    dates.setflags(write=False)
+    return dates
+
+# Datas compartilhadas pelos dados de teste de todos os módulos (somente
+# leitura: fatias e DataFrames construídos sobre elas não alteram o original)
+
+@pytest.fixture(scope='session')
+def monthly_dates():
+    """12 datas mensais a partir de 2023-01-01."""
+    return _read_only_dates(start='2023-01-01', periods=12, freq='MS')
+
+@pytest.fixture(scope='session')
+def daily_dates():
+    """60 datas diárias a partir de 2023-01-01."""
+    return _read_only_dates(start='2023-01-01', periods=60, freq='D')
+
+@pytest.fixture(scope='session')
+def quarterly_dates():
+    """4 datas trimestrais a partir de 2023-01-01."""
+    return _read_only_dates(start='2023-01-01', periods=4, freq='QS')
+
 # Datasets de exemplo
+#
+# Cada DataFrame é construído uma única vez por sessão (_*_frame) e as fixtures
+# públicas entregam uma cópia, para que testes que alteram os dados continuem
+# isolados entre si.
 
-@pytest.fixture
-def sample_ipca_data():
+@pytest.fixture(scope='session')
+def _ipca_frame():
     """Dados de exemplo do IPCA para testes."""
     return pd.DataFrame({
         'data': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
@@ -92,7 +147,12 @@ def sample_ipca_data():
     })
 
 @pytest.fixture
-def sample_selic_data():
+def sample_ipca_data(_ipca_frame):
+    """Dados de exemplo do IPCA para testes."""
+    return _ipca_frame.copy()
+
+@pytest.fixture(scope='session')
+def _selic_frame():
     """Dados de exemplo da SELIC para testes."""
     return pd.DataFrame({
         'data': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
@@ -104,7 +164,12 @@ def sample_selic_data():
     })
 
 @pytest.fixture
-def sample_pib_data():
+def sample_selic_data(_selic_frame):
+    """Dados de exemplo da SELIC para testes."""
+    return _selic_frame.copy()
+
+@pytest.fixture(scope='session')
+def _pib_frame():
     """Dados de exemplo do PIB para testes."""
     return pd.DataFrame({
         'data': pd.date_range(start='2023-01-01', periods=4, freq='QS'),
@@ -116,7 +181,12 @@ def sample_pib_data():
     })
 
 @pytest.fixture
-def sample_cambio_data():
+def sample_pib_data(_pib_frame):
+    """Dados de exemplo do PIB para testes."""
+    return _pib_frame.copy()
+
+@pytest.fixture(scope='session')
+def _cambio_frame():
     """Dados de exemplo da taxa de câmbio para testes."""
     return pd.DataFrame({
         'data': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
@@ -127,6 +197,11 @@ def sample_cambio_data():
         'frequency': ['monthly'] * 12
     })
 
+@pytest.fixture
+def sample_cambio_data(_cambio_frame):
+    """Dados de exemplo da taxa de câmbio para testes."""
+    return _cambio_frame.copy()
+
 @pytest.fixture
 def setup_test_data(s3_handler, sample_ipca_data, sample_selic_data, sample_pib_data, sample_cambio_data):
     """Configura dados de teste no bucket."""
@@ -5,6 +5,25 @@ import requests
 import pandas as pd
 from datetime import datetime, timedelta
 
+try:
+    import orjson as _json
+except ImportError:  # orjson é opcional: sem ele usa o json da biblioteca padrão
+    import json as _json
+
+# Sessão compartilhada: reaproveita conexões TCP/TLS entre as chamadas às APIs
+_session = requests.Session()
+_session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Todos os testes deste módulo acessam a rede (excluir com -m "not network")
+pytestmark = pytest.mark.network
+
+BCB_URL = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.433/ultimos/1?formato=json"
+IBGE_URL = "https://servicodados.ibge.gov.br/api/v3/agregados/7062/periodos/201901-202001/variaveis/all"
+
+def _is_reachable(url):
+    """Retorna True se o endpoint responde com status de sucesso."""
+    return _session.get(url, timeout=10).ok
+
 def test_bcb_api_connection():
     """Testa a conexão com a API do Banco Central do Brasil."""
     
@@ -22,10 +41,12 @@ def test_bcb_api_connection():
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = _session.get(url, params=params, timeout=10)
         response.raise_for_status()
         
-        df = pd.DataFrame(response.json())
+        data = _json.loads(response.content)
+        df = pd.DataFrame.from_records(data, columns=('data', 'valor'))
+        df['data'] = pd.to_datetime(df['data'], format='%d/%m/%Y', cache=True)
         
         # Verificações
         assert df is not None
@@ -47,13 +68,13 @@ def test_ibge_api_connection():
     """Testa a conexão com a API do IBGE."""
     
     # URL da API SIDRA para o IPCA-15
-    url = "https://servicodados.ibge.gov.br/api/v3/agregados/7062/periodos/201901-202001/variaveis/all"
+    url = IBGE_URL
     
     try:
-        response = requests.get(url)
+        response = _session.get(url, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json.loads(response.content)
         
         # Verificações
         assert data is not None
@@ -67,6 +88,11 @@ def test_ibge_api_connection():
         print(f"\nErro na conexão com IBGE: {str(e)}")
         pytest.fail(f"Falha na conexão com a API do IBGE: {str(e)}")
 
+@pytest.mark.parametrize('endpoint', [BCB_URL, IBGE_URL])
+def test_api_reachable(endpoint):
+    """Testa se cada endpoint externo está acessível."""
+    assert _is_reachable(endpoint)
+
 if __name__ == "__main__":
     try:
         test_bcb_api_connection()
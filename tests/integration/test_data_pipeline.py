@@ -5,18 +5,18 @@ import os
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 
 from src.collectors.bcb_collector import BCBCollector
 from src.transformers.bronze_to_silver import EconomicIndicatorTransformer
 from src.transformers.silver_to_gold import EconomicIndicatorsGoldTransformer
-from src.utils.aws_utils import S3Handler
 
 # Desabilita logs durante testes
 logging.basicConfig(level=logging.ERROR)
 
 @pytest.mark.integration
-def test_end_to_end_pipeline(setup_test_data):
+def test_end_to_end_pipeline(s3_handler, setup_test_data):
     """
     Testa o pipeline completo: coleta → bronze → silver → gold.
     
@@ -40,7 +40,6 @@ def test_end_to_end_pipeline(setup_test_data):
     assert silver_results['selic'] is True
     
     # Valida existência de arquivos na camada silver
-    s3_handler = S3Handler()
     silver_files = s3_handler.list_files(prefix='silver')
     assert len(silver_files) >= 2
     
@@ -51,26 +50,37 @@ def test_end_to_end_pipeline(setup_test_data):
     # Verifica se a transformação para gold funcionou
     assert gold_result is True
     
-    # Valida existência de dashboards na camada gold
-    gold_files = s3_handler.list_files(prefix='gold/dashboards')
-    assert len(gold_files) > 0
+    # As consultas ao S3 abaixo são independentes entre si: rodam em paralelo
+    # e o tempo total é o da mais lenta, não a soma das latências
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Valida existência de dashboards na camada gold
+        gold_future = executor.submit(s3_handler.list_files, prefix='gold/dashboards', max_keys=1)
+        # Listagens restritas ao prefixo de cada dashboard
+        monthly_future = executor.submit(s3_handler.get_latest_file, 'gold/dashboards/monthly_indicators')
+        macro_future = executor.submit(s3_handler.get_latest_file, 'gold/dashboards/macro_dashboard')
+        
+        assert len(gold_future.result()) > 0
+        monthly_file = monthly_future.result()
+        macro_file = macro_future.result()
+        
+        # Só o rodapé Parquet é necessário para verificar as colunas mensais
+        names_future = executor.submit(s3_handler.read_schema, monthly_file) if monthly_file else None
+        macro_df_future = executor.submit(s3_handler.download_file, macro_file) if macro_file else None
     
     # 4. Validação dos resultados
     # Verifica o dashboard mensal
-    monthly_files = [f for f in gold_files if 'monthly_indicators' in f]
-    if monthly_files:
-        df = s3_handler.download_file(monthly_files[0])
-        assert df is not None
-        assert 'year_month' in df.columns
+    if names_future is not None:
+        names = names_future.result()
+        assert names is not None
+        assert 'year_month' in names
         # Verifica se contém dados de múltiplos indicadores
         expected_columns = ['ipca', 'selic']
-        present_columns = [col for col in expected_columns if col in df.columns]
+        present_columns = [col for col in expected_columns if col in names]
         assert len(present_columns) > 0
     
     # Verifica o dashboard macroeconômico
-    macro_files = [f for f in gold_files if 'macro_dashboard' in f]
-    if macro_files:
-        df = s3_handler.download_file(macro_files[0])
+    if macro_df_future is not None:
+        df = macro_df_future.result()
         assert df is not None
         assert 'indicator' in df.columns
         assert 'last_value' in df.columns
@@ -81,7 +91,7 @@ def test_end_to_end_pipeline(setup_test_data):
 
 @pytest.mark.integration
 @patch.object(BCBCollector, 'get_series_data')
-def test_collector_to_bronze(mock_get_series, bcb_collector, sample_ipca_data, setup_test_data):
+def test_collector_to_bronze(mock_get_series, bcb_collector, s3_handler, sample_ipca_data, setup_test_data):
     """
     Testa o fluxo do coletor até a camada bronze.
     
@@ -98,7 +108,6 @@ def test_collector_to_bronze(mock_get_series, bcb_collector, sample_ipca_data, s
     assert results['ipca'] is True
     
     # Verifica se os dados foram salvos na camada bronze
-    s3_handler = S3Handler()
     bronze_files = s3_handler.list_files(prefix='bronze/bcb_indicators/ipca')
     
     # Deve haver pelo menos um arquivo (o que foi criado pelo setup_test_data)
@@ -111,7 +120,7 @@ def test_collector_to_bronze(mock_get_series, bcb_collector, sample_ipca_data, s
     assert len(df) > 0
 
 @pytest.mark.integration
-def test_bronze_to_silver_to_gold(setup_test_data):
+def test_bronze_to_silver_to_gold(s3_handler, setup_test_data):
     """
     Testa fluxo Bronze → Silver → Gold para um único indicador.
     
@@ -125,7 +134,6 @@ def test_bronze_to_silver_to_gold(setup_test_data):
     assert silver_result is True
     
     # Verifica existência de arquivo na camada silver
-    s3_handler = S3Handler()
     silver_files = s3_handler.list_files(prefix='silver/economic_indicators/ipca')
     assert len(silver_files) > 0
     
@@ -143,5 +151,5 @@ def test_bronze_to_silver_to_gold(setup_test_data):
     assert gold_result is True
     
     # Verifica existência de dashboards na camada gold
-    gold_files = s3_handler.list_files(prefix='gold/dashboards')
+    gold_files = s3_handler.list_files(prefix='gold/dashboards', max_keys=1)
     assert len(gold_files) > 0
\ No newline at end of file
@@ -1,13 +1,19 @@
 # tests/integration/test_gold_transformation.py
 import sys
 import os
+import functools
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Adiciona o diretório raiz ao path para importar módulos do projeto
+# Adiciona o diretório raiz ao path quando executado como script; sob o
+# pytest o pacote tests/ já o inseriu e a entrada não é duplicada
 project_root = str(Path(__file__).parent.parent.parent)
-sys.path.append(project_root)
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
 from src.transformers.silver_to_gold import EconomicIndicatorsGoldTransformer
 from src.utils.helpers.logging_utils import get_logger, log_execution_time, log_dataframe_stats
@@ -16,6 +22,23 @@ from src.utils.aws_utils import S3Handler
 # Configuração de logging
 logger = get_logger("test_gold_transformation")
 
+@functools.lru_cache(maxsize=1)
+def _get_s3_handler():
+    """S3Handler compartilhado pelas funções do módulo (um único pool de conexões)."""
+    return S3Handler()
+
+# Colunas lidas por cada validador (projeção aplicada no download do Parquet)
+DASHBOARD_COLUMNS = {
+    'monthly_indicators': ['year_month', 'ipca', 'selic', 'cambio', 'economic_pressure_index'],
+    'labor_market': ['date', 'unemployment_rate'],
+    'macro_dashboard': ['indicator', 'last_value', 'last_date'],
+}
+
+# Colunas obrigatórias de cada dashboard validado
+REQUIRED_MONTHLY = frozenset({'year_month', 'ipca', 'selic', 'cambio'})
+REQUIRED_LABOR = frozenset({'date', 'unemployment_rate'})
+REQUIRED_MACRO = frozenset({'indicator', 'last_value', 'last_date'})
+
 @log_execution_time(logger=logger, operation_name="Teste de Transformação Gold")
 def test_gold_transformation():
     """Testa a transformação de dados da camada silver para gold."""
@@ -52,17 +75,13 @@ def validate_gold_dashboards():
     
     try:
         # Inicializa S3Handler
-        s3_handler = S3Handler()
-        
-        # Lista os arquivos na camada gold
-        gold_files = s3_handler.list_files(prefix="gold/dashboards")
+        s3_handler = _get_s3_handler()
         
-        if not gold_files:
+        # Verifica se há algum arquivo na camada gold (basta uma chave)
+        if not s3_handler.list_files(prefix="gold/dashboards", max_keys=1):
             logger.warning("Nenhum arquivo encontrado na camada gold para validação")
             return False
             
-        logger.info(f"Encontrados {len(gold_files)} dashboards na camada gold")
-            
         # Dashboards esperados
         expected_dashboards = [
             'monthly_indicators',
@@ -70,29 +89,23 @@ def validate_gold_dashboards():
             'macro_dashboard'
         ]
         
-        # Verifica cada dashboard
-        dashboard_status = {}
-        
-        for dashboard in expected_dashboards:
-            # Filtra arquivos para este dashboard
-            db_files = [f for f in gold_files if dashboard in f]
+        def _validate_one(dashboard):
+            # Lista só o prefixo deste dashboard e pega o arquivo mais recente
+            # (nomes terminam em _YYYYMMDD_HHMMSS, ordem lexical = cronológica)
+            latest_file = s3_handler.get_latest_file(prefix=f"gold/dashboards/{dashboard}")
             
-            if not db_files:
+            if latest_file is None:
                 logger.warning(f"Dashboard {dashboard} não encontrado")
-                dashboard_status[dashboard] = False
-                continue
+                return dashboard, False
                 
-            # Pega o arquivo mais recente
-            latest_file = sorted(db_files)[-1]
             logger.info(f"Validando dashboard: {dashboard} (arquivo: {latest_file})")
             
-            # Carrega o arquivo
-            df = s3_handler.download_file(latest_file)
+            # Carrega apenas as colunas usadas na validação
+            df = s3_handler.download_file(latest_file, columns=DASHBOARD_COLUMNS.get(dashboard))
             
             if df is None or df.empty:
                 logger.error(f"❌ Não foi possível carregar o dashboard {dashboard}")
-                dashboard_status[dashboard] = False
-                continue
+                return dashboard, False
                 
             # Loga estatísticas
             log_dataframe_stats(df, logger, f"Dashboard {dashboard}")
@@ -107,12 +120,20 @@ def validate_gold_dashboards():
             else:
                 valid = True  # Por padrão, consideramos válido
                 
-            dashboard_status[dashboard] = valid
-            
             if valid:
                 logger.info(f"✅ Dashboard {dashboard} validado com sucesso")
             else:
                 logger.error(f"❌ Dashboard {dashboard} inválido")
+                
+            return dashboard, valid
+        
+        # Verifica os dashboards em paralelo (cada um espera seu próprio GET)
+        dashboard_status = {}
+        with ThreadPoolExecutor(max_workers=len(expected_dashboards)) as executor:
+            futures = [executor.submit(_validate_one, dashboard) for dashboard in expected_dashboards]
+            for future in as_completed(futures):
+                dashboard, valid = future.result()
+                dashboard_status[dashboard] = valid
         
         # Retorna True se todos os dashboards esperados existirem e forem válidos
         all_valid = all(dashboard_status.values()) if dashboard_status else False
@@ -127,11 +148,8 @@ def validate_gold_dashboards():
 def validate_monthly_indicators(df):
     """Valida o dashboard de indicadores mensais."""
     
-    # Colunas obrigatórias
-    required_cols = ['year_month', 'ipca', 'selic', 'cambio']
-    
-    # Verifica se as colunas existem
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    # Verifica se as colunas obrigatórias existem
+    missing_cols = sorted(REQUIRED_MONTHLY.difference(df.columns))
     
     if missing_cols:
         logger.error(f"Colunas ausentes no dashboard mensal: {missing_cols}")
@@ -145,21 +163,20 @@ def validate_monthly_indicators(df):
     if 'economic_pressure_index' not in df.columns:
         logger.warning("Índice de pressão econômica não encontrado no dashboard mensal")
         
-    # Verifica valores nulos
-    null_counts = df[required_cols].isnull().sum()
-    if null_counts.sum() > 0:
-        logger.warning(f"Valores nulos encontrados no dashboard mensal: {null_counts.to_dict()}")
+    # Verifica valores nulos (contagem por coluna só quando há algum)
+    required_cols = list(REQUIRED_MONTHLY)
+    null_mask = df[required_cols].isna().to_numpy()
+    if null_mask.any():
+        null_counts = dict(zip(required_cols, null_mask.sum(axis=0).tolist()))
+        logger.warning(f"Valores nulos encontrados no dashboard mensal: {null_counts}")
         
     return True
 
 def validate_labor_market(df):
     """Valida o dashboard do mercado de trabalho."""
     
-    # Colunas obrigatórias
-    required_cols = ['date', 'unemployment_rate']
-    
-    # Verifica se as colunas existem
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    # Verifica se as colunas obrigatórias existem
+    missing_cols = sorted(REQUIRED_LABOR.difference(df.columns))
     
     if missing_cols:
         logger.error(f"Colunas ausentes no dashboard do mercado de trabalho: {missing_cols}")
@@ -174,29 +191,55 @@ def validate_labor_market(df):
 def validate_macro_dashboard(df):
     """Valida o dashboard macroeconômico."""
     
-    # Colunas obrigatórias
-    required_cols = ['indicator', 'last_value', 'last_date']
-    
-    # Verifica se as colunas existem
-    missing_cols = [col for col in required_cols if col not in df.columns]
+    # Verifica se as colunas obrigatórias existem
+    missing_cols = sorted(REQUIRED_MACRO.difference(df.columns))
     
     if missing_cols:
         logger.error(f"Colunas ausentes no dashboard macroeconômico: {missing_cols}")
         return False
         
     # Verifica se contém todos os indicadores
+    present = set(df['indicator'].unique())
     indicators = ['ipca', 'selic', 'cambio', 'desemprego']
-    missing_indicators = [ind for ind in indicators if ind not in df['indicator'].values]
+    missing_indicators = [ind for ind in indicators if ind not in present]
     
     if missing_indicators:
         logger.warning(f"Indicadores ausentes no dashboard macroeconômico: {missing_indicators}")
         
     # Verifica se o índice de saúde econômica está presente
-    if 'economic_health' not in df['indicator'].values:
+    if 'economic_health' not in present:
         logger.warning("Índice de saúde econômica não encontrado")
         
     return True
 
+# zstd nível 1 com páginas de 64 KiB: escrita mais rápida para os dados de teste
+# (compressão zstd e dicionário já são o padrão do S3Handler)
+FIXTURE_PARQUET_OPTS = {'compression_level': 1, 'data_page_size': 64 * 1024}
+
+def _indicator_table(dates, values, **metadata):
+    """
+    Monta a tabela Arrow de um indicador de teste.
+    
+    Os valores (percentuais e taxas) cabem em float32 e os metadados são
+    gravados como dicionário, lidos de volta pelo pandas como category.
+    
+    Args:
+        dates: Datas das observações (pa.Array)
+        values: Colunas numéricas (nome -> valores)
+        **metadata: Colunas constantes de texto (indicator, unit, ...)
+        
+    Returns:
+        pa.Table: Tabela com date, colunas numéricas e metadados
+    """
+    codes = pa.array(np.zeros(len(dates), dtype=np.int8))
+    columns = {'date': dates}
+    columns.update({name: pa.array(col, type=pa.float32()) for name, col in values.items()})
+    columns.update({
+        name: pa.DictionaryArray.from_arrays(codes, pa.array([value]))
+        for name, value in metadata.items()
+    })
+    return pa.table(columns)
+
 def create_test_data():
     """
     Cria dados de teste se não houver dados na camada silver.
@@ -204,7 +247,7 @@ def create_test_data():
     """
     try:
         # Inicializa S3Handler
-        s3_handler = S3Handler()
+        s3_handler = _get_s3_handler()
         
         # Verifica se já existem dados na camada silver
         silver_files = s3_handler.list_files(prefix="silver/economic_indicators")
@@ -215,100 +258,115 @@ def create_test_data():
             
         logger.info("Criando dados de teste para a camada silver...")
         
-        # Cria dataframes de teste
+        # Cria tabelas Arrow de teste (enviadas sem passar pelo pandas)
+        
+        # Datas compartilhadas entre os indicadores de mesma frequência
+        monthly_dates = pa.array(pd.date_range(start='2023-01-01', periods=12, freq='MS'))
+        quarterly_dates = pa.array(pd.date_range(start='2023-01-01', periods=4, freq='QS'))
         
         # IPCA - inflação mensal
-        ipca_data = {
-            'date': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
-            'value': [0.53, 0.84, 0.71, 0.61, 0.23, 0.16, -0.38, 0.23, 0.26, 0.24, 0.28, 0.56],
-            'monthly_change_pct': [0.1, 0.31, -0.13, -0.1, -0.38, -0.07, -0.54, 0.61, 0.03, -0.02, 0.04, 0.28],
-            'year_over_year_pct': [5.77, 5.6, 4.65, 4.18, 3.94, 3.16, 3.16, 3.43, 3.61, 4.82, 4.68, 4.62],
-            'indicator': ['ipca'] * 12,
-            'indicator_name': ['IPCA - Índice Nacional de Preços ao Consumidor Amplo'] * 12,
-            'unit': ['%'] * 12,
-            'frequency': ['monthly'] * 12
-        }
-        ipca_df = pd.DataFrame(ipca_data)
+        ipca_table = _indicator_table(
+            monthly_dates,
+            {
+                'value': [0.53, 0.84, 0.71, 0.61, 0.23, 0.16, -0.38, 0.23, 0.26, 0.24, 0.28, 0.56],
+                'monthly_change_pct': [0.1, 0.31, -0.13, -0.1, -0.38, -0.07, -0.54, 0.61, 0.03, -0.02, 0.04, 0.28],
+                'year_over_year_pct': [5.77, 5.6, 4.65, 4.18, 3.94, 3.16, 3.16, 3.43, 3.61, 4.82, 4.68, 4.62]
+            },
+            indicator='ipca',
+            indicator_name='IPCA - Índice Nacional de Preços ao Consumidor Amplo',
+            unit='%',
+            frequency='monthly'
+        )
         
         # SELIC - taxa de juros
-        selic_data = {
-            'date': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
-            'value': [13.75, 13.75, 13.75, 13.75, 13.75, 13.75, 13.25, 13.25, 12.75, 12.25, 11.75, 11.25],
-            'moving_avg_3m': [13.75, 13.75, 13.75, 13.75, 13.75, 13.75, 13.58, 13.42, 13.08, 12.75, 12.25, 11.75],
-            'indicator': ['selic'] * 12,
-            'indicator_name': ['Taxa SELIC'] * 12,
-            'unit': ['%'] * 12,
-            'frequency': ['monthly'] * 12
-        }
-        selic_df = pd.DataFrame(selic_data)
+        selic_table = _indicator_table(
+            monthly_dates,
+            {
+                'value': [13.75, 13.75, 13.75, 13.75, 13.75, 13.75, 13.25, 13.25, 12.75, 12.25, 11.75, 11.25],
+                'moving_avg_3m': [13.75, 13.75, 13.75, 13.75, 13.75, 13.75, 13.58, 13.42, 13.08, 12.75, 12.25, 11.75]
+            },
+            indicator='selic',
+            indicator_name='Taxa SELIC',
+            unit='%',
+            frequency='monthly'
+        )
         
         # PIB - trimestral
-        pib_data = {
-            'date': pd.date_range(start='2023-01-01', periods=4, freq='QS'),
-            'value': [2.4, 0.9, 0.1, 1.2],
-            'quarterly_change_pct': [1.3, -1.5, -0.8, 1.1],
-            'annual_change_pct': [4.0, 3.2, 2.1, 3.0],
-            'indicator': ['pib'] * 4,
-            'indicator_name': ['Produto Interno Bruto'] * 4,
-            'unit': ['R$ bilhões'] * 4,
-            'frequency': ['quarterly'] * 4
-        }
-        pib_df = pd.DataFrame(pib_data)
+        pib_table = _indicator_table(
+            quarterly_dates,
+            {
+                'value': [2.4, 0.9, 0.1, 1.2],
+                'quarterly_change_pct': [1.3, -1.5, -0.8, 1.1],
+                'annual_change_pct': [4.0, 3.2, 2.1, 3.0]
+            },
+            indicator='pib',
+            indicator_name='Produto Interno Bruto',
+            unit='R$ bilhões',
+            frequency='quarterly'
+        )
         
         # Câmbio - USD/BRL
-        cambio_data = {
-            'date': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
-            'value': [5.28, 5.17, 5.22, 5.05, 4.98, 4.85, 4.92, 5.03, 5.17, 5.23, 5.19, 5.05],
-            'monthly_change_pct': [-1.2, -2.1, 0.9, -3.3, -1.4, -2.6, 1.4, 2.2, 2.8, 1.2, -0.8, -2.7],
-            'volatility': [0.12, 0.09, 0.11, 0.08, 0.07, 0.09, 0.14, 0.12, 0.10, 0.08, 0.09, 0.11],
-            'indicator': ['cambio'] * 12,
-            'indicator_name': ['Taxa de Câmbio (USD/BRL)'] * 12,
-            'unit': ['BRL'] * 12,
-            'frequency': ['monthly'] * 12
-        }
-        cambio_df = pd.DataFrame(cambio_data)
+        cambio_table = _indicator_table(
+            monthly_dates,
+            {
+                'value': [5.28, 5.17, 5.22, 5.05, 4.98, 4.85, 4.92, 5.03, 5.17, 5.23, 5.19, 5.05],
+                'monthly_change_pct': [-1.2, -2.1, 0.9, -3.3, -1.4, -2.6, 1.4, 2.2, 2.8, 1.2, -0.8, -2.7],
+                'volatility': [0.12, 0.09, 0.11, 0.08, 0.07, 0.09, 0.14, 0.12, 0.10, 0.08, 0.09, 0.11]
+            },
+            indicator='cambio',
+            indicator_name='Taxa de Câmbio (USD/BRL)',
+            unit='BRL',
+            frequency='monthly'
+        )
         
         # Desemprego
-        desemprego_data = {
-            'date': pd.date_range(start='2023-01-01', periods=4, freq='QS'),
-            'value': [8.8, 8.3, 7.9, 7.5],
-            'quarterly_change_pp': [-0.4, -0.5, -0.4, -0.4],
-            'annual_change_pp': [-2.1, -1.8, -1.3, -1.0],
-            'indicator': ['desemprego'] * 4,
-            'indicator_name': ['Taxa de Desemprego'] * 4,
-            'unit': ['%'] * 4,
-            'frequency': ['quarterly'] * 4
-        }
-        desemprego_df = pd.DataFrame(desemprego_data)
-        
-        # Salva dataframes na camada silver
+        desemprego_table = _indicator_table(
+            quarterly_dates,
+            {
+                'value': [8.8, 8.3, 7.9, 7.5],
+                'quarterly_change_pp': [-0.4, -0.5, -0.4, -0.4],
+                'annual_change_pp': [-2.1, -1.8, -1.3, -1.0]
+            },
+            indicator='desemprego',
+            indicator_name='Taxa de Desemprego',
+            unit='%',
+            frequency='quarterly'
+        )
+        
+        # Salva as tabelas na camada silver
         dfs = {
-            'ipca': ipca_df,
-            'selic': selic_df,
-            'pib': pib_df,
-            'cambio': cambio_df,
-            'desemprego': desemprego_df
+            'ipca': ipca_table,
+            'selic': selic_table,
+            'pib': pib_table,
+            'cambio': cambio_table,
+            'desemprego': desemprego_table
         }
         
-        for name, df in dfs.items():
-            # Gera caminho
-            file_path = f"silver/economic_indicators/{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
-            
-            # Salva no S3
+        # Timestamp único para todos os arquivos do lote
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        def upload(name, df):
+            # Salva no S3 (extensão é adicionada pelo método; layer já está no path)
             success = s3_handler.upload_dataframe(
                 df=df,
-                file_path=file_path.split('.')[0],  # Remove extensão que será adicionada pelo método
-                layer='',  # Layer já está no path
-                format='parquet'
+                file_path=f"silver/economic_indicators/{name}_{timestamp}",
+                layer='',
+                format='parquet',
+                parquet_opts=FIXTURE_PARQUET_OPTS
             )
             
             if success:
                 logger.info(f"Dados de teste para {name} salvos com sucesso")
             else:
                 logger.error(f"Erro ao salvar dados de teste para {name}")
-                return False
+            return success
+        
+        # Uploads em paralelo: o tempo total é o do upload mais lento
+        with ThreadPoolExecutor(max_workers=len(dfs)) as executor:
+            futures = [executor.submit(upload, name, df) for name, df in dfs.items()]
+            results = [future.result() for future in as_completed(futures)]
                 
-        return True
+        return all(results)
         
     except Exception as e:
         logger.error(f"❌ Erro ao criar dados de teste: {str(e)}")
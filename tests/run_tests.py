@@ -12,18 +12,23 @@ Opções:
     --cov        Gera relatório de cobertura
     --verbose    Mostra log detalhado
     --html       Gera relatório HTML
+    --parallel   Distribui os testes entre os núcleos (requer pytest-xdist)
+    --lf         Reexecuta apenas os testes que falharam na última execução
 """
 
 import argparse
-import subprocess
+import importlib.util
 import sys
 import os
 
+import pytest
+
 # Adiciona o diretório raiz do projeto ao PYTHONPATH para resolver o problema da importação do 'src'
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.insert(0, project_root)
 
-def run_tests(unit=True, integration=True, coverage=False, verbose=False, html=False):
+def run_tests(unit=True, integration=True, coverage=False, verbose=False, html=False, parallel=False,
+              last_failed=False):
     """
     Executa os testes especificados.
     
@@ -33,17 +38,37 @@ def run_tests(unit=True, integration=True, coverage=False, verbose=False, html=F
         coverage: Se deve gerar relatório de cobertura
         verbose: Se deve mostrar saída detalhada
         html: Se deve gerar relatório HTML
+        parallel: Se deve distribuir os testes entre os núcleos (pytest-xdist)
+        last_failed: Se deve reexecutar apenas as falhas da última execução
     
     Returns:
         int: Código de saída (0 = sucesso)
     """
-    # Comando base
-    cmd = [sys.executable, "-m", "pytest"]
+    # Argumentos do pytest (executado no próprio processo). O project_root já
+    # está no sys.path, então o modo importlib importa cada módulo de teste
+    # uma única vez, sem inserir os diretórios de teste no sys.path
+    cmd = ["--import-mode=importlib"]
     
     # Adiciona opções
     if verbose:
         cmd.append("-v")
     
+    # Execução paralela: loadfile mantém os testes de um módulo no mesmo
+    # worker, preservando fixtures e caches por módulo
+    if parallel:
+        if importlib.util.find_spec("xdist") is None:
+            print("pytest-xdist não instalado; executando testes em série")
+        else:
+            cmd.extend(["-n", str(os.cpu_count() or 1), "--dist=loadfile"])
+    
+    # Apenas unitários: deseleciona também testes marcados como integração
+    if unit and not integration:
+        cmd.extend(["-m", "not integration"])
+    
+    # Reexecução das falhas registradas no cache do pytest (.pytest_cache)
+    if last_failed:
+        cmd.append("--lf")
+    
     # Define caminhos de teste
     test_paths = []
     if unit:
@@ -60,14 +85,16 @@ def run_tests(unit=True, integration=True, coverage=False, verbose=False, html=F
     # Adiciona caminhos de teste
     cmd.extend(test_paths)
     
-    # Configura o PYTHONPATH no ambiente para o processo filho
-    env = os.environ.copy()
-    env["PYTHONPATH"] = project_root + os.pathsep + env.get("PYTHONPATH", "")
+    # Configura o PYTHONPATH no ambiente (herdado pelos workers do xdist)
+    os.environ["PYTHONPATH"] = project_root + os.pathsep + os.environ.get("PYTHONPATH", "")
+    
+    # Kernels numba (cache=True) compilados uma vez e reaproveitados entre execuções
+    os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(project_root, ".numba_cache"))
     
     # Executa testes
-    print(f"Executando comando: {' '.join(cmd)}")
-    print(f"PYTHONPATH: {env['PYTHONPATH']}")
-    return subprocess.call(cmd, env=env)
+    print(f"Executando: pytest {' '.join(cmd)}")
+    print(f"PYTHONPATH: {os.environ['PYTHONPATH']}")
+    return int(pytest.main(cmd))
 
 def main():
     """Função principal."""
@@ -78,6 +105,8 @@ def main():
     parser.add_argument("--cov", action="store_true", help="Gerar relatório de cobertura")
     parser.add_argument("--verbose", action="store_true", help="Mostrar saída detalhada")
     parser.add_argument("--html", action="store_true", help="Gerar relatório HTML")
+    parser.add_argument("--parallel", action="store_true", help="Distribuir os testes entre os núcleos (pytest-xdist)")
+    parser.add_argument("--lf", action="store_true", help="Reexecutar apenas os testes que falharam na última execução")
     
     args = parser.parse_args()
     
@@ -95,7 +124,9 @@ def main():
         integration=run_integration,
         coverage=args.cov,
         verbose=args.verbose,
-        html=args.html
+        html=args.html,
+        parallel=args.parallel,
+        last_failed=args.lf
     )
 
 if __name__ == "__main__":
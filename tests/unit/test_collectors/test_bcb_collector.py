@@ -4,12 +4,12 @@ import pytest
 import pandas as pd
 from datetime import datetime, timedelta
 import requests
-from unittest.mock import patch, MagicMock
+import responses
 
 from src.collectors.bcb_collector import BCBCollector
 
 # Mock de resposta da API do BCB
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_bcb_response():
     """Mock de resposta da API do BCB para o IPCA."""
     return [
@@ -18,6 +18,23 @@ def mock_bcb_response():
         {"data": "01/03/2023", "valor": "0.71"}
     ]
 
+# URLs das séries usadas nos testes (IPCA responde com dados, SELIC com erro)
+IPCA_URL = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.433/dados"
+SELIC_URL = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.11/dados"
+
+@pytest.fixture
+def http_mock(mock_aws, mock_bcb_response):
+    """
+    Registro de respostas HTTP da API do BCB.
+    
+    Depende de mock_aws para ser ativado depois do moto, que também intercepta
+    o requests: o registro mais recente é o que atende as chamadas.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as registry:
+        registry.add(responses.GET, IPCA_URL, json=mock_bcb_response, status=200)
+        registry.add(responses.GET, SELIC_URL, json={'erro': 'Not Found'}, status=404)
+        yield registry
+
 def test_get_source_name(bcb_collector):
     """Testa se o nome da fonte está correto."""
     assert bcb_collector.get_source_name() == 'bcb'
@@ -40,15 +57,8 @@ def test_get_available_indicators(bcb_collector):
     assert 'unit' in ipca
     assert 'frequency' in ipca
 
-@patch('requests.get')
-def test_get_series_data_success(mock_get, bcb_collector, mock_bcb_response):
+def test_get_series_data_success(http_mock, bcb_collector):
     """Testa coleta de dados com sucesso."""
-    # Configura o mock
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = mock_bcb_response
-    mock_get.return_value = mock_response
-    
     # Coleta dados
     df = bcb_collector.get_series_data('ipca')
     
@@ -60,30 +70,23 @@ def test_get_series_data_success(mock_get, bcb_collector, mock_bcb_response):
     assert df['ipca'].iloc[0] == 0.53
     
     # Verifica se a URL foi chamada corretamente
-    url = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.433/dados"
-    mock_get.assert_called_once()
-    assert url in mock_get.call_args[0][0]
+    assert len(http_mock.calls) == 1
+    assert IPCA_URL in http_mock.calls[0].request.url
 
-@patch('requests.get')
-def test_get_series_data_error(mock_get, bcb_collector):
+def test_get_series_data_error(http_mock, bcb_collector):
     """Testa comportamento em caso de erro na API."""
-    # Configura o mock para simular erro
-    mock_response = MagicMock()
-    mock_response.status_code = 404
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found")
-    mock_get.return_value = mock_response
-    
-    # Coleta dados
-    df = bcb_collector.get_series_data('ipca')
+    # A série da SELIC está registrada com resposta 404
+    df = bcb_collector.get_series_data('selic')
     
     # Verificações
     assert df is None
+    assert len(http_mock.calls) == 1
 
-def test_post_collect_hook(bcb_collector):
+def test_post_collect_hook(bcb_collector, monthly_dates):
     """Testa o hook de pós-coleta."""
     # Cria DataFrame básico
     df = pd.DataFrame({
-        'data': pd.date_range(start='2023-01-01', periods=3, freq='MS'),
+        'data': monthly_dates[:3],
         'ipca': [0.53, 0.84, 0.71]
     })
     
@@ -101,18 +104,18 @@ def test_post_collect_hook(bcb_collector):
     assert processed_df['indicator'].iloc[0] == 'ipca'
     assert processed_df['source'].iloc[0] == 'bcb'
 
-@patch.object(BCBCollector, 'get_series_data')
-@patch.object(BCBCollector, '_store_data')
-def test_collect_and_store(mock_store, mock_get_series, bcb_collector, sample_ipca_data):
+def test_collect_and_store(monkeypatch, stub, bcb_collector, sample_ipca_data):
     """Testa o fluxo completo de coleta e armazenamento."""
-    # Configura mocks
-    mock_get_series.return_value = sample_ipca_data
-    mock_store.return_value = True
+    # Substitui os métodos por stubs simples
+    get_series = stub(sample_ipca_data)
+    store = stub(True)
+    monkeypatch.setattr(BCBCollector, 'get_series_data', get_series)
+    monkeypatch.setattr(BCBCollector, '_store_data', store)
     
     # Executa coleta
     result = bcb_collector.collect_and_store(indicators=['ipca'])
     
     # Verificações
     assert result == {'ipca': True}
-    mock_get_series.assert_called_once()
-    mock_store.assert_called_once()
\ No newline at end of file
+    assert get_series.calls == 1
+    assert store.calls == 1
@@ -3,13 +3,15 @@
 import pytest
 import pandas as pd
 from datetime import datetime, timedelta
+import re
 import requests
+import responses
 from unittest.mock import patch, MagicMock
 
 from src.collectors.ibge_collector import IBGECollector
 
 # Mock de resposta da API do IBGE para diferentes endpoints
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_ibge_sidra_response():
     """Mock de resposta da API SIDRA do IBGE para o IPCA-15."""
     return [
@@ -35,7 +37,7 @@ def mock_ibge_sidra_response():
         }
     ]
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_ibge_pnad_periods():
     """Mock de resposta da API PNAD para os períodos disponíveis."""
     return [
@@ -44,7 +46,7 @@ def mock_ibge_pnad_periods():
         {"id": "202307", "nome": "3º trimestre 2023"}
     ]
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_ibge_pnad_data():
     """Mock de resposta da API PNAD para os dados de desemprego."""
     return [
@@ -65,6 +67,25 @@ def mock_ibge_pnad_data():
         }
     ]
 
+# URLs das APIs do IBGE usadas nos testes
+SIDRA_URL = re.compile(r"https://servicodados\.ibge\.gov\.br/api/v3/agregados/.+")
+PNAD_PERIODS_URL = "https://servicodados.ibge.gov.br/api/v1/pesquisas/5457/periodos"
+PNAD_DATA_URL = re.compile(re.escape(PNAD_PERIODS_URL) + r"/[^/]+/indicadores")
+
+@pytest.fixture
+def http_mock(mock_aws, mock_ibge_sidra_response, mock_ibge_pnad_periods, mock_ibge_pnad_data):
+    """
+    Registro de respostas HTTP das APIs do IBGE.
+    
+    Depende de mock_aws para ser ativado depois do moto, que também intercepta
+    o requests: o registro mais recente é o que atende as chamadas.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as registry:
+        registry.add(responses.GET, SIDRA_URL, json=mock_ibge_sidra_response, status=200)
+        registry.add(responses.GET, PNAD_PERIODS_URL, json=mock_ibge_pnad_periods, status=200)
+        registry.add(responses.GET, PNAD_DATA_URL, json=mock_ibge_pnad_data, status=200)
+        yield registry
+
 def test_get_source_name(ibge_collector):
     """Testa se o nome da fonte está correto."""
     assert ibge_collector.get_source_name() == 'ibge'
@@ -97,15 +118,8 @@ def test_get_available_indicators(ibge_collector):
     assert 'type' in pnad
     assert pnad['type'] == 'special'  # Deve usar endpoint especial
 
-@patch('requests.get')
-def test_get_sidra_data(mock_get, ibge_collector, mock_ibge_sidra_response):
+def test_get_sidra_data(http_mock, ibge_collector):
     """Testa coleta de dados via API SIDRA."""
-    # Configura o mock
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = mock_ibge_sidra_response
-    mock_get.return_value = mock_response
-    
     # Acessa método interno _get_sidra_data
     # Nota: Em testes reais, seria melhor usar get_series_data, mas para isolar melhor usamos o método interno
     indicator_config = ibge_collector.get_available_indicators()['ipca15']
@@ -118,26 +132,10 @@ def test_get_sidra_data(mock_get, ibge_collector, mock_ibge_sidra_response):
     assert 'valor' in df.columns or 'value' in df.columns
     
     # Verifica se a URL foi chamada
-    mock_get.assert_called_once()
+    assert len(http_mock.calls) == 1
 
-@patch('requests.get')
-def test_get_pnad_data(mock_get, ibge_collector, mock_ibge_pnad_periods, mock_ibge_pnad_data):
+def test_get_pnad_data(http_mock, ibge_collector):
     """Testa coleta de dados da PNAD."""
-    # Configura mocks para diferentes chamadas
-    mock_periods_response = MagicMock()
-    mock_periods_response.status_code = 200
-    mock_periods_response.json.return_value = mock_ibge_pnad_periods
-    
-    mock_data_response = MagicMock()
-    mock_data_response.status_code = 200
-    mock_data_response.json.return_value = mock_ibge_pnad_data
-    
-    # Configura o mock.get para retornar diferentes respostas dependendo da URL
-    mock_get.side_effect = lambda url, **kwargs: (
-        mock_periods_response if "periodos" in url and "/periodos/" not in url
-        else mock_data_response
-    )
-    
     # Acessa método interno _get_pnad_data
     df = ibge_collector._get_pnad_data()
     
@@ -148,20 +146,20 @@ def test_get_pnad_data(mock_get, ibge_collector, mock_ibge_pnad_periods, mock_ib
     assert 'pnad' in df.columns
     
     # Verifica se a URL foi chamada pelo menos duas vezes (períodos e dados)
-    assert mock_get.call_count >= 2
+    assert len(http_mock.calls) >= 2
 
 @patch.object(IBGECollector, '_get_sidra_data')
 @patch.object(IBGECollector, '_get_pnad_data')
-def test_get_series_data(mock_get_pnad, mock_get_sidra, ibge_collector):
+def test_get_series_data(mock_get_pnad, mock_get_sidra, ibge_collector, monthly_dates, quarterly_dates):
     """Testa o método principal get_series_data."""
     # Configura mocks
     mock_get_sidra.return_value = pd.DataFrame({
-        'data': pd.date_range(start='2023-01-01', periods=3, freq='MS'),
+        'data': monthly_dates[:3],
         'valor': [0.5, 0.7, 0.3]
     })
     
     mock_get_pnad.return_value = pd.DataFrame({
-        'data': pd.date_range(start='2023-01-01', periods=3, freq='QS'),
+        'data': quarterly_dates[:3],
         'pnad': [8.8, 8.5, 8.1]
     })
     
@@ -180,11 +178,11 @@ def test_get_series_data(mock_get_pnad, mock_get_sidra, ibge_collector):
     assert len(df_pnad) == 3
     mock_get_pnad.assert_called_once()
 
-def test_post_collect_hook(ibge_collector):
+def test_post_collect_hook(ibge_collector, monthly_dates):
     """Testa o hook de pós-coleta."""
     # Cria DataFrame básico
     df = pd.DataFrame({
-        'data': pd.date_range(start='2023-01-01', periods=3, freq='MS'),
+        'data': monthly_dates[:3],
         'value': [0.53, 0.84, 0.71]
     })
     
@@ -202,13 +200,11 @@ def test_post_collect_hook(ibge_collector):
     assert processed_df['indicator'].iloc[0] == 'ipca15'
     assert processed_df['source'].iloc[0] == 'ibge'
 
-@patch.object(IBGECollector, 'get_series_data')
-@patch.object(IBGECollector, '_store_data')
-def test_collect_and_store(mock_store, mock_get_series, ibge_collector):
+def test_collect_and_store(monkeypatch, stub, ibge_collector, monthly_dates):
     """Testa o fluxo completo de coleta e armazenamento."""
     # Configura dados de teste
     sample_data = pd.DataFrame({
-        'data': pd.date_range(start='2023-01-01', periods=3, freq='MS'),
+        'data': monthly_dates[:3],
         'ipca15': [0.5, 0.7, 0.3],
         'indicator': ['ipca15'] * 3,
         'indicator_name': ['IPCA-15'] * 3,
@@ -216,14 +212,16 @@ def test_collect_and_store(mock_store, mock_get_series, ibge_collector):
         'frequency': ['monthly'] * 3
     })
     
-    # Configura mocks
-    mock_get_series.return_value = sample_data
-    mock_store.return_value = True
+    # Substitui os métodos por stubs simples
+    get_series = stub(sample_data)
+    store = stub(True)
+    monkeypatch.setattr(IBGECollector, 'get_series_data', get_series)
+    monkeypatch.setattr(IBGECollector, '_store_data', store)
     
     # Executa coleta
     result = ibge_collector.collect_and_store(indicators=['ipca15'])
     
     # Verificações
     assert result == {'ipca15': True}
-    mock_get_series.assert_called_once()
-    mock_store.assert_called_once()
\ No newline at end of file
+    assert get_series.calls == 1
+    assert store.calls == 1
@@ -1,100 +1,120 @@
 """Testes unitários para transformador Bronze para Silver."""
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
-from src.transformers.bronze_to_silver import EconomicIndicatorTransformer
 from src.utils.aws_utils import S3Handler
 
-def test_transform_ipca():
-    """Testa transformação do IPCA."""
-    # Cria o transformador
-    transformer = EconomicIndicatorTransformer()
-    
-    # Cria dados de entrada
-    input_df = pd.DataFrame({
-        'data': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
-        'ipca': [0.53, 0.84, 0.71, 0.61, 0.23, 0.16, -0.38, 0.23, 0.26, 0.24, 0.28, 0.56],
-        'indicator': ['ipca'] * 12,
-        'indicator_name': ['IPCA - Índice Nacional de Preços ao Consumidor Amplo'] * 12,
-        'unit': ['%'] * 12,
-        'frequency': ['monthly'] * 12
+# Dados de entrada construídos uma única vez por módulo, com dtypes
+# declarados: valores em float64 (como os coletores produzem) e metadados
+# constantes como categóricos
+
+_IPCA_VALUES = np.array(
+    [0.53, 0.84, 0.71, 0.61, 0.23, 0.16, -0.38, 0.23, 0.26, 0.24, 0.28, 0.56],
+    dtype=np.float64
+)
+_SELIC_VALUES = np.repeat(np.array([13.75, 13.25], dtype=np.float64), 30)
+_CAMBIO_VALUES = np.array(
+    [5.28, 5.17, 5.22, 5.05, 4.98, 4.85, 4.92, 5.03, 5.17, 5.23, 5.19, 5.05],
+    dtype=np.float64
+)
+
+# Colunas esperadas na saída de cada transformação ('value' é o valor padronizado)
+EXPECTED_IPCA_COLS = frozenset({'date', 'value', 'monthly_change_pct', 'year_over_year_pct', 'moving_avg_3m'})
+EXPECTED_SELIC_COLS = frozenset({'date', 'value'})
+EXPECTED_CAMBIO_COLS = frozenset({'open', 'close', 'high', 'low', 'value', 'volatility'})
+
+def _metadata(n, **columns):
+    """Colunas constantes como categóricos de um único valor."""
+    codes = np.zeros(n, dtype=np.int8)
+    return {
+        name: pd.Categorical.from_codes(codes, categories=[value])
+        for name, value in columns.items()
+    }
+
+@pytest.fixture(scope='module')
+def ipca_input_df(monthly_dates):
+    """Dados brutos mensais do IPCA."""
+    return pd.DataFrame({
+        'data': monthly_dates,
+        'ipca': _IPCA_VALUES,
+        **_metadata(
+            12,
+            indicator='ipca',
+            indicator_name='IPCA - Índice Nacional de Preços ao Consumidor Amplo',
+            unit='%',
+            frequency='monthly'
+        )
+    })
+
+@pytest.fixture(scope='module')
+def selic_input_df(daily_dates):
+    """Dados brutos diários da SELIC."""
+    return pd.DataFrame({
+        'data': daily_dates,
+        'selic': _SELIC_VALUES,
+        **_metadata(60, indicator='selic', indicator_name='Taxa SELIC', unit='%', frequency='daily')
+    })
+
+@pytest.fixture(scope='module')
+def cambio_input_df(monthly_dates):
+    """Dados brutos mensais da taxa de câmbio."""
+    return pd.DataFrame({
+        'data': monthly_dates,
+        'cambio': _CAMBIO_VALUES,
+        **_metadata(
+            12,
+            indicator='cambio',
+            indicator_name='Taxa de Câmbio (USD/BRL)',
+            unit='BRL',
+            frequency='monthly'
+        )
     })
+
+def test_transform_ipca(transformer, ipca_input_df):
+    """Testa transformação do IPCA."""
+    input_df = ipca_input_df
     
     # Executa transformação
     result_df = transformer.transform_ipca(input_df)
     
     # Verificações
     assert result_df is not None
-    assert 'date' in result_df.columns
-    assert 'value' in result_df.columns
-    assert 'monthly_change_pct' in result_df.columns
-    assert 'year_over_year_pct' in result_df.columns
-    assert 'moving_avg_3m' in result_df.columns
+    assert not EXPECTED_IPCA_COLS.difference(result_df.columns)
     
     # Verifica cálculos
     assert result_df['value'].equals(input_df['ipca'])
     assert len(result_df) == len(input_df)
 
-def test_transform_selic():
+def test_transform_selic(transformer, selic_input_df):
     """Testa transformação da SELIC."""
-    # Cria o transformador
-    transformer = EconomicIndicatorTransformer()
-    
-    # Cria dados diários de entrada
-    dates = pd.date_range(start='2023-01-01', periods=60, freq='D')
-    values = [13.75] * 30 + [13.25] * 30
-    
-    input_df = pd.DataFrame({
-        'data': dates,
-        'selic': values,
-        'indicator': ['selic'] * 60,
-        'indicator_name': ['Taxa SELIC'] * 60,
-        'unit': ['%'] * 60,
-        'frequency': ['daily'] * 60
-    })
+    input_df = selic_input_df
     
     # Executa transformação
     result_df = transformer.transform_selic(input_df)
     
     # Verificações
     assert result_df is not None
-    assert 'date' in result_df.columns
-    assert 'value' in result_df.columns
+    assert not EXPECTED_SELIC_COLS.difference(result_df.columns)
     
     # Verifica que os dados diários foram agregados para mensais
     assert len(result_df) < len(input_df)
     # Deve haver no máximo 2 meses nos dados
     assert len(result_df) <= 2
 
-def test_transform_cambio():
+def test_transform_cambio(transformer, cambio_input_df):
     """Testa transformação da taxa de câmbio."""
-    # Cria o transformador
-    transformer = EconomicIndicatorTransformer()
-    
-    # Cria dados de entrada
-    input_df = pd.DataFrame({
-        'data': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
-        'cambio': [5.28, 5.17, 5.22, 5.05, 4.98, 4.85, 4.92, 5.03, 5.17, 5.23, 5.19, 5.05],
-        'indicator': ['cambio'] * 12,
-        'indicator_name': ['Taxa de Câmbio (USD/BRL)'] * 12,
-        'unit': ['BRL'] * 12,
-        'frequency': ['monthly'] * 12
-    })
+    input_df = cambio_input_df
     
     # Executa transformação
     result_df = transformer.transform_cambio(input_df)
     
     # Verificações
     assert result_df is not None
-    assert 'open' in result_df.columns
-    assert 'close' in result_df.columns
-    assert 'high' in result_df.columns
-    assert 'low' in result_df.columns
-    assert 'value' in result_df.columns  # Valor padronizado
-    assert 'volatility' in result_df.columns
+    assert not EXPECTED_CAMBIO_COLS.difference(result_df.columns)
     
     # Verifica que o comprimento é mantido
     assert len(result_df) == len(input_df)
@@ -102,16 +122,13 @@ def test_transform_cambio():
 @patch.object(S3Handler, 'list_files')
 @patch.object(S3Handler, 'download_file')
 @patch.object(S3Handler, 'upload_dataframe')
-def test_process_indicator(mock_upload, mock_download, mock_list, sample_ipca_data):
+def test_process_indicator(mock_upload, mock_download, mock_list, transformer, sample_ipca_data):
     """Testa o fluxo completo de processamento de um indicador."""
     # Configura mocks
     mock_list.return_value = ['bronze/bcb_indicators/ipca_20230101.parquet']
     mock_download.return_value = sample_ipca_data
     mock_upload.return_value = True
     
-    # Cria o transformador
-    transformer = EconomicIndicatorTransformer()
-    
     # Processa o indicador
     result = transformer.process_indicator('ipca')
     
@@ -8,11 +8,14 @@ from unittest.mock import patch, MagicMock
 from src.transformers.silver_to_gold import EconomicIndicatorsGoldTransformer
 from src.utils.aws_utils import S3Handler
 
-@pytest.fixture
-def silver_ipca_data():
+# Os DataFrames de entrada são construídos uma vez por módulo: as
+# transformações gold apenas leem os indicadores recebidos
+
+@pytest.fixture(scope='module')
+def silver_ipca_data(monthly_dates):
     """Dados simulados da camada silver para o IPCA."""
     return pd.DataFrame({
-        'date': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
+        'date': monthly_dates,
         'value': [0.53, 0.84, 0.71, 0.61, 0.23, 0.16, -0.38, 0.23, 0.26, 0.24, 0.28, 0.56],
         'monthly_change_pct': [0.1, 0.31, -0.13, -0.1, -0.38, -0.07, -0.54, 0.61, 0.03, -0.02, 0.04, 0.28],
         'year_over_year_pct': [5.77, 5.6, 4.65, 4.18, 3.94, 3.16, 3.16, 3.43, 3.61, 4.82, 4.68, 4.62],
@@ -22,11 +25,11 @@ def silver_ipca_data():
         'frequency': ['monthly'] * 12
     })
 
-@pytest.fixture
-def silver_selic_data():
+@pytest.fixture(scope='module')
+def silver_selic_data(monthly_dates):
     """Dados simulados da camada silver para a SELIC."""
     return pd.DataFrame({
-        'date': pd.date_range(start='2023-01-01', periods=12, freq='MS'),
+        'date': monthly_dates,
         'value': [13.75, 13.75, 13.75, 13.75, 13.75, 13.75, 13.25, 13.25, 12.75, 12.25, 11.75, 11.25],
         'change_bps': [0, 0, 0, 0, 0, 0, -50, 0, -50, -50, -50, -50],
         'moving_avg_3m': [13.75, 13.75, 13.75, 13.75, 13.75, 13.75, 13.58, 13.42, 13.08, 12.75, 12.25, 11.75],
@@ -36,11 +39,11 @@ def silver_selic_data():
         'frequency': ['monthly'] * 12
     })
 
-@pytest.fixture
-def silver_desemprego_data():
+@pytest.fixture(scope='module')
+def silver_desemprego_data(quarterly_dates):
     """Dados simulados da camada silver para o desemprego."""
     return pd.DataFrame({
-        'date': pd.date_range(start='2023-01-01', periods=4, freq='QS'),
+        'date': quarterly_dates,
         'value': [8.8, 8.3, 7.9, 7.5],
         'quarterly_change_pp': [-0.4, -0.5, -0.4, -0.4],
         'annual_change_pp': [-2.1, -1.8, -1.3, -1.0],
@@ -75,22 +78,21 @@ def test_load_latest_indicators(mock_download, mock_list):
     # Cria transformador
     transformer = EconomicIndicatorsGoldTransformer()
     
+    # Respostas por prefixo/caminho exatos (consulta O(1) em dict a cada chamada)
+    ipca_path = 'silver/economic_indicators/ipca_20230101.parquet'
+    selic_path = 'silver/economic_indicators/selic_20230101.parquet'
+    listings = {
+        'silver/economic_indicators/ipca': [ipca_path],
+        'silver/economic_indicators/selic': [selic_path]
+    }
+    downloads = {
+        ipca_path: pd.DataFrame({'date': ['2023-01-01'], 'value': [0.5], 'indicator': ['ipca']}),
+        selic_path: pd.DataFrame({'date': ['2023-01-01'], 'value': [13.75], 'indicator': ['selic']})
+    }
+    
     # Configura mocks
-    mock_list.side_effect = lambda prefix: (
-        ['silver/economic_indicators/ipca_20230101.parquet'] if 'ipca' in prefix
-        else ['silver/economic_indicators/selic_20230101.parquet'] if 'selic' in prefix
-        else []
-    )
-    
-    # Cria dados mock para cada indicador
-    ipca_data = pd.DataFrame({'date': ['2023-01-01'], 'value': [0.5], 'indicator': ['ipca']})
-    selic_data = pd.DataFrame({'date': ['2023-01-01'], 'value': [13.75], 'indicator': ['selic']})
-    
-    mock_download.side_effect = lambda path: (
-        ipca_data if 'ipca' in path
-        else selic_data if 'selic' in path
-        else None
-    )
+    mock_list.side_effect = lambda prefix: listings.get(prefix, [])
+    mock_download.side_effect = lambda path, **kwargs: downloads.get(path)
     
     # Executa a função
     indicators = transformer.load_latest_indicators()
@@ -1,13 +1,15 @@
 """Testes unitários para S3Handler."""
 
 import pytest
+import numpy as np
 import pandas as pd
 import boto3
 from io import BytesIO
 from datetime import datetime
 import os
+from unittest.mock import patch
 
-from src.utils.aws_utils import S3Handler
+from src.utils.aws_utils import S3Handler, _PARQUET_CACHE
 
 def test_init(s3_handler):
     """Testa inicialização da classe S3Handler."""
@@ -53,6 +55,26 @@ def test_upload_dataframe_csv(s3_handler, sample_ipca_data):
     assert files[0].startswith('bronze/test/ipca_')
     assert files[0].endswith('.csv')
 
+def test_upload_dataframe_partitioned(s3_handler, sample_selic_data):
+    """Testa upload de DataFrame como diretório Parquet particionado."""
+    success = s3_handler.upload_dataframe_partitioned(
+        df=sample_selic_data,
+        file_path='test/selic',
+        layer='bronze',
+        n_parts=4
+    )
+    
+    # Verificações
+    assert success is True
+    
+    files = sorted(s3_handler.list_files(prefix='bronze/test/selic_'))
+    assert len(files) == 4
+    assert files[0].endswith('/part-00000.parquet')
+    
+    # As partes juntas devem reconstituir o DataFrame original
+    parts = [s3_handler.download_file(f) for f in files]
+    assert sum(len(part) for part in parts) == len(sample_selic_data)
+
 def test_download_file_parquet(s3_handler, sample_ipca_data):
     """Testa download de arquivo Parquet."""
     # Prepara: faz upload primeiro
@@ -74,6 +96,24 @@ def test_download_file_parquet(s3_handler, sample_ipca_data):
     assert len(df) == len(sample_ipca_data)
     assert set(df.columns) == set(sample_ipca_data.columns)
 
+def test_download_file_columns(s3_handler, sample_ipca_data):
+    """Testa download com projeção de colunas (colunas inexistentes são ignoradas)."""
+    key = 'test/projection.parquet'
+    s3_handler.write_parquet(sample_ipca_data, key)
+    
+    df = s3_handler.download_file(key, columns=['data', 'ipca', 'inexistente'])
+    assert df is not None
+    assert list(df.columns) == ['data', 'ipca']
+    assert len(df) == len(sample_ipca_data)
+
+def test_read_schema(s3_handler, sample_ipca_data):
+    """Testa leitura das colunas a partir do rodapé Parquet."""
+    s3_handler.write_parquet(sample_ipca_data, 'bronze/test/schema.parquet')
+    
+    names = s3_handler.read_schema('bronze/test/schema.parquet')
+    assert set(sample_ipca_data.columns) <= set(names)
+    assert s3_handler.read_schema('bronze/test/inexistente.parquet') is None
+
 def test_download_file_csv(s3_handler, sample_ipca_data):
     """Testa download de arquivo CSV."""
     # Prepara: faz upload primeiro
@@ -94,6 +134,44 @@ def test_download_file_csv(s3_handler, sample_ipca_data):
     assert df is not None
     assert len(df) == len(sample_ipca_data)
 
+def test_read_csv_missing_values(s3_handler):
+    """Testa que campos vazios do CSV são lidos como ausentes, como no pandas."""
+    key = 'test/missing.csv'
+    s3_handler.s3_client.put_object(
+        Bucket=s3_handler.bucket_name,
+        Key=key,
+        Body=b'data,valor,obs\n2023-01-01,,\n2023-02-01,1.5,x\n2023-03-01,NA,NA\n'
+    )
+    
+    df = s3_handler.read_csv(key)
+    assert df['obs'].isna().tolist() == [True, False, True]
+    assert df['valor'].isna().tolist() == [True, False, True]
+    assert df['obs'].dropna().tolist() == ['x']
+
+def test_write_csv_round_trip(s3_handler):
+    """Testa que o CSV gravado é o mesmo do df.to_csv e preserva tipos na releitura."""
+    df = pd.DataFrame({
+        'date': pd.date_range('2023-01-01', periods=3, freq='MS'),
+        'value': [3.0, 4.0, 5.5],
+        'whole': [1.0, 2.0, 3.0],
+        'flag': [True, False, True],
+        'name': ['a', 'b c', 'd']
+    })
+    key = 'test/round_trip.csv'
+    assert s3_handler.write_csv(df, key) is True
+    
+    body = s3_handler.s3_client.get_object(Bucket=s3_handler.bucket_name, Key=key)['Body'].read()
+    assert body == df.to_csv(index=False).encode('utf-8')
+    
+    result = s3_handler.read_csv(key)
+    assert result['value'].dtype == np.float64
+    assert result['whole'].dtype == np.float64
+    assert result['flag'].dtype == bool
+    assert result['value'].tolist() == [3.0, 4.0, 5.5]
+    assert result['whole'].tolist() == [1.0, 2.0, 3.0]
+    assert result['name'].tolist() == ['a', 'b c', 'd']
+    assert pd.to_datetime(result['date']).tolist() == df['date'].tolist()
+
 def test_list_files(s3_handler, sample_ipca_data, sample_selic_data):
     """Testa listagem de arquivos."""
     # Prepara: faz upload de múltiplos arquivos
@@ -123,6 +201,44 @@ def test_list_files(s3_handler, sample_ipca_data, sample_selic_data):
     selic_files = s3_handler.list_files(prefix='bronze/test/selic')
     assert len(selic_files) == 1
 
+def test_list_files_max_keys_and_prefixes(s3_handler, sample_ipca_data):
+    """Testa limite de listagem e listagem de prefixos."""
+    for name in ['ipca', 'selic', 'pib']:
+        s3_handler.write_parquet(sample_ipca_data, f'bronze/test/{name}/data.parquet')
+    
+    # Limite de arquivos
+    assert len(s3_handler.list_files(prefix='bronze/test', max_keys=2)) == 2
+    
+    # Listagem rasa
+    prefixes = s3_handler.list_prefixes(prefix='bronze/test/')
+    assert sorted(prefixes) == ['bronze/test/ipca/', 'bronze/test/pib/', 'bronze/test/selic/']
+
+def test_list_files_cache(s3_handler, sample_ipca_data):
+    """Testa o cache de listagem e sua invalidação após escritas."""
+    s3_handler.write_parquet(sample_ipca_data, 'bronze/test/ipca/data.parquet')
+    assert s3_handler.list_files(prefix='bronze/test') == ['bronze/test/ipca/data.parquet']
+    
+    # Escrita feita por fora do handler não aparece enquanto o cache é válido
+    s3_handler.s3_client.put_object(
+        Bucket=s3_handler.bucket_name, Key='bronze/test/selic/data.parquet', Body=b''
+    )
+    assert len(s3_handler.list_files(prefix='bronze/test')) == 1
+    
+    # Escrita pelo handler invalida o prefixo afetado
+    s3_handler.write_parquet(sample_ipca_data, 'bronze/test/pib/data.parquet')
+    assert len(s3_handler.list_files(prefix='bronze/test')) == 3
+
+def test_list_files_parent_listing(s3_handler, sample_ipca_data):
+    """Testa listagens de subprefixos respondidas pela listagem em cache do prefixo pai."""
+    for name in ('ipca', 'selic'):
+        s3_handler.write_parquet(sample_ipca_data, f'silver/test/{name}/data.parquet')
+    assert len(s3_handler.list_files(prefix='silver/test/')) == 2
+    
+    with patch.object(s3_handler, '_iter_keys') as mock_iter:
+        assert s3_handler.list_files(prefix='silver/test/ipca') == ['silver/test/ipca/data.parquet']
+        assert s3_handler.list_files(prefix='silver/test/', max_keys=1) == ['silver/test/ipca/data.parquet']
+        mock_iter.assert_not_called()
+
 def test_test_connection(s3_handler):
     """Testa método de teste de conexão."""
     result = s3_handler.test_connection()
@@ -130,7 +246,8 @@ def test_test_connection(s3_handler):
 
 def test_get_latest_file(s3_handler, sample_ipca_data):
     """Testa obtenção do arquivo mais recente."""
-    # Prepara: faz upload de múltiplos arquivos com delay
+    # Prepara: faz upload de múltiplos arquivos. get_latest_file escolhe pelo
+    # maior nome de chave, então não é preciso esperar por um novo timestamp
     s3_handler.upload_dataframe(
         df=sample_ipca_data,
         file_path='test/ipca_v1',
@@ -138,9 +255,6 @@ def test_get_latest_file(s3_handler, sample_ipca_data):
         format='parquet'
     )
     
-    import time
-    time.sleep(1)  # Aguarda para garantir timestamp diferente
-    
     s3_handler.upload_dataframe(
         df=sample_ipca_data,
         file_path='test/ipca_v2',
@@ -165,6 +279,113 @@ def test_read_write_parquet(s3_handler, sample_ipca_data):
     assert df is not None
     assert len(df) == len(sample_ipca_data)
 
+def test_upload_reuses_buffer(s3_handler, sample_ipca_data, sample_selic_data):
+    """Testa que uploads seguidos reaproveitam o buffer da thread sem fechá-lo."""
+    assert s3_handler.write_parquet(sample_ipca_data, 'test/first.parquet') is True
+    buffer = s3_handler._buf_pool.buf
+    assert s3_handler.write_parquet(sample_selic_data, 'test/second.parquet') is True
+    
+    assert s3_handler._buf_pool.buf is buffer
+    assert not buffer.closed
+    assert s3_handler.read_parquet('test/first.parquet')['ipca'].tolist() == sample_ipca_data['ipca'].tolist()
+    assert s3_handler.read_parquet('test/second.parquet')['selic'].tolist() == sample_selic_data['selic'].tolist()
+
+def test_read_parquet_cache(s3_handler, sample_ipca_data):
+    """Testa o cache de leitura Parquet por ETag."""
+    key = 'test/cached.parquet'
+    s3_handler.write_parquet(sample_ipca_data, key)
+    
+    _PARQUET_CACHE.clear()
+    first = s3_handler.read_parquet(key)
+    assert len(_PARQUET_CACHE) == 1
+    
+    # Mesmo ETag: reaproveita a tabela e devolve um DataFrame independente
+    first['ipca'] = 0.0
+    second = s3_handler.read_parquet(key)
+    assert len(_PARQUET_CACHE) == 1
+    
+    # O cache é do processo: outro handler reaproveita a mesma tabela
+    assert len(S3Handler().read_parquet(key)) == len(sample_ipca_data)
+    assert len(_PARQUET_CACHE) == 1
+    assert second['ipca'].tolist() == sample_ipca_data['ipca'].tolist()
+    
+    # Objeto reescrito (novo ETag): a leitura reflete o conteúdo atual
+    s3_handler.write_parquet(sample_ipca_data.head(3), key)
+    assert len(s3_handler.read_parquet(key)) == 3
+
+def test_parquet_reads_single_head(s3_handler, sample_ipca_data):
+    """Testa que o tamanho obtido no HEAD do cache é reaproveitado pelo leitor."""
+    key = 'test/head.parquet'
+    s3_handler.write_parquet(sample_ipca_data, key)
+    _PARQUET_CACHE.clear()
+    
+    client = s3_handler.s3_client
+    with patch.object(client, 'head_object', wraps=client.head_object) as mock_head:
+        assert s3_handler.download_file(key, columns=['ipca']) is not None
+        assert mock_head.call_count == 1
+        
+        # Arquivo inteiro e pequeno: um HEAD (ETag) e um único GET
+        mock_head.reset_mock()
+        with patch.object(client, 'download_fileobj') as mock_transfer:
+            assert len(s3_handler.download_file(key)) == len(sample_ipca_data)
+            mock_transfer.assert_not_called()
+        assert mock_head.call_count == 1
+        
+        # Leituras com filtro não passam pelo cache: o tamanho vem do GET do rodapé
+        mock_head.reset_mock()
+        df = s3_handler.read_parquet(key, filters=[('ipca', '>', 0)])
+        assert len(df) == (sample_ipca_data['ipca'] > 0).sum()
+        mock_head.assert_not_called()
+
+def test_parquet_reads_writable(s3_handler, sample_ipca_data):
+    """Testa que os DataFrames lidos do Parquet aceitam alterações no lugar."""
+    key = 'test/writable.parquet'
+    s3_handler.write_parquet(sample_ipca_data, key)
+    
+    frames = [
+        s3_handler.download_file(key),
+        s3_handler.download_file(key, columns=['ipca']),
+        s3_handler.read_parquet(key),
+        s3_handler.read_parquet(key, filters=[('ipca', '>', -1.0)])
+    ]
+    for df in frames:
+        df.loc[0, 'ipca'] = 9.0
+        assert df['ipca'].iloc[0] == 9.0
+    
+    # A tabela em cache não é afetada pelas alterações
+    assert s3_handler.read_parquet(key)['ipca'].tolist() == sample_ipca_data['ipca'].tolist()
+
+def test_read_parquet_columns(s3_handler, sample_ipca_data):
+    """Testa leitura parcial de colunas via read_parquet."""
+    key = 'test/direct_parquet.parquet'
+    s3_handler.write_parquet(sample_ipca_data, key)
+    
+    df = s3_handler.read_parquet(key, columns=['ipca'])
+    assert df is not None
+    assert list(df.columns) == ['ipca']
+    assert len(df) == len(sample_ipca_data)
+    
+    # Filtro aplicado na leitura
+    threshold = sample_ipca_data['ipca'].median()
+    df = s3_handler.read_parquet(key, filters=[('ipca', '>', threshold)])
+    assert df is not None
+    assert len(df) == (sample_ipca_data['ipca'] > threshold).sum()
+
+def test_validate_parquet_ranges(s3_handler, sample_ipca_data):
+    """Testa validação de intervalos usando as estatísticas do Parquet."""
+    key = 'test/ranges.parquet'
+    s3_handler.write_parquet(sample_ipca_data, key, parquet_opts={'row_group_size': 3})
+    
+    lo, hi = sample_ipca_data['ipca'].quantile([0.25, 0.75])
+    is_valid, out_of_range = s3_handler.validate_parquet_ranges(key, {'ipca': (lo, hi)})
+    expected = int(((sample_ipca_data['ipca'] < lo) | (sample_ipca_data['ipca'] > hi)).sum())
+    assert is_valid is False
+    assert out_of_range == {'ipca': expected}
+    
+    is_valid, out_of_range = s3_handler.validate_parquet_ranges(key, {'ipca': (-1e9, 1e9)})
+    assert is_valid is True
+    assert out_of_range == {}
+
 def test_move_file(s3_handler, sample_ipca_data):
     """Testa movimentação de arquivos."""
     # Prepara: faz upload
@@ -196,4 +417,21 @@ def test_move_file(s3_handler, sample_ipca_data):
     # Verifica conteúdo
     df = s3_handler.download_file(dest_path)
     assert df is not None
-    assert len(df) == len(sample_ipca_data)
\ No newline at end of file
+    assert len(df) == len(sample_ipca_data)
+
+def test_move_many(s3_handler, sample_ipca_data):
+    """Testa movimentação de múltiplos arquivos."""
+    # Prepara: grava arquivos de origem
+    sources = [f'test/batch/source_{i}.parquet' for i in range(3)]
+    for key in sources:
+        s3_handler.write_parquet(sample_ipca_data, key)
+    
+    pairs = [(key, key.replace('source', 'destination')) for key in sources]
+    
+    # Move arquivos
+    success = s3_handler.move_many(pairs)
+    assert success is True
+    
+    # Verifica origem e destino
+    assert s3_handler.list_files(prefix='test/batch/source') == []
+    assert len(s3_handler.list_files(prefix='test/batch/destination')) == 3
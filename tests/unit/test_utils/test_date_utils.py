@@ -0,0 +1,19 @@
+"""Testes unitários para os utilitários de datas."""
+
+import pandas as pd
+
+from src.utils.helpers.date_utils import create_time_windows
+
+def test_create_time_windows_inverted_window(monthly_dates):
+    """Testa que uma janela invertida (início > fim) não afeta as janelas válidas."""
+    df = pd.DataFrame({'date': monthly_dates})
+    windows = [
+        ('2023-03-01', '2023-04-01', 'w0'),
+        ('2023-07-01', '2023-10-01', 'w1'),
+        ('2023-05-01', '2023-01-01', 'w2')
+    ]
+    
+    result = create_time_windows(df, windows=windows)
+    
+    expected = ['other'] * 2 + ['w0'] * 2 + ['other'] * 2 + ['w1'] * 4 + ['other'] * 2
+    assert result['time_window'].astype(str).tolist() == expected
@@ -8,7 +8,8 @@ from unittest.mock import patch, MagicMock
 from src.utils.error_handling import (
     ProcessingError, 
     ErrorCodes, 
-    error_handler
+    error_handler,
+    MAX_RETRY_DELAY
 )
 
 def test_processing_error_init():
@@ -82,13 +83,48 @@ def test_error_handler_retry():
     def retrying_function():
         return mock_function()
     
-    # Executa a função
-    result = retrying_function()
+    # Executa a função (sem esperar de fato entre as tentativas)
+    with patch('src.utils.error_handling.time.sleep') as mock_sleep:
+        result = retrying_function()
+    assert mock_sleep.call_count == 2
     
     # Verifica o resultado
     assert result == "Sucesso na terceira tentativa"
     assert mock_function.call_count == 3
 
+def test_error_handler_non_retryable():
+    """Testa que erros não recuperáveis são propagados sem novas tentativas."""
+    logger = logging.getLogger("test_logger")
+    
+    mock_function = MagicMock()
+    mock_function.side_effect = ProcessingError("Dados inválidos", code=ErrorCodes.VALIDATION_ERROR)
+    
+    @error_handler(logger=logger, retries=3, retry_delay=0.1)
+    def validating_function():
+        return mock_function()
+    
+    with pytest.raises(ProcessingError):
+        validating_function()
+    
+    assert mock_function.call_count == 1
+
+def test_error_handler_retry_delay_capped():
+    """Testa que a espera com jitter nunca passa de MAX_RETRY_DELAY."""
+    logger = logging.getLogger("test_logger")
+    
+    mock_function = MagicMock()
+    mock_function.side_effect = [ValueError("Falha"), ValueError("Falha"), "Sucesso"]
+    
+    @error_handler(logger=logger, retries=2, retry_delay=MAX_RETRY_DELAY)
+    def slow_retrying_function():
+        return mock_function()
+    
+    with patch('src.utils.error_handling.random.uniform', return_value=1.5), \
+            patch('src.utils.error_handling.time.sleep') as mock_sleep:
+        assert slow_retrying_function() == "Sucesso"
+    
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [MAX_RETRY_DELAY, MAX_RETRY_DELAY]
+
 def test_error_handler_retry_exceeded():
     """Testa quando o número máximo de retentativas é excedido."""
     # Cria um logger de teste
@@ -104,7 +140,7 @@ def test_error_handler_retry_exceeded():
         return mock_function()
     
     # Verifica se a exceção é propagada após todas as tentativas
-    with pytest.raises(ProcessingError):
+    with patch('src.utils.error_handling.time.sleep'), pytest.raises(ProcessingError):
         always_failing_function()
     
     # Verifica se o número correto de tentativas foi feito
@@ -162,4 +198,19 @@ def test_error_handler_custom_exceptions():
         function_with_specific_exceptions("type")
     
     # Verifica caso de sucesso
-    assert function_with_specific_exceptions("none") == "Sucesso"
\ No newline at end of file
+    assert function_with_specific_exceptions("none") == "Sucesso"
+
+def test_error_handler_aws_error_code():
+    """Testa que erros do botocore recebem o código de acesso ao S3."""
+    from botocore.exceptions import ClientError
+    
+    logger = logging.getLogger("test_logger")
+    
+    @error_handler(logger=logger)
+    def function_with_client_error():
+        raise ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}, 'GetObject')
+    
+    with pytest.raises(ProcessingError) as excinfo:
+        function_with_client_error()
+    
+    assert excinfo.value.code == ErrorCodes.S3_ACCESS_ERROR
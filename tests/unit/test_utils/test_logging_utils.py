@@ -0,0 +1,30 @@
+"""Testes unitários para os utilitários de logging."""
+
+import logging
+from unittest.mock import patch
+
+from src.utils.helpers import logging_utils
+from src.utils.helpers.logging_utils import setup_logging
+
+def test_setup_logging_reconfigure(tmp_path):
+    """Testa que reconfigurar o logger fecha os handlers antigos e registra o atexit uma vez."""
+    log_file = tmp_path / 'logs' / 'app.log'
+    
+    with patch.object(logging_utils.atexit, 'register') as mock_register, \
+            patch.object(logging_utils, '_atexit_registered', False):
+        logger = setup_logging(log_file=str(log_file), log_to_console=False, app_name='test-reconfigure')
+        buffered = logger.handlers[0]
+        file_handler = buffered.target
+        logger.info("primeira configuração")
+        
+        setup_logging(log_file=str(log_file), log_to_console=False, app_name='test-reconfigure')
+        
+        assert mock_register.call_count == 1
+    
+    # O buffer antigo foi descarregado e o arquivo fechado
+    assert file_handler.stream is None
+    assert "primeira configuração" in log_file.read_text()
+    assert len(logger.handlers) == 1 and logger.handlers[0] is not buffered
+    
+    setup_logging(log_to_console=False, app_name='test-reconfigure')
+    assert logger.handlers == []
@@ -0,0 +1,126 @@
+"""Testes unitários para os cálculos de séries em math_utils."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.helpers import math_utils
+from src.utils.helpers.math_utils import (
+    aggregate_monthly,
+    calculate_variations,
+    calculate_moving_average,
+    calculate_cumulative_values,
+    calculate_year_to_date,
+    calculate_volatility,
+    calculate_financial_metrics
+)
+
+def _nullable_series_df(dtype: str) -> pd.DataFrame:
+    """DataFrame mensal com coluna de valor em tipo anulável e um valor ausente."""
+    return pd.DataFrame({
+        'date': pd.date_range(start='2023-01-01', periods=5, freq='MS'),
+        'value': pd.array([10, 11, None, 12, 15], dtype=dtype)
+    })
+
+def test_calculate_variations_nullable():
+    """Testa variações sobre colunas Int64/Float64 com pd.NA."""
+    for dtype in ('Int64', 'Float64'):
+        result = calculate_variations(_nullable_series_df(dtype))
+        
+        assert 'monthly_change_pct' in result.columns
+        assert 'year_over_year_pct' in result.columns
+        assert np.isclose(result['monthly_change_pct'].iloc[1], 10.0)
+        assert np.isclose(result['monthly_change_pct'].iloc[4], 25.0)
+        assert result['monthly_change_pct'].iloc[[0, 2, 3]].isna().all()
+
+def test_calculate_moving_average_nullable():
+    """Testa média móvel sobre coluna Int64 com pd.NA."""
+    result = calculate_moving_average(_nullable_series_df('Int64'), window=2)
+    
+    assert 'moving_avg_2' in result.columns
+    assert result['moving_avg_2'].iloc[[0, 2, 3]].isna().all()
+    assert np.isclose(result['moving_avg_2'].iloc[1], 10.5)
+    assert np.isclose(result['moving_avg_2'].iloc[4], 13.5)
+
+def test_calculate_volatility_nullable():
+    """Testa volatilidade móvel sobre coluna Float64 com pd.NA."""
+    result = calculate_volatility(_nullable_series_df('Float64'), window=2, dtype=np.float32)
+    
+    assert 'volatility' in result.columns
+    assert result['volatility'].dtype == np.float32
+    assert np.isclose(result['volatility'].iloc[4], np.std([12, 15], ddof=1))
+
+def test_calculate_financial_metrics_nullable():
+    """Testa métricas financeiras sobre preços Int64 com pd.NA."""
+    df = pd.DataFrame({
+        'date': pd.date_range(start='2023-01-01', periods=60, freq='D'),
+        'close': pd.array([100 + i for i in range(59)] + [None], dtype='Int64'),
+        'high': pd.array([110] * 60, dtype='Int64'),
+        'low': pd.array([90] * 59 + [None], dtype='Int64')
+    })
+    result = calculate_financial_metrics(df)
+    
+    for col in ('return_pct', 'volatility_20', 'amplitude_pct', 'ma_20', 'ma_50', 'ma_cross_signal'):
+        assert col in result.columns
+    assert np.isclose(result['return_pct'].iloc[1], 1.0)
+    assert pd.isna(result['amplitude_pct'].iloc[-1])
+
+def test_calculate_year_to_date_first_row():
+    """Testa que o YTD usa a primeira linha de cada ano como base, mesmo se nula."""
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2022-01-01', '2022-02-01', '2023-01-01', '2023-02-01', '2023-03-01']),
+        'value': [np.nan, 5.0, 10.0, 11.0, 12.0]
+    })
+    result = calculate_year_to_date(df)
+    
+    # Ano com a primeira linha nula fica todo nulo
+    assert result['year_to_date_pct'].iloc[:2].isna().all()
+    assert np.allclose(result['year_to_date_pct'].iloc[2:], [0.0, 10.0, 20.0])
+
+def test_calculate_financial_metrics_gaps():
+    """Testa que lacunas de preço seguem o pct_change(): último preço repetido."""
+    df = pd.DataFrame({'close': [10.0, 11.0, np.nan, 12.0, 15.0]})
+    result = calculate_financial_metrics(df)
+    
+    expected = (df['close'].ffill().pct_change() * 100).to_numpy()
+    assert np.allclose(result['return_pct'], expected, equal_nan=True)
+    assert np.allclose(result['return_pct'].iloc[1:], [10.0, 0.0, 100 / 11, 25.0])
+
+def _grouped_series_df(n: int = 200, seed: int = 0) -> pd.DataFrame:
+    """Série com valores e grupos (anos) ausentes, em ordem embaralhada."""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(100.0, 10.0, n)
+    values[rng.random(n) < 0.15] = np.nan
+    years = rng.integers(2019, 2024, n).astype(float)
+    years[rng.random(n) < 0.1] = np.nan
+    return pd.DataFrame({
+        'date': pd.Timestamp('2019-01-01') + pd.to_timedelta(rng.integers(0, 5 * 365, n), unit='D'),
+        'value': values,
+        'year': years
+    })
+
+def _with_and_without_numba(monkeypatch, func, *args, **kwargs):
+    """Executa func pelos kernels numba (NUMBA_MIN_ROWS=1) e pelo caminho NumPy/pandas."""
+    monkeypatch.setattr(math_utils, 'NUMBA_MIN_ROWS', 1)
+    with_numba = func(*args, **kwargs)
+    monkeypatch.setattr(math_utils, 'NUMBA_AVAILABLE', False)
+    without_numba = func(*args, **kwargs)
+    return with_numba, without_numba
+
+def test_numba_kernels_match_fallback(monkeypatch):
+    """Testa que os kernels numba coincidem com o caminho sem numba (NaN em valores, grupos e datas)."""
+    pytest.importorskip('numba')
+    df = _grouped_series_df()
+    
+    fast, slow = _with_and_without_numba(monkeypatch, calculate_cumulative_values, df, group_col='year')
+    assert np.allclose(fast['cumulative_value'], slow['cumulative_value'], equal_nan=True)
+    
+    monkeypatch.undo()
+    fast, slow = _with_and_without_numba(monkeypatch, calculate_year_to_date, df)
+    assert np.allclose(fast['year_to_date_pct'], slow['year_to_date_pct'], equal_nan=True)
+    
+    # Agregação mensal (_group_mean_last), também com datas ausentes
+    monkeypatch.undo()
+    df.loc[df.index[::17], 'date'] = pd.NaT
+    fast, slow = _with_and_without_numba(monkeypatch, aggregate_monthly, df)
+    pd.testing.assert_frame_equal(fast, slow)